@@ -1,29 +1,44 @@
+import os
 import dash
+from pathlib import Path
+from src.data.cache import PreparedCache
 from src.data.loader import DataLoader
-from src.data.processor import DataProcessor
+from src.data.store import DataStore
 from src.dashboard.layout import create_layout
 from src.dashboard.callbacks import register_callbacks
+from src.dashboard.export import register_export_routes
+from src.dashboard.api import register_api_routes
+from src.dashboard.profiling import PROFILER, register_profiling_routes
+from src.dashboard.serialization import compression_enabled, configure_json_engine
 
-# Inicializar datos
-data_loader = DataLoader()
-df = data_loader.load_csv("airbnb_data.csv")
+# Inicializar datos (con gunicorn --preload se ejecuta una sola vez, antes del fork)
+data_store = DataStore(os.environ.get("DATA_FILE", "airbnb_data.csv"),
+                       loader=DataLoader(Path(os.environ.get("DATA_DIR", "data"))),
+                       poll_interval=float(os.environ.get("DATA_POLL_INTERVAL", 30)),
+                       cache=PreparedCache(Path(os.environ.get("DATA_DIR", "data")) / ".cache"))
 
-if df.empty:
+if not data_store.load():
     print("Error: No se pudieron cargar los datos. Verificar la ubicación del archivo CSV.")
     exit(1)
 
-df = DataProcessor.calculate_reviews_per_year(df)
-
-# Configurar Dash
-app = dash.Dash(__name__)
+# Configurar Dash: orjson para serializar las figuras y respuestas comprimidas
+configure_json_engine()
+app = dash.Dash(__name__, compress=compression_enabled())
 server = app.server
 
-# Crear layout
-app.layout = create_layout(df)
+# Crear layout (se arma en cada carga de página con el dataset vigente)
+app.layout = lambda: create_layout(data_store.df, data_store.version)
 
 # Registrar callbacks
-register_callbacks(app, df)
+register_callbacks(app, data_store)
+
+# Descarga de datos filtrados (streaming, sin materializar el resultado)
+register_export_routes(server, data_store)
+register_api_routes(server, data_store)
+register_profiling_routes(server, PROFILER)
 
 if __name__ == "__main__":
-    # app.run_server(debug=True)
-    app.run_server(host='0.0.0.0', port=8050, debug=True)
+    # Servidor de desarrollo; en producción usar gunicorn (ver gunicorn.conf.py)
+    data_store.start_watcher()
+    app.run(host='0.0.0.0', port=int(os.environ.get("PORT", 8050)),
+            debug=os.environ.get("DASH_DEBUG", "1") == "1")
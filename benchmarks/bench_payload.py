@@ -0,0 +1,79 @@
+"""Mide el tamaño y el tiempo de serialización de las respuestas de los callbacks.
+
+Para update_charts, update_stats y update_map serializa la salida como lo
+hace Dash (plotly.io.json.to_json_plotly) con cada motor JSON y reporta los
+bytes sin comprimir, con gzip y con brotli (si está instalado).
+
+Uso:
+    python benchmarks/bench_payload.py [--rows 1000 100000] [--engines json orjson] [--repeat 5]
+
+Los gráficos se miden como los guarda la cache de update_charts
+(diccionarios); --figures los mide como objetos go.Figure.
+"""
+import argparse
+import gzip
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from benchmarks.run import best_of  # noqa: E402
+
+
+def callback_outputs(rows, as_figures):
+    from src.data.processor import DataProcessor
+    from src.data.store import DataSnapshot
+    from src.data.synthetic import synthetic_listings
+    from src.dashboard.callbacks import build_charts, build_map, build_stats
+    from src.dashboard.serialization import figure_dicts
+
+    snapshot = DataSnapshot(DataProcessor.prepare(synthetic_listings(rows)), "bench")
+    df, indexes = snapshot.df, snapshot.column_indexes
+    charts = build_charts(df, None, None, None, "plotly_white", indexes=indexes, rollups=snapshot.rollups)
+    return {
+        "update_charts": list(charts) if as_figures else list(figure_dicts(charts)),
+        "update_stats": list(build_stats(df, None, None, None, indexes=indexes)),
+        "update_map": build_map(df, snapshot.spatial_index, None, None, None, "plotly_white",
+                                indexes=indexes),
+    }
+
+
+def compressed_sizes(body: bytes) -> dict:
+    # Nivel 6: el que usa flask-compress por defecto
+    sizes = {"gzip": len(gzip.compress(body, compresslevel=6))}
+    try:
+        import brotli
+    except ImportError:
+        return sizes
+    sizes["br"] = len(brotli.compress(body, quality=4))
+    return sizes
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[1_000, 100_000])
+    parser.add_argument("--engines", nargs="+", choices=["json", "orjson"], default=["json", "orjson"])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--figures", action="store_true",
+                        help="mide los gráficos como go.Figure en lugar de diccionarios")
+    args = parser.parse_args()
+
+    import plotly.io as pio
+    from plotly.io.json import to_json_plotly
+
+    print(f"{'filas':>9} {'callback':<14} {'motor':<7} {'ms':>8} {'bytes':>11} {'gzip':>10} {'br':>10}")
+    for rows in args.rows:
+        outputs = callback_outputs(rows, args.figures)
+        for engine in args.engines:
+            pio.json.config.default_engine = engine
+            for name, value in outputs.items():
+                body = to_json_plotly(value).encode("utf-8")
+                seconds = best_of(lambda: to_json_plotly(value), args.repeat)
+                sizes = compressed_sizes(body)
+                print(f"{rows:>9,} {name:<14} {engine:<7} {seconds * 1000:>8.2f} {len(body):>11,} "
+                      f"{sizes['gzip']:>10,} {sizes.get('br', '-'):>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""Mide el tiempo de arranque del dashboard (import de app.py).
+
+Compara el arranque en frío (sin cache de datos preparados) con el arranque
+usando la cache, que es lo que ve cada worker nuevo al escalar.
+
+Uso:
+    python benchmarks/bench_startup.py [--repeat 5] [--data-dir DIR | --rows N [--snapshots K]]
+
+Con --data-dir se mide con otro directorio de datos (debe contener
+airbnb_data.csv); con --rows se genera un dataset sintético de ese tamaño
+en un directorio temporal.
+"""
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+
+def time_import(data_dir):
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-c", "import app"], cwd=ROOT, check=True,
+                   stdout=subprocess.DEVNULL, env={**os.environ, "DATA_DIR": str(data_dir)})
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--data-dir", type=Path, default=ROOT / "data")
+    parser.add_argument("--rows", type=int, help="genera un dataset sintético de N filas")
+    parser.add_argument("--snapshots", type=int, default=1)
+    args = parser.parse_args()
+    if args.rows:
+        from src.data.synthetic import generate_listings, write_csv
+        args.data_dir = Path(tempfile.mkdtemp(prefix="airbnb-bench-"))
+        write_csv(generate_listings(args.rows, snapshots=args.snapshots), args.data_dir / "airbnb_data.csv")
+    data_dir = args.data_dir.resolve()
+
+    cold = []
+    for _ in range(args.repeat):
+        shutil.rmtree(data_dir / ".cache", ignore_errors=True)
+        cold.append(time_import(data_dir))
+    warm = [time_import(data_dir) for _ in range(args.repeat)]
+
+    print(f"{'arranque':>10} {'mejor (s)':>10} {'mediana (s)':>12}")
+    for name, timings in [("frío", cold), ("con cache", warm)]:
+        timings.sort()
+        print(f"{name:>10} {timings[0]:>10.3f} {timings[len(timings) // 2]:>12.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""Compara el kernel de estadísticas con la implementación pandas original.
+
+Uso:
+    python benchmarks/bench_stats.py [--sizes 1000 100000 10000000] [--repeat 5]
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.data.processor import DataProcessor
+
+
+def make_dataset(rows, seed=0):
+    """Genera un DataFrame sintético con las columnas de las tarjetas"""
+    rng = np.random.default_rng(seed)
+    years = rng.integers(0, 13, rows)
+    reviews = rng.poisson(40, rows)
+    return pd.DataFrame({
+        "price_original": rng.gamma(9, 2.3, rows).round().astype(np.int64),
+        "rating": rng.uniform(4.0, 5.0, rows).round(2),
+        "years_hosting": years,
+        "reviews": reviews,
+        "reviews_per_year": reviews / np.where(years == 0, 1, years),
+    })
+
+
+def pandas_stats(df):
+    """Métricas calculadas como lo hacía update_stats originalmente"""
+    return {
+        "price_mean": df["price_original"].mean(),
+        "price_median": df["price_original"].median(),
+        "price_mode": df["price_original"].mode().iloc[0],
+        "price_min": df["price_original"].min(),
+        "price_max": df["price_original"].max(),
+        "rating_mean": df["rating"].mean(),
+        "reviews_per_year_mean": df["reviews_per_year"].mean(),
+        "count": len(df),
+        "years_hosting_mean": df["years_hosting"].mean(),
+        "occupancy_input": df["reviews_per_year"].mean(),
+        "income_input": df["price_original"].mean() * 30,
+    }
+
+
+def best_of(func, df, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(df)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 100_000, 10_000_000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'filas':>12} {'pandas (ms)':>12} {'kernel (ms)':>12} {'speedup':>8}")
+    for rows in args.sizes:
+        df = make_dataset(rows)
+        legacy = best_of(pandas_stats, df, args.repeat)
+        kernel = best_of(DataProcessor.calculate_stats, df, args.repeat)
+        print(f"{rows:>12,} {legacy * 1000:>12.2f} {kernel * 1000:>12.2f} {legacy / kernel:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
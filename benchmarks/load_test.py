@@ -0,0 +1,143 @@
+"""Prueba de carga del dashboard servido con gunicorn.
+
+Levanta gunicorn con distinta cantidad de workers, dispara el callback de
+estadísticas en paralelo durante unos segundos y reporta el throughput y la
+memoria (PSS, Linux) de los workers, para ver que escala con los workers sin
+multiplicar la memoria del dataset.
+
+Uso:
+    python benchmarks/load_test.py [--workers 1 2 4] [--seconds 10] [--concurrency 16]
+                                   [--rows N [--snapshots K]]
+
+Con --rows se sirve un dataset sintético de N filas en lugar de data/.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+STATS_OUTPUTS = [
+    "precio-promedio", "precio-mediana", "precio-moda", "precio-minimo",
+    "precio-maximo", "rating-promedio", "reviews-por-año", "total-listados",
+    "años-promedio", "ocupacion-estimada", "ingreso-mensual",
+]
+
+
+def stats_payload():
+    """Cuerpo del request que envía Dash al cambiar los filtros"""
+    outputs = [{"id": output, "property": "children"} for output in STATS_OUTPUTS]
+    return json.dumps({
+        "output": ".." + "...".join(f"{o['id']}.children" for o in outputs) + "..",
+        "outputs": outputs,
+        "inputs": [
+            {"id": "bathroom-filter", "property": "value", "value": None},
+            {"id": "bedroom-filter", "property": "value", "value": None},
+            {"id": "beds-filter", "property": "value", "value": None},
+            {"id": "price-range-filter", "property": "value", "value": None},
+            {"id": "rating-range-filter", "property": "value", "value": None},
+            {"id": "reviews-range-filter", "property": "value", "value": None},
+            {"id": "years-range-filter", "property": "value", "value": None},
+            {"id": "data-version", "property": "data", "value": None},
+        ],
+        # Extremos de los sliders (RANGE_BOUNDS); sin valor, los rangos se aplican tal cual
+        "state": [
+            {"id": f"{name}-range-filter", "property": prop, "value": None}
+            for name in ("price", "rating", "reviews", "years") for prop in ("min", "max")
+        ],
+        "changedPropIds": ["bathroom-filter.value"],
+    }).encode()
+
+
+def wait_until_ready(url, timeout=60):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            urllib.request.urlopen(url, timeout=1)
+            return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError(f"El servidor no respondió en {timeout}s")
+
+
+def worker_pss_mb(master_pid):
+    """Suma de PSS de los workers hijos del master (MB)"""
+    children = Path(f"/proc/{master_pid}/task/{master_pid}/children")
+    if not children.exists():
+        return float("nan")
+    total_kb = 0
+    for pid in children.read_text().split():
+        rollup = Path(f"/proc/{pid}/smaps_rollup")
+        if rollup.exists():
+            for line in rollup.read_text().splitlines():
+                if line.startswith("Pss:"):
+                    total_kb += int(line.split()[1])
+    return total_kb / 1024
+
+
+def run(workers, seconds, concurrency, port, data_dir=None):
+    env = {**os.environ, "WEB_CONCURRENCY": str(workers), "PORT": str(port)}
+    if data_dir:
+        env["DATA_DIR"] = str(data_dir)
+    process = subprocess.Popen(
+        [sys.executable, "-m", "gunicorn", "-c", "gunicorn.conf.py",
+         "--access-logfile", "/dev/null", "app:server"],
+        cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    try:
+        wait_until_ready(base_url + "/")
+        body = stats_payload()
+        deadline = time.time() + seconds
+
+        def hammer(_):
+            done = 0
+            while time.time() < deadline:
+                request = urllib.request.Request(
+                    base_url + "/_dash-update-component", data=body,
+                    headers={"Content-Type": "application/json"},
+                )
+                urllib.request.urlopen(request).read()
+                done += 1
+            return done
+
+        with ThreadPoolExecutor(concurrency) as pool:
+            total = sum(pool.map(hammer, range(concurrency)))
+        return total / seconds, worker_pss_mb(process.pid)
+    finally:
+        process.terminate()
+        process.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--seconds", type=float, default=10)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--rows", type=int, help="sirve un dataset sintético de N filas")
+    parser.add_argument("--snapshots", type=int, default=1)
+    args = parser.parse_args()
+
+    data_dir = None
+    if args.rows:
+        from src.data.synthetic import generate_listings, write_csv
+        data_dir = Path(tempfile.mkdtemp(prefix="airbnb-load-"))
+        write_csv(generate_listings(args.rows, snapshots=args.snapshots), data_dir / "airbnb_data.csv")
+
+    print(f"{'workers':>8} {'req/s':>10} {'PSS workers (MB)':>18}")
+    for workers in args.workers:
+        throughput, pss = run(workers, args.seconds, args.concurrency, args.port, data_dir)
+        print(f"{workers:>8} {throughput:>10.1f} {pss:>18.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+"""Suite de benchmarks del scraper y del dashboard con baselines.
+
+Mide los extractores de main.py sobre las páginas guardadas en
+debug_sections/ y los callbacks del dashboard (build_charts / build_stats,
+lo que ejecutan update_charts / update_stats sin la cache) sobre datasets
+sintéticos. Compara cada tiempo con benchmarks/baselines.json y termina con
+código 1 si alguno empeora más que la tolerancia.
+
+Uso:
+    python benchmarks/run.py [--suite extractors dashboard] [--sizes 1000 100000 1000000]
+                             [--repeat 3] [--tolerance 1.0] [--update-baseline]
+
+Los baselines dependen de la máquina: regenerarlos con --update-baseline al
+cambiar de entorno.
+"""
+import argparse
+import gc
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+BASELINES = Path(__file__).resolve().parent / "baselines.json"
+FIXTURES = ROOT / "debug_sections"
+
+
+def best_of(func, repeat, min_time=0.25):
+    """Mejor tiempo (segundos) de al menos `repeat` ejecuciones.
+
+    Los casos rápidos se repiten hasta acumular `min_time` segundos, para que
+    el mínimo no dependa de una sola ejecución ruidosa.
+    """
+    timings = []
+    # Como timeit: sin pausas del GC dentro de la medición
+    gc.collect()
+    gc.disable()
+    try:
+        while len(timings) < repeat or sum(timings) < min_time:
+            start = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - start)
+    finally:
+        gc.enable()
+    return min(timings)
+
+
+def calibrate(repeat=5):
+    """Tiempo de una carga fija (Python + numpy) para normalizar por velocidad de la máquina"""
+    values = np.random.default_rng(0).random(1_000_000)
+
+    def workload():
+        np.sort(values)
+        sum(i * i for i in range(200_000))
+    return best_of(workload, repeat)
+
+
+def extractor_benchmarks(repeat):
+    from bs4 import BeautifulSoup
+    import main
+
+    html = (FIXTURES / "full_page.html").read_text(encoding="utf-8")
+    soup = BeautifulSoup(html, "html.parser")
+    results = {"extractors/parse_page": best_of(lambda: BeautifulSoup(html, "html.parser"), repeat)}
+    cases = {
+        "extract_rating_info": lambda: main.extract_rating_info(soup),
+        "extract_capacity_info": lambda: main.extract_capacity_info(soup),
+        "extract_years_as_host": lambda: main.extract_years_as_host(soup),
+        "extract_price_info": lambda: main.extract_price_info(soup, None),
+        "extract_location_info": lambda: main.extract_location_info(soup),
+        "parse_listings": lambda: main.parse_listings(soup),
+        "find_next_button": lambda: main.find_next_button(soup),
+    }
+    for name, func in cases.items():
+        results[f"extractors/{name}"] = best_of(func, repeat)
+    with tempfile.TemporaryDirectory() as debug_dir:
+        results["extractors/save_debug_sections"] = best_of(
+            lambda: main.save_debug_sections(soup, debug_dir), repeat
+        )
+    return results
+
+
+def dashboard_benchmarks(sizes, repeat):
+    from src.data.processor import DataProcessor
+    from src.data.store import DataSnapshot
+    from src.data.synthetic import synthetic_listings
+    from src.dashboard.callbacks import build_charts, build_stats
+
+    results = {}
+    for rows in sizes:
+        snapshot = DataSnapshot(DataProcessor.prepare(synthetic_listings(rows)), "bench")
+        df, indexes, rollups = snapshot.df, snapshot.column_indexes, snapshot.rollups
+        ranges = {"price_original": (15, 30)}
+        # Primera llamada fuera de la medición (imports diferidos de plotly)
+        build_charts(df, None, None, None, "plotly_white", indexes=indexes, rollups=rollups)
+        cases = {
+            "build_charts": lambda: build_charts(df, None, None, None, "plotly_white",
+                                                 indexes=indexes, rollups=rollups),
+            "build_charts_filtered": lambda: build_charts(df, (1.0,), None, None, "plotly_white",
+                                                          ranges=ranges, indexes=indexes,
+                                                          rollups=rollups),
+            "build_stats": lambda: build_stats(df, None, None, None, indexes=indexes),
+            "build_stats_filtered": lambda: build_stats(df, (1.0,), None, None, ranges=ranges,
+                                                        indexes=indexes),
+        }
+        for name, func in cases.items():
+            results[f"dashboard/{name}/{rows}"] = best_of(func, repeat)
+    return results
+
+
+def compare(results, baselines, tolerance, min_delta, speed=1.0):
+    """Imprime la tabla contra los baselines y devuelve los nombres que empeoraron.
+
+    Los baselines se escalan por `speed` (calibración actual / guardada). Un
+    caso empeora si supera la tolerancia relativa y además `min_delta` segundos.
+    """
+    regressions = []
+    print(f"{'benchmark':<48} {'ms':>10} {'baseline':>10} {'ratio':>7}")
+    for name, seconds in results.items():
+        baseline = baselines.get(name)
+        if baseline is None:
+            print(f"{name:<48} {seconds * 1000:>10.2f} {'-':>10} {'-':>7}")
+            continue
+        baseline *= speed
+        ratio = seconds / baseline
+        flag = ""
+        if ratio > 1 + tolerance and seconds - baseline > min_delta:
+            regressions.append(name)
+            flag = "  REGRESIÓN"
+        print(f"{name:<48} {seconds * 1000:>10.2f} {baseline * 1000:>10.2f} {ratio:>6.2f}x{flag}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--suite", nargs="+", choices=["extractors", "dashboard"],
+                        default=["extractors", "dashboard"])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 100_000, 1_000_000])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--tolerance", type=float, default=1.0,
+                        help="empeoramiento relativo permitido (1.0 = el doble de lento)")
+    parser.add_argument("--min-delta", type=float, default=0.002,
+                        help="diferencia mínima en segundos para considerar una regresión")
+    parser.add_argument("--baselines", type=Path, default=BASELINES)
+    parser.add_argument("--update-baseline", action="store_true",
+                        help="guarda los tiempos medidos como nuevos baselines")
+    args = parser.parse_args()
+
+    calibration = calibrate()
+    results = {}
+    if "extractors" in args.suite:
+        results.update(extractor_benchmarks(args.repeat))
+    if "dashboard" in args.suite:
+        results.update(dashboard_benchmarks(args.sizes, args.repeat))
+
+    baselines = json.loads(args.baselines.read_text()) if args.baselines.exists() else {}
+    speed = calibration / baselines["_calibration"] if "_calibration" in baselines else 1.0
+    print(f"Calibración: {calibration * 1000:.1f} ms (factor {speed:.2f} respecto del baseline)\n")
+    regressions = compare(results, baselines, args.tolerance, args.min_delta, speed)
+
+    if args.update_baseline:
+        # Los tiempos se guardan en la escala de la calibración ya guardada
+        baselines.setdefault("_calibration", round(calibration, 6))
+        scale = baselines["_calibration"] / calibration
+        baselines.update({name: round(seconds * scale, 6) for name, seconds in results.items()})
+        args.baselines.write_text(json.dumps(baselines, indent=2, sort_keys=True) + "\n")
+        print(f"\nBaselines guardados en {args.baselines}")
+    elif regressions:
+        print(f"\n{len(regressions)} benchmark(s) superan la tolerancia de {args.tolerance:.0%}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+"""Configuración de gunicorn para producción.
+
+Uso:
+    gunicorn -c gunicorn.conf.py app:server
+
+`preload_app` carga y prepara el dataset una sola vez en el proceso master;
+los workers lo heredan por fork y comparten sus páginas (copy-on-write) en
+lugar de tener cada uno su propia copia.
+"""
+import gc
+import multiprocessing
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '8050')}"
+workers = int(os.environ.get("WEB_CONCURRENCY", multiprocessing.cpu_count() * 2 + 1))
+threads = int(os.environ.get("GUNICORN_THREADS", 1))
+preload_app = True
+timeout = 120
+accesslog = "-"
+
+
+def when_ready(server):
+    # Mover los objetos ya cargados a la generación permanente del GC: así las
+    # recolecciones de los workers no escriben en sus cabeceras y las páginas
+    # compartidas no se copian.
+    gc.freeze()
+    server.log.info("Datos precargados; %s objetos congelados", gc.get_freeze_count())
+
+
+def post_fork(server, worker):
+    # Los hilos no sobreviven al fork: cada worker vigila el CSV por su cuenta
+    # y recarga los datos en segundo plano cuando cambian.
+    import app
+
+    app.data_store.start_watcher()
@@ -3,13 +3,47 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
 from webdriver_manager.chrome import ChromeDriverManager
 from bs4 import BeautifulSoup
 import time
 import json
 import os
 import re
+import argparse
 import csv
+import logging
+import socket
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+from pathlib import Path
+from src.crawl.jobs import load_jobs
+from src.crawl.price_calendar import PriceMatrix, stay_windows, with_stay_dates
+from src.crawl.scheduler import FairScheduler
+from src.crawl.work_queue import WorkQueue
+from src.utils.log import setup_logging, setup_worker_logging
+from src.utils.metrics import REGISTRY as metrics, start_http_server
+
+logger = logging.getLogger("scraper")
+
+# Expresiones regulares de los extractores, compiladas una sola vez
+RATING_RE = re.compile(r'(\d+\.\d+)')
+REVIEWS_RE = re.compile(r'(\d+)\s+reviews?')
+PRICE_RE = re.compile(r'[£\$\€](\d+)')
+NIGHTS_RE = re.compile(r'x\s*(\d+)\s*night')
+COORDINATES_RE = re.compile(r'"lat":\s*(-?\d+\.\d+),\s*"lng":\s*(-?\d+\.\d+)')
+TOTAL_LISTINGS_RE = re.compile(r'(\d+)\s+alojamientos?')
+ROOM_ID_RE = re.compile(r'/rooms/(\d+)')
+
+# Cambio de fechas sin recargar: el router de Airbnb reacciona a popstate
+PUSH_STATE_JS = ("window.history.pushState({}, '', arguments[0]);"
+                 "window.dispatchEvent(new PopStateEvent('popstate', {state: {}}));")
+# Solo el HTML de la sección de precios (evita serializar y parsear la página entera)
+PRICE_SECTION_JS = ("const section = document.querySelector('[data-section-id=\"BOOK_IT_SIDEBAR\"]');"
+                    "return section ? section.outerHTML : null;")
+
+# Directorio donde se archiva el HTML de cada listado (uno por fecha de captura)
+ARCHIVE_DIR = Path(os.environ.get("PAGE_ARCHIVE_DIR", "page_archive"))
 
 def configure_driver():
     """Configura y retorna el driver de Selenium"""
@@ -49,58 +83,77 @@ def save_debug_sections(soup, debug_dir="debug_sections"):
             with open(filename, "w", encoding="utf-8") as f:
                 f.write(section.prettify())
 
-def scrape_listing(url):
-    """Analiza un listado específico de Airbnb"""
-    driver = configure_driver()
+def scrape_listing(url, debug=True):
+    """Analiza un listado específico de Airbnb.
+
+    Con `debug` guarda la página y sus secciones en debug_last_page.html y
+    debug_sections/; son rutas fijas, así que se desactiva con varios
+    navegadores en paralelo.
+    """
+    with metrics.span("driver_start", phase="listing"):
+        driver = configure_driver()
     try:
-        print(f"\nAnalizando listado: {url}")
-        driver.get(url)
-        time.sleep(5)
+        logger.info("Analizando listado %s", url)
+        with metrics.span("page_load", phase="listing"):
+            driver.get(url)
+        with metrics.span("sleep", phase="listing"):
+            time.sleep(5)
         
         # Guardar HTML para debug
-        page_source = driver.page_source
-        with open("debug_last_page.html", "w", encoding="utf-8") as f:
-            f.write(page_source)
+        with metrics.span("page_source", phase="listing"):
+            page_source = driver.page_source
+        if debug:
+            with metrics.span("debug_dump", phase="listing"):
+                with open("debug_last_page.html", "w", encoding="utf-8") as f:
+                    f.write(page_source)
+        with metrics.span("archive", phase="listing"):
+            archive_page(url, page_source)
         
-        soup = BeautifulSoup(page_source, 'html.parser')
-        save_debug_sections(soup)
+        with metrics.span("parse", phase="listing"):
+            soup = BeautifulSoup(page_source, 'html.parser')
+        if debug:
+            with metrics.span("debug_dump", phase="listing"):
+                save_debug_sections(soup)
         
         # Intentar cerrar el modal si existe
-        try:
-            print("Buscando modal para cerrar...")
-            close_button = WebDriverWait(driver, 5).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "button[aria-label='Close']"))
-            )
-            print("Modal encontrado, cerrándolo...")
-            close_button.click()
-            print("Modal cerrado")
-            time.sleep(1)
-        except:
-            print("No se encontró modal para cerrar o ya estaba cerrado")
+        with metrics.span("modal", phase="listing"):
+            try:
+                logger.debug("Buscando modal para cerrar")
+                close_button = WebDriverWait(driver, 5).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, "button[aria-label='Close']"))
+                )
+                logger.debug("Modal encontrado, cerrándolo")
+                close_button.click()
+                logger.debug("Modal cerrado")
+                time.sleep(1)
+            except:
+                logger.debug("No se encontró modal para cerrar o ya estaba cerrado")
         
         # Extraer información
-        listing_data = {
-            **extract_rating_info(soup),
-            **extract_capacity_info(soup),
-            **extract_years_as_host(soup),
-            **extract_price_info(soup, driver)
-        }
+        with metrics.span("extract", phase="listing"):
+            listing_data = {
+                **extract_rating_info(soup),
+                **extract_capacity_info(soup),
+                **extract_years_as_host(soup),
+                **extract_price_info(soup, driver),
+                **extract_location_info(soup)
+            }
         
         return listing_data
         
     except Exception as e:
-        print(f"Error al analizar el listado: {e}")
+        logger.error("Error al analizar el listado %s: %s", url, e)
         return None
     finally:
-        driver.quit()
-
+        with metrics.span("driver_quit", phase="listing"):
+            driver.quit()
 
 
 def extract_rating_info(soup):
     """Extrae información de rating y reviews"""
     reviews_section = soup.find("div", {"data-section-id": "REVIEWS_DEFAULT"})
     if not reviews_section:
-        print("No se encontró la sección de reviews")
+        logger.warning("No se encontró la sección de reviews")
         return {
             "reviews": "0",
             "rating": "0"
@@ -116,21 +169,19 @@ def extract_rating_info(soup):
         rating_title = reviews_section.find("h2")
         if rating_title:
             # Extraer rating (ejemplo: "5.0 · 3 reviews")
-            rating_match = re.search(r'(\d+\.\d+)', rating_title.text)
+            rating_match = RATING_RE.search(rating_title.text)
             if rating_match:
                 info["rating"] = rating_match.group(1)
             
             # Extraer número de reviews
-            reviews_match = re.search(r'(\d+)\s+reviews?', rating_title.text)
+            reviews_match = REVIEWS_RE.search(rating_title.text)
             if reviews_match:
                 info["reviews"] = reviews_match.group(1)
     
     except Exception as e:
-        print(f"Error al extraer rating/reviews: {e}")
+        logger.warning("Error al extraer rating/reviews: %s", e)
     
-    print("\nInformación de rating:")
-    print(f"Rating: {info['rating']}")
-    print(f"Reviews: {info['reviews']}")
+    logger.debug("Información de rating", extra={"fields": info})
     
     return info
 
@@ -138,7 +189,7 @@ def extract_capacity_info(soup):
     """Extrae información sobre la capacidad del alojamiento"""
     capacity_section = soup.find("div", {"class": "o1kjrihn"})
     if not capacity_section:
-        print("No se encontró la sección de capacidad")
+        logger.warning("No se encontró la sección de capacidad")
         return {
             "guests": "No disponible",
             "bedrooms": "No disponible",
@@ -169,9 +220,7 @@ def extract_capacity_info(soup):
         elif "bath" in text:
             capacity["baths"] = text.split()[0]
     
-    print("\nInformación de capacidad:")
-    for key, value in capacity.items():
-        print(f"{key}: {value}")
+    logger.debug("Información de capacidad", extra={"fields": capacity})
     
     return capacity
 
@@ -179,7 +228,7 @@ def extract_years_as_host(soup):
     """Extrae información sobre los años como host"""
     host_section = soup.find("div", {"class": "s1m4e316"})
     if not host_section:
-        print("No se encontró la sección de host")
+        logger.warning("No se encontró la sección de host")
         return {
             "years_hosting": "0"
         }
@@ -192,24 +241,19 @@ def extract_years_as_host(soup):
         "years_hosting": years_hosting
     }
     
-    print("\nInformación de host:")
-    print(f"Años como host: {info['years_hosting']}")
+    logger.debug("Información de host", extra={"fields": info})
     
     return info
 
-def extract_price_info(soup, driver):
-    """Extrae información de precios del listado"""
-    prices = {
-        "price_original": "0",
-        "price_discount": "0",
-        "nights": "0",
-        "total_nights": "0",
-        "special_offer": "0",
-        "cleaning_fee": "0",
-        "service_fee": "0",
-        "total": "0"
-    }
+def extract_price_info(soup, driver, missing="0"):
+    """Extrae información de precios del listado; `missing` es el valor de los campos no encontrados"""
+    prices = dict.fromkeys(
+        ["price_original", "price_discount", "nights", "total_nights",
+         "special_offer", "cleaning_fee", "service_fee", "total"],
+        missing,
+    )
     
+    price_section = None
     try:
         # Buscar el contenedor principal de precios
         price_section = soup.find("div", {"data-section-id": "BOOK_IT_SIDEBAR"})
@@ -218,10 +262,10 @@ def extract_price_info(soup, driver):
             price_element = price_section.find("span", {"class": "_11jcbg2"})
             if price_element:
                 price_text = price_element.text.strip()
-                price_match = re.search(r'[£\$\€](\d+)', price_text)
+                price_match = PRICE_RE.search(price_text)
                 if price_match:
                     prices["price_original"] = price_match.group(1)
-                    print(f"Precio por noche encontrado: {prices['price_original']}")
+                    logger.debug("Precio por noche encontrado: %s", prices["price_original"])
 
             # Buscar el desglose de precios
             price_items = price_section.find_all("div", {"class": "_14omvfj"})
@@ -231,12 +275,12 @@ def extract_price_info(soup, driver):
                 
                 if price_span:
                     amount_text = price_span.text.strip()
-                    amount_match = re.search(r'[£\$\€](\d+)', amount_text)
+                    amount_match = PRICE_RE.search(amount_text)
                     if amount_match:
                         amount = amount_match.group(1)
                         
                         if "x" in text and "night" in text:
-                            nights_match = re.search(r'x\s*(\d+)\s*night', text)
+                            nights_match = NIGHTS_RE.search(text)
                             if nights_match:
                                 prices["nights"] = nights_match.group(1)
                                 prices["total_nights"] = amount
@@ -247,29 +291,119 @@ def extract_price_info(soup, driver):
                         elif "special offer" in text or "discount" in text:
                             prices["special_offer"] = amount
 
-            # Calcular el total usando la fórmula
-            try:
-                total = (int(prices["total_nights"]) - 
-                        int(prices["special_offer"]) + 
-                        int(prices["cleaning_fee"]) + 
-                        int(prices["service_fee"]))
-                prices["total"] = str(total)
-                print(f"Total calculado: {total}")
-            except ValueError as e:
-                print(f"Error al calcular el total: {e}")
+            # Calcular el total usando la fórmula (sin subtotal de noches no hay total)
+            if prices["total_nights"] is not None:
+                try:
+                    total = (int(prices["total_nights"]) -
+                            int(prices["special_offer"] or 0) +
+                            int(prices["cleaning_fee"] or 0) +
+                            int(prices["service_fee"] or 0))
+                    prices["total"] = str(total)
+                    logger.debug("Total calculado: %s", total)
+                except ValueError as e:
+                    logger.warning("Error al calcular el total: %s", e)
 
     except Exception as e:
-        print(f"Error al extraer precios: {e}")
-        if price_section:
-            print("HTML de la sección de precios:")
-            print(price_section.prettify())
+        logger.warning("Error al extraer precios: %s", e)
+        # prettify() recorre toda la sección: solo se genera si se va a emitir
+        if price_section and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("HTML de la sección de precios:\n%s", price_section.prettify())
     
-    print("\nInformación de precios encontrada:")
-    for key, value in prices.items():
-        print(f"{key}: {value}")
+    logger.debug("Información de precios encontrada", extra={"fields": prices})
     
     return prices
 
+def extract_location_info(soup):
+    """Extrae las coordenadas del listado desde los datos embebidos del mapa"""
+    location = {
+        "latitude": "",
+        "longitude": ""
+    }
+    
+    for script in soup.find_all("script"):
+        text = script.string or ""
+        coordinates_match = COORDINATES_RE.search(text)
+        if coordinates_match:
+            location["latitude"] = coordinates_match.group(1)
+            location["longitude"] = coordinates_match.group(2)
+            break
+    
+    logger.debug("Ubicación", extra={"fields": location})
+    
+    return location
+
+def archive_page(url, page_source, archive_dir=None):
+    """Guarda el HTML del listado en <archivo>/<fecha>/<id de habitación>.html.
+
+    La URL original (con fechas y huéspedes) se guarda al lado, en <id>.url,
+    para que la re-extracción reproduzca el mismo `link` que el crawl.
+    """
+    room_id = ROOM_ID_RE.search(url)
+    if not room_id:
+        return None
+    directory = Path(archive_dir or ARCHIVE_DIR) / date.today().isoformat()
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / f"{room_id.group(1)}.html"
+    path.write_text(page_source, encoding="utf-8")
+    path.with_suffix(".url").write_text(url, encoding="utf-8")
+    return path
+
+def archived_url(path):
+    """URL original de una página archivada (o la del id, para archivos sin <id>.url)"""
+    path = Path(path)
+    try:
+        return path.with_suffix(".url").read_text(encoding="utf-8").strip()
+    except FileNotFoundError:
+        return f"https://www.airbnb.com/rooms/{path.stem}"
+
+def extract_archived_page(path):
+    """Extrae los datos de un listado desde su HTML archivado"""
+    path = Path(path)
+    soup = BeautifulSoup(path.read_text(encoding="utf-8"), 'html.parser')
+    return {
+        **extract_rating_info(soup),
+        **extract_capacity_info(soup),
+        **extract_years_as_host(soup),
+        **extract_price_info(soup, None),
+        **extract_location_info(soup),
+        "link": archived_url(path),
+        # El directorio del archivo es la fecha de captura
+        "crawled_at": path.parent.name,
+    }
+
+def _extract_archived_page_safe(path):
+    """Versión para el pool: un archivo con error no interrumpe al resto"""
+    try:
+        return str(path), extract_archived_page(path), None
+    except Exception as e:
+        return str(path), None, f"{type(e).__name__}: {e}"
+
+def reextract_archive(archive_dir, workers=None, filename="airbnb_data.csv"):
+    """Regenera el dataset a partir de las páginas archivadas, en paralelo"""
+    paths = sorted(Path(archive_dir).rglob("*.html"))
+    if not paths:
+        logger.warning("No hay páginas archivadas en %s", archive_dir)
+        return False
+    workers = workers or os.cpu_count() or 1
+    # Bloques de varias páginas por tarea: menos overhead de IPC por archivo
+    chunksize = max(1, len(paths) // (workers * 8))
+    logger.info("Re-extrayendo %d páginas con %d procesos", len(paths), workers)
+
+    listings, failed = [], 0
+    with metrics.span("reextract", phase="archive"):
+        with ProcessPoolExecutor(max_workers=workers, initializer=setup_worker_logging,
+                                 initargs=(logging.getLogger().level,)) as pool:
+            for path, listing, error in pool.map(_extract_archived_page_safe, paths, chunksize=chunksize):
+                if error:
+                    failed += 1
+                    metrics.inc("reextracted_total", status="error")
+                    logger.warning("Error al extraer %s: %s", path, error)
+                    continue
+                metrics.inc("reextracted_total", status="ok")
+                listings.append(listing)
+    logger.info("Re-extraídos %d listados (%d con error)", len(listings), failed)
+    return save_to_csv(listings, filename)
+
 def get_listing_url(item):
     """Extrae el enlace del listado"""
     link_element = item.find("a", recursive=False)
@@ -281,7 +415,7 @@ def parse_listings(soup):
     """Procesa todos los listados encontrados en la página"""
     listing_urls = []
     items = soup.find_all("div", {"data-testid": "card-container"})
-    print(f"Encontrados {len(items)} listados para procesar")
+    logger.info("Encontrados %d listados para procesar", len(items))
     
     for item in items:
         try:
@@ -289,19 +423,19 @@ def parse_listings(soup):
             if link:
                 listing_urls.append(link)
         except Exception as e:
-            print(f"Error extrayendo URL: {e}")
+            logger.warning("Error extrayendo URL: %s", e)
             continue
     
     return listing_urls
 
 def find_next_button(soup):
     """Busca el botón de siguiente página y retorna su URL"""
-    print("\nDEBUG: Buscando botón siguiente...")
+    logger.debug("Buscando botón siguiente")
     
     # Método 1: Buscar por nav y aria-label
     pagination_nav = soup.find("nav", {"aria-label": "Paginación de los resultados de búsqueda"})
     if pagination_nav:
-        print("DEBUG: Encontrado contenedor de paginación")
+        logger.debug("Encontrado contenedor de paginación")
         
         # Imprimir todos los botones y enlaces encontrados
         all_buttons = pagination_nav.find_all(["button", "a"])        
@@ -316,63 +450,70 @@ def find_next_button(soup):
         if next_button:
             if 'href' in next_button.attrs:
                 next_url = "https://www.airbnb.com" + next_button['href']
-                print(f"DEBUG: URL siguiente encontrada: {next_url}")
+                logger.debug("URL siguiente encontrada: %s", next_url)
                 return next_url
             else:
-                print("DEBUG: Botón encontrado pero sin atributo href")
-                print("DEBUG: Atributos del botón:", next_button.attrs)
+                logger.debug("Botón encontrado pero sin atributo href; atributos: %s", next_button.attrs)
     else:
-        print("DEBUG: No se encontró el contenedor de paginación principal")
+        logger.debug("No se encontró el contenedor de paginación principal")
         # Buscar cualquier elemento de navegación
         all_navs = soup.find_all("nav")
-        print(f"DEBUG: Navegaciones encontradas: {len(all_navs)}")
-        for nav in all_navs:
-            print(f"DEBUG: Nav con clases: {nav.get('class')}, aria-label: {nav.get('aria-label')}")
+        logger.debug("Navegaciones encontradas: %d", len(all_navs))
+        if logger.isEnabledFor(logging.DEBUG):
+            for nav in all_navs:
+                logger.debug("Nav con clases: %s, aria-label: %s", nav.get('class'), nav.get('aria-label'))
     
     return None
 
 def fetch_airbnb_data(base_url):
     """Obtiene los datos de todas las páginas de búsqueda de Airbnb"""
     all_listing_urls = []
-    driver = configure_driver()
+    with metrics.span("driver_start", phase="search"):
+        driver = configure_driver()
     
     try:
-        print("\n=== FASE 1: ANÁLISIS INICIAL ===")
-        print("→ Accediendo a la página principal...")
-        driver.get(base_url)
-        time.sleep(5)
+        logger.info("Fase 1: análisis inicial, accediendo a la página principal")
+        with metrics.span("page_load", phase="search"):
+            driver.get(base_url)
+        with metrics.span("sleep", phase="search"):
+            time.sleep(5)
         
-        print("→ Buscando número total de alojamientos...")
-        soup = BeautifulSoup(driver.page_source, "html.parser")
+        logger.info("Buscando número total de alojamientos")
+        with metrics.span("parse", phase="search"):
+            soup = BeautifulSoup(driver.page_source, "html.parser")
         total_listings = get_total_listings(soup)
         
         if total_listings:
             total_pages = calculate_total_pages(total_listings)
-            print(f"✓ Encontrados {total_listings} alojamientos")
-            print(f"✓ Se procesarán {total_pages} páginas")
+            logger.info("Encontrados %d alojamientos, se procesarán %d páginas", total_listings, total_pages)
         else:
-            print("! No se pudo determinar el número total. Usando 4 páginas por defecto")
+            logger.warning("No se pudo determinar el número total. Usando 4 páginas por defecto")
             total_pages = 4
         
-        print("\n=== FASE 2: RECOLECCIÓN DE URLS ===")
+        logger.info("Fase 2: recolección de URLs")
         for page in range(total_pages):
-            print(f"\n--- Página {page + 1} de {total_pages} ---")
+            logger.info("Página %d de %d", page + 1, total_pages)
             current_url = f"{base_url}&items_offset={page * 18}"
             
-            print("→ Cargando página...")
-            driver.get(current_url)
-            time.sleep(5)
+            logger.debug("Cargando página %s", current_url)
+            with metrics.span("page_load", phase="search"):
+                driver.get(current_url)
+            with metrics.span("sleep", phase="search"):
+                time.sleep(5)
 
-            print("→ Haciendo scroll para cargar todos los elementos...")
-            for i in range(3):
-                driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(3)
+            logger.debug("Haciendo scroll para cargar todos los elementos")
+            with metrics.span("scroll", phase="search"):
+                for i in range(3):
+                    driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+                    time.sleep(3)
 
-            soup = BeautifulSoup(driver.page_source, "html.parser")
-            items = soup.find_all("div", {"data-testid": "card-container"})
+            with metrics.span("parse", phase="search"):
+                soup = BeautifulSoup(driver.page_source, "html.parser")
+                items = soup.find_all("div", {"data-testid": "card-container"})
+            metrics.inc("pages_total")
             
             if not items:
-                print("! No se encontraron alojamientos en esta página")
+                logger.warning("No se encontraron alojamientos en esta página")
                 break
             
             new_urls = 0
@@ -382,24 +523,22 @@ def fetch_airbnb_data(base_url):
                     all_listing_urls.append(url)
                     new_urls += 1
             
-            print(f"✓ Encontrados {len(items)} alojamientos")
-            print(f"✓ Nuevas URLs añadidas: {new_urls}")
-            print(f"✓ Total acumulado: {len(all_listing_urls)}")
+            logger.info("Página procesada", extra={"fields": {
+                "alojamientos": len(items), "nuevas_urls": new_urls, "total": len(all_listing_urls)
+            }})
             
-        print(f"\n=== RESUMEN FINAL ===")
-        print(f"✓ Total de URLs únicas recolectadas: {len(all_listing_urls)}")
+        logger.info("Total de URLs únicas recolectadas: %d", len(all_listing_urls))
         
         return all_listing_urls, driver
         
     except Exception as e:
-        print("\n!!! ERROR !!!")
-        print(f"→ {str(e)}")
+        logger.exception("Error al recolectar URLs: %s", e)
         return [], driver
 
 def save_to_csv(listings_data, filename="airbnb_data.csv"):
     """Guarda los datos de los listados en un archivo CSV"""
     if not listings_data:
-        print("No hay datos para guardar")
+        logger.warning("No hay datos para guardar")
         return False
         
     # Definir las columnas en el orden deseado
@@ -408,8 +547,11 @@ def save_to_csv(listings_data, filename="airbnb_data.csv"):
         'guests', 'bedrooms', 'beds', 'baths', 
         'years_hosting', 'price_original', 'price_discount',
         'nights', 'total_nights', 'special_offer',
-        'cleaning_fee', 'service_fee', 'total'
+        'cleaning_fee', 'service_fee', 'total',
+        'latitude', 'longitude', 'crawled_at'
     ]
+    # Fecha de la corrida: permite agregar varias capturas en un mismo dataset
+    crawled_at = date.today().isoformat()
     
     try:
         with open(filename, 'w', newline='', encoding='utf-8') as f:
@@ -435,15 +577,18 @@ def save_to_csv(listings_data, filename="airbnb_data.csv"):
                     'special_offer': listing.get('special_offer', '0'),
                     'cleaning_fee': listing.get('cleaning_fee', '0'),
                     'service_fee': listing.get('service_fee', '0'),
-                    'total': listing.get('total', '0')
+                    'total': listing.get('total', '0'),
+                    'latitude': listing.get('latitude', ''),
+                    'longitude': listing.get('longitude', ''),
+                    'crawled_at': listing.get('crawled_at', crawled_at)
                 }
                 writer.writerow(row)
         
-        print(f"\nDatos guardados exitosamente en {filename}")
+        logger.info("Datos guardados exitosamente en %s", filename)
         return True
         
     except Exception as e:
-        print(f"Error al guardar el CSV: {e}")
+        logger.error("Error al guardar el CSV: %s", e)
         return False
 
 def get_total_listings(soup):
@@ -453,61 +598,382 @@ def get_total_listings(soup):
         total_element = soup.find("span", {"class": "a8jt5op"})
         if total_element:
             # Extraer el número usando regex
-            number = re.search(r'(\d+)\s+alojamientos?', total_element.text)
+            number = TOTAL_LISTINGS_RE.search(total_element.text)
             if number:
                 total = int(number.group(1))
-                print(f"DEBUG: Total de alojamientos encontrados: {total}")
+                logger.debug("Total de alojamientos encontrados: %d", total)
                 return total
             
         # Método alternativo: buscar en el h1
         h1_element = soup.find("h1", {"class": "hpipapi"})
         if h1_element:
-            number = re.search(r'(\d+)\s+alojamientos?', h1_element.text)
+            number = TOTAL_LISTINGS_RE.search(h1_element.text)
             if number:
                 total = int(number.group(1))
-                print(f"DEBUG: Total de alojamientos encontrados (h1): {total}")
+                logger.debug("Total de alojamientos encontrados (h1): %d", total)
                 return total
                 
-        print("No se pudo encontrar el número de alojamientos")
+        logger.warning("No se pudo encontrar el número de alojamientos")
         return None
         
     except Exception as e:
-        print(f"Error al obtener total de alojamientos: {e}")
+        logger.warning("Error al obtener total de alojamientos: %s", e)
         return None
 
 def calculate_total_pages(total_listings, listings_per_page=18):
     """Calcula el número total de páginas necesarias"""
     return -(-total_listings // listings_per_page)  # Redondeo hacia arriba
 
-if __name__ == "__main__":
-    search_url = "https://www.airbnb.com.ar/s/Microcentro/homes?refinement_paths%5B%5D=%2Fhomes&flexible_trip_lengths%5B%5D=one_week&monthly_start_date=2025-02-01&monthly_length=3&monthly_end_date=2025-05-01&price_filter_input_type=0&channel=EXPLORE&date_picker_type=calendar&checkin=2025-01-16&checkout=2025-01-19&adults=2&source=structured_search_input_header&search_type=user_map_move&query=Microcentro&place_id=ChIJoZjYMB7LvJUR-lIvu29mQ6w&search_mode=regular_search&price_filter_num_nights=3&ne_lat=-34.593555291120474&ne_lng=-58.371582208467714&sw_lat=-34.617006214929525&sw_lng=-58.39181891193829&zoom=15.175922923838742&zoom_level=15.175922923838742&search_by_map=true"
-
-    print("Iniciando scraping de Airbnb...")
+def crawl(search_url, filename="airbnb_data.csv"):
+    """Recorre la búsqueda, analiza cada listado y guarda el CSV"""
+    logger.info("Iniciando scraping de Airbnb")
     listing_urls, driver = fetch_airbnb_data(search_url)
 
     try:
         if listing_urls:
-            print(f"\nEncontrados {len(listing_urls)} URLs totales para procesar")
+            logger.info("Encontrados %d URLs totales para procesar", len(listing_urls))
             
             all_listings_data = []
             for i, url in enumerate(listing_urls, 1):
-                print(f"\nProcesando listado {i}/{len(listing_urls)}")
+                logger.info("Procesando listado %d/%d", i, len(listing_urls))
                 listing_data = scrape_listing(url)
                 if listing_data:
                     listing_data['link'] = url
                     all_listings_data.append(listing_data)
-                    print(f"Listado {i} procesado exitosamente")
+                    metrics.inc("listings_total", status="ok")
+                    logger.debug("Listado %d procesado exitosamente", i)
                 else:
-                    print(f"Error al procesar listado {i}")
+                    metrics.inc("listings_total", status="error")
+                    logger.warning("Error al procesar listado %d", i)
                 
                 # Pausa entre listados para evitar bloqueos
-                time.sleep(3)
+                with metrics.span("sleep", phase="between_listings"):
+                    time.sleep(3)
             
-            print(f"\nProcesados {len(all_listings_data)} listados exitosamente")
-            save_to_csv(all_listings_data)
+            logger.info("Procesados %d listados exitosamente", len(all_listings_data))
+            with metrics.span("save_csv", phase="output"):
+                save_to_csv(all_listings_data, filename)
             
     except Exception as e:
-        print(f"Error en el proceso: {e}")
+        logger.exception("Error en el proceso: %s", e)
     finally:
         if driver:
-            driver.quit()
\ No newline at end of file
+            driver.quit()
+
+def crawl_jobs(jobs, workers=2):
+    """Recorre varias búsquedas compartiendo `workers` navegadores simultáneos.
+
+    Cada trabajo tiene su cola (la búsqueda y después un listado por tarea) y
+    el scheduler reparte los navegadores según la prioridad. El CSV de cada
+    trabajo se guarda apenas termina, sin esperar a los demás.
+    """
+    scheduler = FairScheduler(workers)
+    results = {job.name: [] for job in jobs}
+
+    def search(job):
+        logger.info("Buscando alojamientos de %s", job.name)
+        listing_urls, driver = fetch_airbnb_data(job.search_url())
+        if driver:
+            driver.quit()
+        for url in listing_urls:
+            scheduler.submit(job.name, scrape, job, url)
+
+    def scrape(job, url):
+        # Los dumps de debug usan rutas fijas (y debug_sections/ tiene los fixtures de benchmarks)
+        listing_data = scrape_listing(url, debug=scheduler.workers == 1)
+        if listing_data:
+            listing_data['link'] = url
+            results[job.name].append(listing_data)
+            metrics.inc("listings_total", status="ok", job=job.name)
+        else:
+            metrics.inc("listings_total", status="error", job=job.name)
+        # Pausa entre listados para evitar bloqueos (ocupa el slot del navegador)
+        with metrics.span("sleep", phase="between_listings"):
+            time.sleep(3)
+
+    def save(job):
+        logger.info("Trabajo %s terminado: %d listados", job.name, len(results[job.name]))
+        with metrics.span("save_csv", phase="output"):
+            save_to_csv(results[job.name], job.output)
+
+    for job in jobs:
+        scheduler.add_queue(job.name, job.priority, on_done=lambda job=job: save(job))
+        scheduler.submit(job.name, search, job)
+    logger.info("Iniciando %d trabajos con %d navegadores", len(jobs), scheduler.workers)
+    return scheduler.run()
+
+def coordinate(search_urls, queue_path, filename="airbnb_data.csv", poll_interval=10,
+               deadline=None, stall_timeout=1800, resume=False):
+    """Encola los listados de las búsquedas y guarda el CSV cuando los workers terminan.
+
+    Por defecto empieza una corrida nueva y vacía la cola; con `resume` sigue
+    la corrida anterior y no vuelve a analizar los listados ya completados.
+    Deja de esperar (y guarda lo completado hasta ese momento) si pasan
+    `deadline` segundos desde el inicio o `stall_timeout` segundos sin que
+    ninguna tarea termine; `None` desactiva cada límite.
+    """
+    queue = WorkQueue(queue_path)
+    started = time.monotonic()
+    try:
+        if resume:
+            # Reabre la cola de la corrida interrumpida
+            queue.seal(False)
+        else:
+            queue.reset()
+        try:
+            for search_url in search_urls:
+                listing_urls, driver = fetch_airbnb_data(search_url)
+                if driver:
+                    driver.quit()
+                # Clave de deduplicación: el id de habitación (o la URL si no lo tiene)
+                items = []
+                for url in listing_urls:
+                    match = ROOM_ID_RE.search(url)
+                    items.append((match.group(1) if match else url, url))
+                added = queue.put_many(items)
+                logger.info("Encolados %d listados nuevos (%d ya estaban en la cola)",
+                            added, len(items) - added)
+        finally:
+            # Aunque falle una búsqueda, los workers tienen que poder terminar
+            queue.seal()
+
+        finished, progress_at = None, time.monotonic()
+        while queue.unfinished():
+            counts = queue.counts()
+            now = time.monotonic()
+            if counts.get("done", 0) + counts.get("failed", 0) != finished:
+                finished, progress_at = counts.get("done", 0) + counts.get("failed", 0), now
+            if deadline is not None and now - started > deadline:
+                logger.warning("Se venció el plazo del coordinador, se guardan los resultados parciales",
+                               extra={"fields": counts})
+                break
+            if stall_timeout is not None and now - progress_at > stall_timeout:
+                logger.warning("Sin progreso de los workers en %ss, se guardan los resultados parciales",
+                               stall_timeout, extra={"fields": counts})
+                break
+            logger.info("Esperando a los workers", extra={"fields": counts})
+            time.sleep(poll_interval)
+        else:
+            logger.info("Cola terminada", extra={"fields": queue.counts()})
+
+        with metrics.span("save_csv", phase="output"):
+            return save_to_csv(queue.results(), filename)
+    finally:
+        queue.close()
+
+def run_worker(queue_path, worker_id=None, poll_interval=5, idle_timeout=None,
+               lease_seconds=300, pause=3):
+    """Toma listados de la cola, los analiza y reporta el resultado hasta que no queda trabajo.
+
+    Termina cuando el coordinador cerró la cola y no quedan tareas pendientes
+    ni con lease: mientras otro worker tenga una, espera por si su lease vence
+    y hay que retomarla. `idle_timeout` (segundos sin tareas) es un límite
+    opcional adicional.
+    """
+    worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}"
+    queue = WorkQueue(queue_path, lease_seconds=lease_seconds)
+    idle_since = time.monotonic()
+    try:
+        while True:
+            task = queue.lease(worker_id)
+            if task is None:
+                if queue.drained():
+                    logger.info("Worker %s: cola terminada", worker_id)
+                    return
+                if idle_timeout is not None and time.monotonic() - idle_since > idle_timeout:
+                    logger.warning("Worker %s sin tareas hace %ss, terminando", worker_id, idle_timeout,
+                                   extra={"fields": queue.counts()})
+                    return
+                # El coordinador sigue encolando u otro worker tiene tareas con lease
+                time.sleep(poll_interval)
+                continue
+            key, url = task
+            # Puede haber varios workers en el mismo directorio: sin dumps de debug
+            listing_data = scrape_listing(url, debug=False)
+            if listing_data:
+                listing_data['link'] = url
+                if not queue.complete(key, worker_id, listing_data):
+                    logger.info("Listado %s ya completado por otro worker", key)
+                metrics.inc("listings_total", status="ok")
+            else:
+                queue.fail(key, worker_id, "scrape_listing no devolvió datos")
+                metrics.inc("listings_total", status="error")
+            idle_since = time.monotonic()
+            # Pausa entre listados para evitar bloqueos
+            with metrics.span("sleep", phase="between_listings"):
+                time.sleep(pause)
+    finally:
+        queue.close()
+
+def nightly_price(html):
+    """Precio por noche de la sección de precios (texto sin parsear a número); None si no está"""
+    if not html:
+        return None
+    element = BeautifulSoup(html, "html.parser").find("span", {"class": "_11jcbg2"})
+    match = PRICE_RE.search(element.text) if element else None
+    return match.group(1) if match else None
+
+def date_labels(day):
+    """Formatos en que la sección de precios puede mostrar una fecha"""
+    return (day.isoformat(), f"{day.month}/{day.day}/{day.year}")
+
+def price_section_ready(html, previous, checkin, checkout):
+    """Indica si la sección ya muestra un precio de la estadía pedida.
+
+    El primer cambio después de navegar suele ser el skeleton de carga (sin
+    precio) o la sección vieja: se acepta cuando hay un precio y, además, la
+    sección muestra las fechas nuevas o el precio cambió respecto de `previous`.
+    """
+    price = nightly_price(html)
+    if price is None:
+        return False
+    if previous is None:
+        return True
+    if html == previous:
+        return False
+    dates_shown = (any(label in html for label in date_labels(checkin))
+                   and any(label in html for label in date_labels(checkout)))
+    return dates_shown or price != nightly_price(previous)
+
+def wait_for_price_section(driver, checkin, checkout, previous=None, timeout=10):
+    """Espera el HTML de la sección de precios con el precio de la estadía; None si no llega"""
+    def ready(driver):
+        html = driver.execute_script(PRICE_SECTION_JS)
+        return html if price_section_ready(html, previous, checkin, checkout) else False
+    try:
+        return WebDriverWait(driver, timeout).until(ready)
+    except TimeoutException:
+        return None
+
+def scrape_price_windows(driver, url, windows, timeout=10):
+    """Precios de un listado para cada ventana (check-in, check-out) en una sola sesión.
+
+    La página se carga una vez; las demás ventanas cambian las fechas de la
+    URL en el navegador (pushState + popstate) y esperan que se actualice la
+    sección de precios. Si no se actualiza, se recarga la página completa.
+    Los campos que no se encuentran quedan en None (un 0 es un valor real).
+    """
+    results = []
+    html = None
+    for checkin, checkout in windows:
+        window_url = with_stay_dates(url, checkin, checkout)
+        previous, html = html, None
+        if previous is not None:
+            with metrics.span("navigate", phase="prices"):
+                driver.execute_script(PUSH_STATE_JS, window_url)
+                html = wait_for_price_section(driver, checkin, checkout, previous, timeout)
+            metrics.inc("price_windows_total", mode="in_page" if html else "fallback")
+        if html is None:
+            with metrics.span("page_load", phase="prices"):
+                driver.get(window_url)
+                html = wait_for_price_section(driver, checkin, checkout, None, timeout)
+            metrics.inc("price_windows_total", mode="reload")
+        with metrics.span("extract", phase="prices"):
+            results.append(extract_price_info(BeautifulSoup(html or "", "html.parser"), driver, missing=None))
+    return results
+
+def read_listing_links(filename):
+    """Links únicos (por id de habitación) de un CSV generado por el scraper"""
+    links = {}
+    with open(filename, newline='', encoding='utf-8') as f:
+        for row in csv.DictReader(f):
+            match = ROOM_ID_RE.search(row.get('link') or '')
+            if match:
+                links.setdefault(match.group(1), row['link'])
+    return links
+
+def price_calendar(links, windows, output="price_matrix.npz"):
+    """Recorre los listados (id -> link) con un solo navegador y guarda la matriz de precios"""
+    matrix = PriceMatrix(links, windows)
+    with metrics.span("driver_start", phase="prices"):
+        driver = configure_driver()
+    try:
+        for listing, url in enumerate(links.values()):
+            logger.info("Precios del listado %d/%d (%d ventanas)", listing + 1, len(links), len(windows))
+            try:
+                for window, prices in enumerate(scrape_price_windows(driver, url, windows)):
+                    matrix.set(listing, window, prices)
+                metrics.inc("listings_total", status="ok")
+            except Exception as e:
+                logger.error("Error al obtener precios de %s: %s", url, e)
+                metrics.inc("listings_total", status="error")
+            # Pausa entre listados para evitar bloqueos
+            with metrics.span("sleep", phase="between_listings"):
+                time.sleep(3)
+    finally:
+        with metrics.span("driver_quit", phase="prices"):
+            driver.quit()
+        # Se guarda también si la corrida se interrumpe (las ventanas faltantes quedan en NaN)
+        path = matrix.save(output)
+        logger.info("Matriz de precios %s guardada en %s", matrix.values.shape, path)
+    return matrix
+
+if __name__ == "__main__":
+    search_url = "https://www.airbnb.com.ar/s/Microcentro/homes?refinement_paths%5B%5D=%2Fhomes&flexible_trip_lengths%5B%5D=one_week&monthly_start_date=2025-02-01&monthly_length=3&monthly_end_date=2025-05-01&price_filter_input_type=0&channel=EXPLORE&date_picker_type=calendar&checkin=2025-01-16&checkout=2025-01-19&adults=2&source=structured_search_input_header&search_type=user_map_move&query=Microcentro&place_id=ChIJoZjYMB7LvJUR-lIvu29mQ6w&search_mode=regular_search&price_filter_num_nights=3&ne_lat=-34.593555291120474&ne_lng=-58.371582208467714&sw_lat=-34.617006214929525&sw_lng=-58.39181891193829&zoom=15.175922923838742&zoom_level=15.175922923838742&search_by_map=true"
+
+    parser = argparse.ArgumentParser(description="Scraper de listados de Airbnb")
+    parser.add_argument("--reextract", metavar="DIR", type=Path,
+                        help="regenera el dataset desde las páginas archivadas en DIR, sin navegador")
+    parser.add_argument("--jobs", metavar="FILE", type=Path,
+                        help="spec JSON con varias búsquedas a recorrer en paralelo")
+    parser.add_argument("--workers", type=int,
+                        help="procesos para --reextract (por defecto, uno por núcleo) o "
+                             "navegadores simultáneos para --jobs")
+    parser.add_argument("--coordinator", metavar="QUEUE", type=Path,
+                        help="encola los listados en la base SQLite QUEUE y espera a los workers")
+    parser.add_argument("--worker", metavar="QUEUE", type=Path,
+                        help="analiza listados tomados de la base SQLite QUEUE")
+    parser.add_argument("--lease-seconds", type=float, default=300,
+                        help="duración del lease de cada listado para --worker")
+    parser.add_argument("--poll-interval", type=float, default=5,
+                        help="segundos entre consultas a la cola cuando no hay tareas")
+    parser.add_argument("--idle-timeout", type=float,
+                        help="el worker termina tras estos segundos sin tareas (por defecto, "
+                             "solo cuando la cola está terminada)")
+    parser.add_argument("--deadline", type=float,
+                        help="segundos máximos que el coordinador espera a los workers")
+    parser.add_argument("--stall-timeout", type=float, default=1800,
+                        help="el coordinador deja de esperar tras estos segundos sin progreso")
+    parser.add_argument("--resume", action="store_true",
+                        help="con --coordinator, sigue la corrida anterior de la cola sin "
+                             "volver a analizar los listados completados")
+    parser.add_argument("--price-calendar", metavar="CSV", type=Path,
+                        help="precios de varias estadías para cada listado del CSV")
+    parser.add_argument("--start", default=date.today().isoformat(),
+                        help="primer check-in para --price-calendar (AAAA-MM-DD)")
+    parser.add_argument("--windows", type=int, default=8, help="cantidad de estadías por listado")
+    parser.add_argument("--nights", type=int, default=3, help="noches de cada estadía")
+    parser.add_argument("--step", type=int, default=7, help="días entre check-ins")
+    parser.add_argument("--prices-output", default="price_matrix.npz",
+                        help="archivo .npz de la matriz de precios")
+    parser.add_argument("--output", default="airbnb_data.csv", help="CSV de salida")
+    args = parser.parse_args()
+
+    setup_logging()
+    # Métricas: archivo en formato Prometheus y, opcionalmente, endpoint /metrics
+    metrics_file = os.environ.get("METRICS_FILE", "crawl_metrics.prom")
+    if os.environ.get("METRICS_PORT"):
+        start_http_server(metrics, int(os.environ["METRICS_PORT"]))
+
+    try:
+        if args.reextract:
+            reextract_archive(args.reextract, args.workers, args.output)
+        elif args.price_calendar:
+            windows = stay_windows(args.start, args.windows, args.nights, args.step)
+            price_calendar(read_listing_links(args.price_calendar), windows, args.prices_output)
+        elif args.worker:
+            run_worker(args.worker, poll_interval=args.poll_interval,
+                       idle_timeout=args.idle_timeout, lease_seconds=args.lease_seconds)
+        elif args.coordinator:
+            search_urls = [job.search_url() for job in load_jobs(args.jobs)[0]] if args.jobs else [search_url]
+            coordinate(search_urls, args.coordinator, args.output, poll_interval=args.poll_interval,
+                       deadline=args.deadline, stall_timeout=args.stall_timeout,
+                       resume=args.resume)
+        elif args.jobs:
+            jobs, budget = load_jobs(args.jobs)
+            crawl_jobs(jobs, args.workers or budget or 2)
+        else:
+            crawl(search_url, args.output)
+    finally:
+        metrics.write(metrics_file)
+        logger.info("Tiempos por etapa (métricas en %s):\n%s", metrics_file, metrics.summary())
@@ -9,5 +9,7 @@ setup(
         "dash",
         "pandas",
         "plotly",
+        "Flask-Compress",
+        "orjson",
     ],
 ) 
\ No newline at end of file
@@ -2,10 +2,28 @@ from .theme import StayBATheme
 
 class BaseChart:
     """Clase base para todos los gráficos"""
+    # A partir de este número de filas se activa el modo de datos grandes
+    LARGE_DATA_THRESHOLD = 20_000
+    # Máximo de puntos que se envían al navegador en modo de datos grandes
+    MAX_POINTS = 20_000
+
     def __init__(self, template="plotly_white"):
         self.template = template
         self.theme = StayBATheme()
 
+    def is_large(self, data):
+        """Indica si los datos superan el umbral de modo de datos grandes"""
+        return len(data) > self.LARGE_DATA_THRESHOLD
+
+    @staticmethod
+    def used_columns(data, *candidates):
+        """Columnas de `data` referenciadas por nombre en los argumentos del gráfico"""
+        columns = []
+        for candidate in candidates:
+            if isinstance(candidate, str) and candidate in data.columns and candidate not in columns:
+                columns.append(candidate)
+        return columns
+
     def update_layout(self, fig, title):
         layout = self.theme.get_default_layout()
         layout['title'] = {'text': title, **layout['title']}
@@ -1,21 +1,33 @@
 import plotly.express as px
+import plotly.graph_objects as go
 from .base import BaseChart
-import pandas as pd
+from .summary import box_summary, histogram_summary, kde_grid
+import numpy as np
+from src.data.processor import DataProcessor
 
 class DistributionChart(BaseChart):
     """Implementación de gráficos de distribución (BoxPlot, Violin)"""
+    PRICE_RANGE_COLORS = [
+        '#E85C3F',  # Rango más bajo
+        '#FF8B6A',  # Rango bajo
+        '#FFB347',  # Rango medio
+        '#98D8AA',  # Rango alto
+        '#4CAF50'   # Rango más alto
+    ]
+
     def create_boxplot(self, data, x, y, title, subtitle=None, color=None, **kwargs):
-        # Crear bins de precio para agrupar
-        df = data.copy()
-        
-        # Calcular los rangos de precio
-        price_bins = pd.qcut(df['price_original'], q=5)
-        # Crear etiquetas con los rangos de precio reales
-        df['price_range'] = price_bins.apply(lambda x: f"${x.left:.0f} - ${x.right:.0f}")
-        
-        # Ordenar las categorías por precio
-        category_order = sorted(df['price_range'].unique(), 
-                              key=lambda x: float(x.split(' - ')[0].replace('$', '')))
+        # Usar los rangos de precio precalculados al cargar el dataset
+        if 'price_range' in data.columns:
+            df = data
+        else:
+            df = data.assign(price_range=DataProcessor.price_bins(data['price_original']))
+
+        # Ordenar las categorías presentes por precio (vía códigos, sin trabajo por fila)
+        price_range = df['price_range'].cat
+        codes = price_range.codes.to_numpy()
+        present = np.bincount(codes[codes >= 0],
+                              minlength=len(price_range.categories)) > 0
+        category_order = list(price_range.categories[present])
         
         # Configurar opciones
         plot_kwargs = {
@@ -25,20 +37,17 @@ class DistributionChart(BaseChart):
             'template': self.template,
             'color': 'price_range',
             'category_orders': {'price_range': category_order},
-            'color_discrete_sequence': [
-                '#E85C3F',  # Rango más bajo
-                '#FF8B6A',  # Rango bajo
-                '#FFB347',  # Rango medio
-                '#98D8AA',  # Rango alto
-                '#4CAF50'   # Rango más alto
-            ]
+            'color_discrete_sequence': self.PRICE_RANGE_COLORS
         }
         
         # Agregar kwargs adicionales
         plot_kwargs.update(kwargs)
         
-        # Crear figura
-        fig = px.box(**plot_kwargs)
+        # Crear figura (con datos grandes se envían solo las estadísticas)
+        if self.is_large(df):
+            fig = self._aggregated_boxplot(df, y, category_order, kwargs.get('labels', {}))
+        else:
+            fig = px.box(**plot_kwargs)
         
         # Actualizar el layout
         title_text = f"{title}<br><span style='font-size: 14px; color: gray'>{subtitle}</span>" if subtitle else title
@@ -59,7 +68,7 @@ class DistributionChart(BaseChart):
 
     def create_histogram(self, data, x, title, subtitle=None, **kwargs):
         """Crea un histograma con curva de densidad"""
-        df = data.copy()
+        df = data
         
         plot_kwargs = {
             'data_frame': df,
@@ -75,8 +84,11 @@ class DistributionChart(BaseChart):
         # Agregar kwargs adicionales
         plot_kwargs.update(kwargs)
         
-        # Crear figura
-        fig = px.histogram(**plot_kwargs)
+        # Crear figura (con datos grandes se envían solo los conteos y la KDE)
+        if self.is_large(df):
+            fig = self._aggregated_histogram(df, x, plot_kwargs)
+        else:
+            fig = px.histogram(**plot_kwargs)
         
         # Actualizar el layout
         title_text = f"{title}<br><span style='font-size: 14px; color: gray'>{subtitle}</span>" if subtitle else title
@@ -93,4 +105,60 @@ class DistributionChart(BaseChart):
             yaxis_title="Porcentaje de propiedades",
         )
         
-        return self.update_layout(fig, title_text) 
\ No newline at end of file
+        return self.update_layout(fig, title_text)
+
+    def _aggregated_boxplot(self, df, y, category_order, labels):
+        """Boxplot construido con cuartiles calculados en el servidor"""
+        codes = df['price_range'].cat.codes.to_numpy()
+        values = df[y].to_numpy(dtype=np.float64, na_value=np.nan)
+        categories = list(df['price_range'].cat.categories)
+        fig = go.Figure()
+        for position, label in enumerate(category_order):
+            color = self.PRICE_RANGE_COLORS[position % len(self.PRICE_RANGE_COLORS)]
+            group = values[codes == categories.index(label)]
+            summary = box_summary(group[~np.isnan(group)])
+            if summary is None:
+                continue
+            fig.add_trace(go.Box(
+                x=[label], name=label, marker_color=color, boxpoints=False,
+                q1=[summary['q1']], median=[summary['median']], q3=[summary['q3']],
+                lowerfence=[summary['lowerfence']], upperfence=[summary['upperfence']],
+                mean=[summary['mean']]
+            ))
+            fig.add_trace(go.Scatter(
+                x=[label] * len(summary['outliers']), y=summary['outliers'],
+                mode='markers', marker=dict(color=color, size=4), name=label
+            ))
+        fig.update_layout(
+            template=self.template,
+            xaxis=dict(categoryorder='array', categoryarray=category_order),
+            yaxis_title=labels.get(y, y)
+        )
+        return fig
+
+    def _aggregated_histogram(self, df, x, plot_kwargs):
+        """Histograma de probabilidad con bins fijos y violín de KDE precalculada"""
+        values = df[x].to_numpy(dtype=np.float64, na_value=np.nan)
+        values = values[~np.isnan(values)]
+        color = plot_kwargs['color_discrete_sequence'][0]
+        histogram = histogram_summary(values, bins=plot_kwargs['nbins'])
+        kde = kde_grid(values)
+        # Violín horizontal: la densidad reflejada alrededor de cero
+        violin_x = np.concatenate([kde['x'], kde['x'][::-1]])
+        violin_y = np.concatenate([kde['density'], -kde['density'][::-1]])
+
+        fig = go.Figure([
+            go.Bar(x=histogram['centers'], y=histogram['probability'],
+                   width=histogram['widths'], marker_color=color,
+                   opacity=plot_kwargs['opacity'], xaxis='x', yaxis='y'),
+            go.Scatter(x=violin_x, y=violin_y, fill='toself', mode='lines',
+                       line=dict(color=color), xaxis='x2', yaxis='y2')
+        ])
+        fig.update_layout(
+            template=self.template,
+            xaxis=dict(domain=[0, 1], title=plot_kwargs.get('labels', {}).get(x, x)),
+            yaxis=dict(domain=[0, 0.7379]),
+            xaxis2=dict(domain=[0, 1], matches='x', anchor='y2', showticklabels=False),
+            yaxis2=dict(domain=[0.7479, 1], anchor='x2', showticklabels=False, showgrid=False)
+        )
+        return fig
@@ -0,0 +1,53 @@
+import numpy as np
+import plotly.graph_objects as go
+from .base import BaseChart
+
+# Plotly >= 5.24 usa MapLibre (Scattermap); versiones anteriores Scattermapbox
+if hasattr(go, "Scattermap"):
+    MapTrace, MAP_LAYOUT_KEY = go.Scattermap, "map"
+else:
+    MapTrace, MAP_LAYOUT_KEY = go.Scattermapbox, "mapbox"
+
+
+class MapChart(BaseChart):
+    """Mapa de listados (puntos individuales o clusters calculados en el servidor)"""
+    # Centro por defecto: Microcentro, Buenos Aires
+    DEFAULT_CENTER = {"lat": -34.6037, "lon": -58.3816}
+
+    def create(self, points, title, subtitle=None, clustered=False, center=None, zoom=13):
+        if clustered:
+            trace = MapTrace(
+                lat=points["latitude"], lon=points["longitude"], mode="markers",
+                marker=dict(
+                    size=np.clip(6 + 4 * np.log2(points["count"]), 6, 40),
+                    color=points["price_mean"],
+                    colorscale=[[0, self.theme.COLORS['primary']], [1, '#4CAF50']],
+                    showscale=True,
+                    colorbar=dict(title="Precio prom.")
+                ),
+                text=[f"{count} listados · ${price:.0f} prom."
+                      for count, price in zip(points["count"], points["price_mean"])],
+                hoverinfo="text"
+            )
+        else:
+            trace = MapTrace(
+                lat=points["latitude"], lon=points["longitude"], mode="markers",
+                marker=dict(size=8, color=points["price_original"],
+                            colorscale=[[0, self.theme.COLORS['primary']], [1, '#4CAF50']],
+                            showscale=True, colorbar=dict(title="Precio")),
+                text=[f"${price:.0f} por noche" for price in points["price_original"]],
+                hoverinfo="text"
+            )
+
+        fig = go.Figure(trace)
+        title_text = f"{title}<br><span style='font-size: 14px; color: gray'>{subtitle}</span>" if subtitle else title
+        fig.update_layout(**{
+            MAP_LAYOUT_KEY: dict(style="open-street-map", center=center or self.DEFAULT_CENTER, zoom=zoom),
+            # Conserva el zoom/paneo del usuario entre actualizaciones
+            "uirevision": "listings-map",
+            "template": self.template,
+            "height": 600,
+        })
+        fig = self.update_layout(fig, title_text)
+        fig.update_layout(margin=dict(l=0, r=0, t=70, b=0))
+        return fig
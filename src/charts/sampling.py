@@ -0,0 +1,75 @@
+import numpy as np
+import pandas as pd
+
+
+def density_sample(df: pd.DataFrame, x: str, y: str, max_points: int,
+                   bins: int = 64, seed: int = 0) -> pd.DataFrame:
+    """Submuestrea un scatter preservando la forma de la distribución.
+
+    Divide el plano (x, y) en una grilla de `bins` x `bins` celdas y muestrea
+    cada celda con probabilidad proporcional al tamaño de la muestra, pero
+    garantizando en promedio al menos un punto por celda ocupada, de modo que
+    las zonas poco densas y los valores extremos no desaparecen. El resultado
+    nunca supera `max_points` filas.
+    """
+    total = len(df)
+    if total <= max_points:
+        return df
+
+    x_values = df[x].to_numpy(dtype=np.float64, na_value=np.nan)
+    y_values = df[y].to_numpy(dtype=np.float64, na_value=np.nan)
+    valid = ~(np.isnan(x_values) | np.isnan(y_values))
+
+    cells = (_bin_index(x_values, valid, bins) * bins
+             + _bin_index(y_values, valid, bins))
+    counts = np.bincount(cells[valid], minlength=bins * bins)
+
+    # Probabilidad por celda: tasa global, con piso de 1 punto esperado por celda
+    base_rate = max_points / valid.sum()
+    with np.errstate(divide="ignore"):
+        probability = np.minimum(1.0, np.maximum(base_rate, 1.0 / counts))
+
+    # El piso por celda suma puntos: se escala para que el esperado sea max_points
+    expected = float((counts * probability).sum())
+    if expected > max_points:
+        probability *= max_points / expected
+
+    rng = np.random.default_rng(seed)
+    draws = rng.random(total)
+    row_probability = probability[cells]
+    keep = np.flatnonzero(valid & (draws < row_probability))
+    if keep.size > max_points:
+        # Exceso aleatorio: se descartan primero puntos de las celdas más densas
+        order = np.lexsort((draws[keep], -row_probability[keep]))
+        keep = np.sort(keep[order[:max_points]])
+    return df.iloc[keep]
+
+
+def _bin_index(values: np.ndarray, valid: np.ndarray, bins: int) -> np.ndarray:
+    """Índice de celda (0..bins-1) de cada valor dentro de su rango"""
+    low = values[valid].min() if valid.any() else 0.0
+    high = values[valid].max() if valid.any() else 0.0
+    span = (high - low) or 1.0
+    values = np.where(valid, values, low)
+    index = ((values - low) / span * (bins - 1)).astype(np.int64, copy=False)
+    return np.clip(index, 0, bins - 1)
+
+
+def compact_numeric(df: pd.DataFrame, columns) -> pd.DataFrame:
+    """Reduce a enteros del menor tamaño las columnas numéricas con valores enteros.
+
+    Sin pérdida: las columnas con decimales o faltantes quedan igual. Con
+    plotly >= 6 los arrays viajan en binario (base64), así que un int16 ocupa
+    la cuarta parte que un float64.
+    """
+    converted = {}
+    for column in columns:
+        values = df[column]
+        if not pd.api.types.is_numeric_dtype(values) or pd.api.types.is_bool_dtype(values):
+            continue
+        compact = pd.to_numeric(values, downcast="integer")
+        # Solo dtypes de numpy: los nullable de pandas no se codifican en binario
+        if isinstance(compact.dtype, np.dtype) and compact.dtype.kind in "iu" \
+                and compact.dtype != values.dtype:
+            converted[column] = compact
+    return df.assign(**converted) if converted else df
@@ -1,16 +1,29 @@
 import plotly.express as px
 from .base import BaseChart
+from .sampling import compact_numeric, density_sample
 import numpy as np
 import pandas as pd
 
 class ScatterChart(BaseChart):
     """Implementación de gráficos de dispersión"""
     def create(self, data, x, y, title, subtitle=None, color=None, size=None, **kwargs):
-        # Limpiar datos no numéricos
-        df = data.copy()
+        # Limpiar datos no numéricos: solo se materializan las columnas usadas
+        df = data
         if isinstance(x, str) and x in ["guests", "beds", "bedrooms", "baths"]:
-            df[x] = pd.to_numeric(df[x], errors='coerce')
-            df = df.dropna(subset=[x])
+            numeric_x = pd.to_numeric(data[x], errors='coerce')
+            valid = numeric_x.notna().to_numpy()
+            columns = self.used_columns(data, x, y, color, size, *kwargs.values())
+            df = data.loc[valid, columns].assign(**{x: numeric_x[valid]})
+
+        # Modo de datos grandes: submuestreo por densidad y render WebGL
+        large_data = self.is_large(df) and isinstance(x, str) and isinstance(y, str)
+        if large_data:
+            total_points = len(df)
+            df = density_sample(df, x, y, self.MAX_POINTS)
+            # Enteros compactos: menos bytes por punto en la respuesta
+            df = compact_numeric(df, self.used_columns(df, x, y, color, size))
+            sample_note = f"Muestra de {len(df):,} de {total_points:,} propiedades"
+            subtitle = f"{subtitle} · {sample_note}" if subtitle else sample_note
 
         # Configurar opciones por defecto
         plot_kwargs = {
@@ -20,6 +33,8 @@ class ScatterChart(BaseChart):
             'template': self.template,
             'opacity': 0.7,  # Agregar transparencia
         }
+        if large_data:
+            plot_kwargs['render_mode'] = 'webgl'
 
         # Agregar color si se especifica
         if color is not None:
@@ -45,13 +60,14 @@ class ScatterChart(BaseChart):
         # Crear figura
         fig = px.scatter(**plot_kwargs)
         
-        # Actualizar el layout y marcadores
-        fig.update_traces(
-            marker=dict(
-                line=dict(width=1, color='DarkSlateGrey'),
-            ),
-            selector=dict(mode='markers')
-        )
+        # Actualizar el layout y marcadores (el borde por punto es caro en WebGL)
+        if not large_data:
+            fig.update_traces(
+                marker=dict(
+                    line=dict(width=1, color='DarkSlateGrey'),
+                ),
+                selector=dict(mode='markers')
+            )
 
         # Si la variable x es "rating" o variables enteras, ajustar ejes
         if isinstance(x, str):
@@ -61,7 +77,7 @@ class ScatterChart(BaseChart):
                     dtick=0.2,
                     tickformat=".1f"
                 )
-            elif x in ["guests", "beds", "bedrooms", "baths"]:
+            elif x in ["guests", "beds", "bedrooms", "baths"] and not df.empty:
                 max_val = int(df[x].max())
                 min_val = 1 if x == "guests" else 0
                 fig.update_xaxes(
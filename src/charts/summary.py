@@ -0,0 +1,58 @@
+import numpy as np
+
+
+def box_summary(values: np.ndarray, max_outliers: int = 200, seed: int = 0) -> dict:
+    """Estadísticas de un boxplot (cuartiles, bigotes de Tukey y outliers muestreados)"""
+    if values.size == 0:
+        return None
+    q1, median, q3 = np.percentile(values, [25, 50, 75])
+    iqr = q3 - q1
+    inside = values[(values >= q1 - 1.5 * iqr) & (values <= q3 + 1.5 * iqr)]
+    outliers = values[(values < q1 - 1.5 * iqr) | (values > q3 + 1.5 * iqr)]
+    if outliers.size > max_outliers:
+        rng = np.random.default_rng(seed)
+        outliers = rng.choice(outliers, size=max_outliers, replace=False)
+    return {
+        "q1": float(q1),
+        "median": float(median),
+        "q3": float(q3),
+        "lowerfence": float(inside.min()),
+        "upperfence": float(inside.max()),
+        "mean": float(values.mean()),
+        "outliers": outliers,
+    }
+
+
+def histogram_summary(values: np.ndarray, bins: int = 30) -> dict:
+    """Conteos por bin fijo, normalizados como probabilidad"""
+    counts, edges = np.histogram(values, bins=bins)
+    total = counts.sum()
+    return {
+        "centers": (edges[:-1] + edges[1:]) / 2,
+        "widths": np.diff(edges),
+        "probability": counts / total if total else counts.astype(np.float64),
+    }
+
+
+def kde_grid(values: np.ndarray, points: int = 200, grid_bins: int = 1024) -> dict:
+    """Densidad KDE gaussiana evaluada en una grilla fija.
+
+    Se aproxima binneando los datos y convolucionando con el kernel, así el
+    costo es O(n + grilla) en lugar de O(n * grilla).
+    """
+    if values.size < 2 or values.min() == values.max():
+        center = float(values[0]) if values.size else 0.0
+        return {"x": np.array([center]), "density": np.array([1.0])}
+    # Ancho de banda de Scott
+    bandwidth = 1.06 * values.std() * values.size ** (-1 / 5) or 1.0
+    low, high = values.min() - 3 * bandwidth, values.max() + 3 * bandwidth
+    counts, edges = np.histogram(values, bins=grid_bins, range=(low, high))
+    step = edges[1] - edges[0]
+    half_width = min(int(np.ceil(4 * bandwidth / step)), grid_bins // 2 - 1)
+    offsets = np.arange(-half_width, half_width + 1) * step
+    kernel = np.exp(-0.5 * (offsets / bandwidth) ** 2)
+    density = np.convolve(counts, kernel, mode="same")
+    density /= density.sum() * step
+    centers = (edges[:-1] + edges[1:]) / 2
+    grid = np.linspace(low, high, points)
+    return {"x": grid, "density": np.interp(grid, centers, density)}
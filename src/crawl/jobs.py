@@ -0,0 +1,79 @@
+import json
+from pathlib import Path
+from urllib.parse import quote, urlencode
+
+SEARCH_BASE_URL = "https://www.airbnb.com.ar/s/{query}/homes"
+
+
+class SearchJob:
+    """Una búsqueda a recorrer: zona (consulta y/o recuadro), fechas y prioridad"""
+    def __init__(self, name: str, query: str = None, bbox=None, checkin: str = None,
+                 checkout: str = None, adults: int = 2, priority: float = 1,
+                 output: str = None, url: str = None):
+        if not (query or bbox or url):
+            raise ValueError(f"El trabajo {name!r} necesita 'query', 'bbox' o 'url'")
+        if priority <= 0:
+            raise ValueError(f"La prioridad del trabajo {name!r} debe ser positiva")
+        self.name = name
+        self.query = query
+        self.bbox = tuple(bbox) if bbox else None
+        self.checkin = checkin
+        self.checkout = checkout
+        self.adults = adults
+        self.priority = priority
+        self.output = output or f"airbnb_{name}.csv"
+        self.url = url
+
+    def search_url(self) -> str:
+        """URL de búsqueda de Airbnb (la `url` explícita del spec tiene precedencia)"""
+        if self.url:
+            return self.url
+        params = {"refinement_paths[]": "/homes", "adults": self.adults,
+                  "search_mode": "regular_search"}
+        if self.query:
+            params["query"] = self.query
+        if self.checkin and self.checkout:
+            params.update(checkin=self.checkin, checkout=self.checkout, date_picker_type="calendar")
+        if self.bbox:
+            sw_lat, sw_lng, ne_lat, ne_lng = self.bbox
+            params.update(ne_lat=ne_lat, ne_lng=ne_lng, sw_lat=sw_lat, sw_lng=sw_lng,
+                          search_by_map="true", search_type="user_map_move")
+        return f"{SEARCH_BASE_URL.format(query=quote(self.query or 'homes'))}?{urlencode(params)}"
+
+
+def expand_job(spec: dict, defaults: dict = None) -> list:
+    """Convierte una entrada del spec en trabajos: uno por rango de fechas de `dates`"""
+    spec = {**(defaults or {}), **spec}
+    dates = spec.pop("dates", None)
+    if not dates:
+        return [SearchJob(**spec)]
+    jobs = []
+    for checkin, checkout in dates:
+        name = f"{spec['name']}-{checkin}"
+        output = spec.get("output")
+        if output:
+            path = Path(output)
+            output = str(path.with_name(f"{path.stem}-{checkin}{path.suffix}"))
+        jobs.append(SearchJob(**{**spec, "name": name, "checkin": checkin,
+                                 "checkout": checkout, "output": output}))
+    return jobs
+
+
+def load_jobs(path) -> tuple:
+    """Lee el spec JSON de trabajos; devuelve (trabajos, presupuesto de workers o None).
+
+    Formato:
+        {"workers": 3,
+         "defaults": {"adults": 2},
+         "jobs": [{"name": "microcentro", "query": "Microcentro",
+                   "bbox": [sw_lat, sw_lng, ne_lat, ne_lng],
+                   "dates": [["2025-01-16", "2025-01-19"]], "priority": 2}]}
+    """
+    spec = json.loads(Path(path).read_text(encoding="utf-8"))
+    defaults = spec.get("defaults", {})
+    jobs = [job for entry in spec["jobs"] for job in expand_job(entry, defaults)]
+    names = [job.name for job in jobs]
+    duplicated = sorted({name for name in names if names.count(name) > 1})
+    if duplicated:
+        raise ValueError(f"Nombres de trabajo repetidos: {', '.join(duplicated)}")
+    return jobs, spec.get("workers")
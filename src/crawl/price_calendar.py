@@ -0,0 +1,72 @@
+from datetime import date, timedelta
+from pathlib import Path
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+import numpy as np
+
+# Campos de extract_price_info que se guardan por ventana de estadía
+PRICE_FIELDS = ("price_original", "nights", "total_nights", "special_offer",
+                "cleaning_fee", "service_fee", "total")
+
+
+def stay_windows(start: str, count: int, nights: int = 3, step: int = 7) -> list:
+    """`count` estadías de `nights` noches, con check-in cada `step` días desde `start`"""
+    first = date.fromisoformat(start)
+    return [
+        (first + timedelta(days=offset), first + timedelta(days=offset + nights))
+        for offset in range(0, count * step, step)
+    ]
+
+
+def with_stay_dates(url: str, checkin: date, checkout: date) -> str:
+    """URL del listado con las fechas de la estadía (parámetros check_in / check_out)"""
+    parts = urlsplit(url)
+    query = [(key, value) for key, value in parse_qsl(parts.query) if key not in ("check_in", "check_out")]
+    query += [("check_in", checkin.isoformat()), ("check_out", checkout.isoformat())]
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+
+class PriceMatrix:
+    """Precios por listado y ventana de estadía: array (listados, ventanas, PRICE_FIELDS).
+
+    Los valores no obtenidos quedan en NaN. Se guarda comprimido en un .npz
+    junto con los ids de habitación y las fechas de cada ventana.
+    """
+    def __init__(self, room_ids, windows):
+        self.room_ids = list(room_ids)
+        self.windows = list(windows)
+        self.values = np.full((len(self.room_ids), len(self.windows), len(PRICE_FIELDS)),
+                              np.nan, dtype=np.float32)
+
+    def set(self, listing: int, window: int, prices: dict):
+        for position, field in enumerate(PRICE_FIELDS):
+            value = prices.get(field)
+            # scrape_price_windows deja en None lo no encontrado; "0" es un precio real
+            if value not in (None, ""):
+                self.values[listing, window, position] = float(value)
+
+    def field(self, name: str) -> np.ndarray:
+        """Matriz (listados, ventanas) de un campo"""
+        return self.values[:, :, PRICE_FIELDS.index(name)]
+
+    def save(self, path) -> Path:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        np.savez_compressed(
+            path,
+            prices=self.values,
+            room_ids=np.array(self.room_ids, dtype=str),
+            checkin=np.array([checkin for checkin, _ in self.windows], dtype="datetime64[D]"),
+            checkout=np.array([checkout for _, checkout in self.windows], dtype="datetime64[D]"),
+            fields=np.array(PRICE_FIELDS),
+        )
+        # np.savez agrega la extensión si falta
+        return path if path.suffix == ".npz" else path.with_name(f"{path.name}.npz")
+
+    @classmethod
+    def load(cls, path) -> "PriceMatrix":
+        with np.load(path) as data:
+            windows = [(checkin.item(), checkout.item())
+                       for checkin, checkout in zip(data["checkin"], data["checkout"])]
+            matrix = cls(data["room_ids"].tolist(), windows)
+            matrix.values = data["prices"]
+        return matrix
@@ -0,0 +1,99 @@
+import logging
+import threading
+from collections import deque
+
+logger = logging.getLogger("scraper")
+
+
+class _Queue:
+    """Cola de tareas de un trabajo con su peso y su tiempo virtual"""
+    def __init__(self, name, weight, on_done):
+        self.name = name
+        self.weight = weight
+        self.on_done = on_done
+        self.tasks = deque()
+        self.running = 0
+        self.virtual_time = 0.0
+
+
+class FairScheduler:
+    """Ejecuta las tareas de varios trabajos con un presupuesto global de workers.
+
+    Cada trabajo tiene su propia cola. El próximo slot libre va a la cola con
+    menor tiempo virtual (tareas despachadas / peso): con pesos iguales es un
+    round-robin, y un trabajo de peso 2 recibe el doble de slots sin dejar sin
+    turno a los demás. Las tareas pueden encolar nuevas tareas mientras corren.
+    """
+    def __init__(self, workers: int):
+        self.workers = max(1, workers)
+        self._queues = {}
+        self._condition = threading.Condition()
+        self._running = 0
+        self._errors = 0
+
+    def add_queue(self, name: str, weight: float = 1, on_done=None):
+        """Registra un trabajo; `on_done()` se llama cuando no le quedan tareas"""
+        with self._condition:
+            # Un trabajo nuevo arranca al nivel de los activos (sin ráfaga acumulada)
+            active = [queue.virtual_time for queue in self._queues.values() if queue.tasks or queue.running]
+            queue = self._queues[name] = _Queue(name, weight, on_done)
+            queue.virtual_time = min(active, default=0.0)
+
+    def submit(self, name: str, func, *args):
+        with self._condition:
+            self._queues[name].tasks.append((func, args))
+            self._condition.notify()
+
+    def pending(self) -> int:
+        with self._condition:
+            return sum(len(queue.tasks) for queue in self._queues.values()) + self._running
+
+    def _next_task(self):
+        """Toma la tarea de la cola con menor tiempo virtual (el empate lo gana el orden de alta)"""
+        ready = [queue for queue in self._queues.values() if queue.tasks]
+        if not ready:
+            return None
+        queue = min(ready, key=lambda queue: queue.virtual_time)
+        queue.virtual_time += 1 / queue.weight
+        queue.running += 1
+        self._running += 1
+        func, args = queue.tasks.popleft()
+        return queue, func, args
+
+    def _worker(self):
+        while True:
+            with self._condition:
+                task = self._next_task()
+                while task is None:
+                    if not self._running:
+                        return
+                    self._condition.wait()
+                    task = self._next_task()
+            queue, func, args = task
+            self._call(queue, func, *args)
+            with self._condition:
+                queue.running -= 1
+                self._running -= 1
+                finished = not queue.tasks and not queue.running
+                self._condition.notify_all()
+            if finished and queue.on_done is not None:
+                self._call(queue, queue.on_done)
+
+    def _call(self, queue, func, *args):
+        """Ejecuta una tarea o el on_done de una cola; un error se registra sin matar al worker"""
+        try:
+            func(*args)
+        except Exception as e:
+            logger.exception("Error en una tarea de %s: %s", queue.name, e)
+            with self._condition:
+                self._errors += 1
+
+    def run(self) -> int:
+        """Procesa las colas hasta vaciarlas; devuelve la cantidad de tareas con error"""
+        threads = [threading.Thread(target=self._worker, name=f"crawl-worker-{i}", daemon=True)
+                   for i in range(self.workers)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return self._errors
@@ -0,0 +1,165 @@
+import json
+import sqlite3
+import time
+from pathlib import Path
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    key TEXT PRIMARY KEY,
+    url TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    owner TEXT,
+    lease_expires REAL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    result TEXT,
+    error TEXT
+);
+CREATE INDEX IF NOT EXISTS tasks_status ON tasks (status, lease_expires);
+CREATE TABLE IF NOT EXISTS state (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+class WorkQueue:
+    """Cola de trabajo compartida con leases, respaldada en SQLite.
+
+    Entrega al menos una vez: una tarea tomada con `lease` vuelve a estar
+    disponible si su lease vence sin `complete` (el worker murió o quedó
+    colgado). Las tareas se deduplican por clave (el id de habitación) y solo
+    se guarda el primer resultado de cada una.
+
+    El coordinador llama a `seal` cuando terminó de encolar: a partir de ahí
+    `drained` indica que no queda nada por hacer y los workers pueden salir.
+    `reset` vacía la cola para una corrida nueva (si no, las claves ya
+    completadas se ignoran al encolar y se reusan sus resultados).
+
+    Varios procesos (o nodos con el archivo en un disco compartido con locks
+    confiables) pueden usar la misma base: cada operación es una transacción
+    `BEGIN IMMEDIATE`.
+    """
+    def __init__(self, path, lease_seconds: float = 300, max_attempts: int = 3):
+        self.path = Path(path)
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self._connection = sqlite3.connect(self.path, timeout=60, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.executescript(SCHEMA)
+
+    def _transaction(self):
+        self._connection.execute("BEGIN IMMEDIATE")
+        return self._connection
+
+    def put_many(self, items) -> int:
+        """Encola pares (clave, url); ignora claves ya vistas. Devuelve cuántas se agregaron"""
+        connection = self._transaction()
+        try:
+            before = connection.total_changes
+            connection.executemany("INSERT OR IGNORE INTO tasks (key, url) VALUES (?, ?)", items)
+            added = connection.total_changes - before
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        return added
+
+    def reset(self):
+        """Borra las tareas, sus resultados y el cierre de la corrida anterior"""
+        connection = self._transaction()
+        try:
+            connection.execute("DELETE FROM tasks")
+            connection.execute("DELETE FROM state")
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+
+    def put(self, key: str, url: str) -> bool:
+        return self.put_many([(key, url)]) == 1
+
+    def lease(self, owner: str):
+        """Toma una tarea pendiente (o con lease vencido); devuelve (clave, url) o None"""
+        now = time.time()
+        connection = self._transaction()
+        try:
+            row = connection.execute(
+                "SELECT key, url FROM tasks WHERE (status = 'pending' "
+                "OR (status = 'leased' AND lease_expires < ?)) AND attempts < ? "
+                "ORDER BY rowid LIMIT 1",
+                (now, self.max_attempts),
+            ).fetchone()
+            if row is not None:
+                connection.execute(
+                    "UPDATE tasks SET status = 'leased', owner = ?, lease_expires = ?, "
+                    "attempts = attempts + 1 WHERE key = ?",
+                    (owner, now + self.lease_seconds, row[0]),
+                )
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        return tuple(row) if row is not None else None
+
+    def extend(self, key: str, owner: str) -> bool:
+        """Renueva el lease de una tarea larga; False si ya no pertenece a `owner`"""
+        cursor = self._connection.execute(
+            "UPDATE tasks SET lease_expires = ? WHERE key = ? AND owner = ? AND status = 'leased'",
+            (time.time() + self.lease_seconds, key, owner),
+        )
+        return cursor.rowcount == 1
+
+    def complete(self, key: str, owner: str, result: dict) -> bool:
+        """Guarda el resultado; False si la tarea ya estaba completa (entrega duplicada)"""
+        cursor = self._connection.execute(
+            "UPDATE tasks SET status = 'done', owner = ?, result = ?, lease_expires = NULL "
+            "WHERE key = ? AND status != 'done'",
+            (owner, json.dumps(result), key),
+        )
+        return cursor.rowcount == 1
+
+    def fail(self, key: str, owner: str, error: str):
+        """Devuelve la tarea a la cola, o la marca fallida si agotó los intentos"""
+        self._connection.execute(
+            "UPDATE tasks SET status = CASE WHEN attempts >= ? THEN 'failed' ELSE 'pending' END, "
+            "error = ?, lease_expires = NULL WHERE key = ? AND owner = ? AND status = 'leased'",
+            (self.max_attempts, error, key, owner),
+        )
+
+    def counts(self) -> dict:
+        """Cantidad de tareas por estado (las que agotaron intentos con lease vencido cuentan como fallidas)"""
+        rows = self._connection.execute(
+            "SELECT CASE WHEN status = 'leased' AND lease_expires < ? AND attempts >= ? "
+            "THEN 'failed' ELSE status END, COUNT(*) FROM tasks GROUP BY 1",
+            (time.time(), self.max_attempts),
+        ).fetchall()
+        return dict(rows)
+
+    def unfinished(self) -> int:
+        """Tareas que todavía pueden completarse (pendientes o con lease)"""
+        counts = self.counts()
+        return counts.get("pending", 0) + counts.get("leased", 0)
+
+    def seal(self, sealed: bool = True):
+        """Marca que no se van a encolar más tareas (`sealed=False` la reabre para otra corrida)"""
+        if sealed:
+            self._connection.execute("INSERT OR REPLACE INTO state (key, value) VALUES ('sealed', '1')")
+        else:
+            self._connection.execute("DELETE FROM state WHERE key = 'sealed'")
+
+    def sealed(self) -> bool:
+        return self._connection.execute("SELECT 1 FROM state WHERE key = 'sealed'").fetchone() is not None
+
+    def drained(self) -> bool:
+        """Cola cerrada y sin tareas pendientes ni con lease"""
+        return self.sealed() and not self.unfinished()
+
+    def results(self) -> list:
+        """Resultados completados, en el orden en que se encolaron las tareas"""
+        rows = self._connection.execute(
+            "SELECT result FROM tasks WHERE status = 'done' ORDER BY rowid"
+        ).fetchall()
+        return [json.loads(result) for result, in rows]
+
+    def close(self):
+        self._connection.close()
@@ -0,0 +1,25 @@
+import json
+from flask import Response, abort, request
+from src.dashboard.export import parse_filters
+
+
+def register_api_routes(server, store):
+    """Registra /api/rollups y /api/rollups/<nombre>: agregados precalculados en JSON"""
+    @server.route("/api/rollups")
+    def rollup_names():
+        return Response(json.dumps(store.snapshot.rollups.names()), mimetype="application/json")
+
+    @server.route("/api/rollups/<name>")
+    def rollup(name):
+        snapshot = store.snapshot
+        rollups = snapshot.rollups
+        if name not in rollups.tables:
+            abort(404)
+        values, ranges = parse_filters(snapshot.df, request.args)
+        if ranges:
+            abort(400, "Los rollups solo admiten filtros de selección")
+        result = rollups.query(name, **values)
+        # to_json convierte NaN en null (JSON válido)
+        return Response(result.to_json(orient="records"), mimetype="application/json")
+
+    return None
@@ -1,36 +1,242 @@
-from dash.dependencies import Input, Output
-from src.charts.scatter import ScatterChart
-from src.charts.distribution import DistributionChart
+from functools import lru_cache
+import numpy as np
+import pandas as pd
+from dash.dependencies import Input, Output, State
+from dash.exceptions import PreventUpdate
+from src.data.processor import DataProcessor
+from src.data.filter_index import FILTER_COLUMNS
+from src.data.spatial import LAT_COLUMN, LNG_COLUMN, cluster_points
+from src.dashboard.layout import RANGE_FILTERS, options_from_values, range_bounds
+from src.dashboard.export import export_query
+from src.dashboard.profiling import PROFILER
+from src.dashboard.serialization import figure_dicts
+
+# Gráficos que actualiza update_charts, en el orden en que build_charts los devuelve
+CHART_OUTPUTS = [
+    "reviews-price-chart",
+    "guests-total-chart",
+    "rating-total-chart",
+    "beds-total-chart",
+    "years-hosting-rating-chart",
+    "reviews-per-year-chart",
+    "reviews-per-year-heatmap-years",
+    "reviews-per-year-heatmap-price",
+]
+
+# Inputs de los filtros por rango, en el orden de RANGE_FILTERS
+RANGE_INPUTS = [Input(id_name, "value") for _, id_name, _, _ in RANGE_FILTERS]
+# Extremos actuales de cada RangeSlider: (mín, máx) por filtro, aplanados
+RANGE_BOUNDS = [State(id_name, prop) for _, id_name, _, _ in RANGE_FILTERS for prop in ("min", "max")]
+
+# Por encima de esta cantidad de puntos en el viewport, el mapa muestra clusters
+MAX_MAP_POINTS = 2_000
+
+def selection_key(value):
+    """Convierte una selección de Dash en una clave hashable para la cache"""
+    return tuple(value) if isinstance(value, list) else value
+
+def ranges_key(values, bounds=None):
+    """Agrupa los valores de los RangeSlider como ((columna, (mín, máx)), ...).
+
+    `bounds` son los extremos de cada slider (mín, máx, mín, máx, ...): un
+    slider en su rango completo no filtra, así no se descartan las filas sin
+    valor ni las que quedan fuera de extremos desactualizados.
+    """
+    bounds = bounds or [None] * (2 * len(RANGE_FILTERS))
+    key = []
+    for position, ((_, _, column, _), value) in enumerate(zip(RANGE_FILTERS, values)):
+        if not value:
+            continue
+        low, high = bounds[2 * position], bounds[2 * position + 1]
+        if low is not None and high is not None and value[0] <= low and value[1] >= high:
+            continue
+        key.append((column, tuple(value)))
+    return tuple(key)
+
+def slider_update(df, value, low, high):
+    """Nuevos (mín, máx, valor) de un slider tras recargar los datos.
+
+    Si estaba en su rango completo pasa al rango completo nuevo; si no,
+    se conserva la selección recortada a los extremos nuevos.
+    """
+    new_low, new_high = range_bounds(df)
+    if not value or low is None or high is None or (value[0] <= low and value[1] >= high):
+        return new_low, new_high, [new_low, new_high]
+    selection = [min(max(value[0], new_low), new_high), max(min(value[1], new_high), new_low)]
+    return new_low, new_high, selection
+
+def register_callbacks(app, store):
+    """Registra los callbacks; los datos se leen del `DataStore` en cada llamada"""
+    # Resultados cacheados por snapshot: una recarga de datos los invalida
+    @lru_cache(maxsize=32)
+    def cached_charts(snapshot, baths, bedrooms, beds, ranges, theme):
+        return figure_dicts(build_charts(snapshot.df, baths, bedrooms, beds, theme,
+                                         ranges=dict(ranges), indexes=snapshot.column_indexes,
+                                         rollups=snapshot.rollups))
+
+    @lru_cache(maxsize=64)
+    def cached_stats(snapshot, baths, bedrooms, beds, ranges):
+        return build_stats(snapshot.df, baths, bedrooms, beds,
+                           ranges=dict(ranges), indexes=snapshot.column_indexes)
+
+    def clear_caches(snapshot):
+        cached_charts.cache_clear()
+        cached_stats.cache_clear()
+
+    store.on_reload(clear_caches)
+
+    @app.callback(
+        [Output("data-version", "data"),
+         *[Output(id_name, prop) for _, id_name, _, _ in RANGE_FILTERS for prop in ("min", "max", "value")]],
+        [Input("data-version-interval", "n_intervals")],
+        [State("data-version", "data"),
+         *[State(id_name, prop) for _, id_name, _, _ in RANGE_FILTERS for prop in ("value", "min", "max")]]
+    )
+    def sync_data_version(n_intervals, current_version, *sliders):
+        snapshot = store.snapshot
+        if snapshot.version == current_version:
+            raise PreventUpdate
+        # Los sliders toman los extremos del dataset nuevo
+        outputs = [snapshot.version]
+        for position, (_, _, column, _) in enumerate(RANGE_FILTERS):
+            value, low, high = sliders[3 * position:3 * position + 3]
+            outputs.extend(slider_update(snapshot.df[column], value, low, high))
+        return outputs
+
+    @app.callback(
+        [Output("bathroom-filter", "options"),
+         Output("bedroom-filter", "options"),
+         Output("beds-filter", "options")],
+        [Input("bathroom-filter", "value"),
+         Input("bedroom-filter", "value"),
+         Input("beds-filter", "value"),
+         Input("data-version", "data")]
+    )
+    @PROFILER.callback("update_filter_options")
+    def update_filter_options(baths, bedrooms, beds, version):
+        # Cada dropdown solo ofrece valores con resultados dadas las otras selecciones
+        index = store.snapshot.filter_index
+        selections = {"baths": baths, "bedrooms": bedrooms, "beds": beds}
+        return [
+            options_from_values(index.options(column, **selections))
+            for column in FILTER_COLUMNS
+        ]
+
+    @app.callback(
+        [Output(chart_id, "figure") for chart_id in CHART_OUTPUTS],
+        [Input("bathroom-filter", "value"),
+         Input("bedroom-filter", "value"),
+         Input("beds-filter", "value"),
+         *RANGE_INPUTS,
+         Input("theme-selector", "value"),
+         Input("data-version", "data")],
+        RANGE_BOUNDS
+    )
+    @PROFILER.callback("update_charts", outputs=CHART_OUTPUTS)
+    def update_charts(baths, bedrooms, beds, price, rating, reviews, years, theme, version, *bounds):
+        return cached_charts(store.snapshot, selection_key(baths), selection_key(bedrooms),
+                             selection_key(beds), ranges_key([price, rating, reviews, years], bounds), theme)
+
+    @app.callback(
+        [Output("precio-promedio", "children"),
+         Output("precio-mediana", "children"),
+         Output("precio-moda", "children"),
+         Output("precio-minimo", "children"),
+         Output("precio-maximo", "children"),
+         Output("rating-promedio", "children"),
+         Output("reviews-por-año", "children"),
+         Output("total-listados", "children"),
+         Output("años-promedio", "children"),
+         Output("ocupacion-estimada", "children"),
+         Output("ingreso-mensual", "children")],
+        [Input("bathroom-filter", "value"),
+         Input("bedroom-filter", "value"),
+         Input("beds-filter", "value"),
+         *RANGE_INPUTS,
+         Input("data-version", "data")],
+        RANGE_BOUNDS
+    )
+    @PROFILER.callback("update_stats")
+    def update_stats(baths, bedrooms, beds, price, rating, reviews, years, version, *bounds):
+        return cached_stats(store.snapshot, selection_key(baths), selection_key(bedrooms),
+                            selection_key(beds), ranges_key([price, rating, reviews, years], bounds))
+
+    @app.callback(
+        Output("listings-map", "figure"),
+        [Input("bathroom-filter", "value"),
+         Input("bedroom-filter", "value"),
+         Input("beds-filter", "value"),
+         *RANGE_INPUTS,
+         Input("listings-map", "relayoutData"),
+         Input("theme-selector", "value"),
+         Input("data-version", "data")],
+        RANGE_BOUNDS
+    )
+    @PROFILER.callback("update_map")
+    def update_map(baths, bedrooms, beds, price, rating, reviews, years, relayout, theme, version, *bounds):
+        snapshot = store.snapshot
+        return build_map(snapshot.df, snapshot.spatial_index, baths, bedrooms, beds, theme,
+                         ranges=dict(ranges_key([price, rating, reviews, years], bounds)),
+                         indexes=snapshot.column_indexes,
+                         viewport=viewport_from_relayout(relayout))
 
-def register_callbacks(app, df):
     @app.callback(
-        [
-            Output("reviews-price-chart", "figure"),
-            Output("guests-total-chart", "figure"),
-            Output("rating-total-chart", "figure"),
-            Output("beds-total-chart", "figure"),
-            Output("years-hosting-rating-chart", "figure"),
-            Output("reviews-per-year-chart", "figure"),
-            Output("reviews-per-year-heatmap-years", "figure"),
-            Output("reviews-per-year-heatmap-price", "figure")
-        ],
+        [Output("export-csv", "href"),
+         Output("export-parquet", "href")],
         [Input("bathroom-filter", "value"),
          Input("bedroom-filter", "value"),
          Input("beds-filter", "value"),
-         Input("theme-selector", "value")]
+         *RANGE_INPUTS],
+        RANGE_BOUNDS
     )
-    def update_charts(baths, bedrooms, beds, theme):
-        # Filtrar datos
-        filtered_df = df.copy()
-        if baths is not None:
-            filtered_df = filtered_df[filtered_df["baths"] == baths]
-        if bedrooms is not None:
-            filtered_df = filtered_df[filtered_df["bedrooms"] == bedrooms]
-        if beds is not None:
-            filtered_df = filtered_df[filtered_df["beds"] == beds]
-        
-        scatter = ScatterChart(theme)
-        
+    def update_export_links(baths, bedrooms, beds, price, rating, reviews, years, *bounds):
+        query = export_query(baths, bedrooms, beds,
+                             dict(ranges_key([price, rating, reviews, years], bounds)))
+        return f"/export/csv?{query}", f"/export/parquet?{query}"
+
+    # Retornar None al final de register_callbacks
+    return None 
+
+def years_hosting_aggregates(filtered_df, baths, bedrooms, beds, ranges=None, indexes=None, rollups=None):
+    """Promedios por años de anfitrión de rating y reseñas por año.
+
+    Sin rangos activos se leen de los rollups materializados (solo dependen
+    de los filtros de selección); si no, se agrupa el resultado filtrado.
+    """
+    ranges = ranges or {}
+    if rollups is not None and (not any(ranges.values()) or (indexes is not None and indexes.covers(ranges))):
+        by_years = rollups.query("years_hosting", baths=baths, bedrooms=bedrooms, beds=beds)
+        avg_ratings = by_years[["years_hosting", "rating_mean", "rating_count", "rating_std"]]
+        avg_reviews = by_years[["years_hosting", "reviews_per_year_mean",
+                                "reviews_per_year_count", "reviews_per_year_std"]]
+        return (avg_ratings.set_axis(["years_hosting", "mean", "count", "std"], axis=1),
+                avg_reviews.set_axis(["years_hosting", "reviews_mean", "count", "std"], axis=1))
+
+    avg_ratings = filtered_df.groupby('years_hosting')['rating'].agg([
+        'mean',
+        'count',
+        'std'
+    ]).reset_index()
+    avg_reviews = filtered_df.groupby('years_hosting').agg({
+        'reviews_per_year': ['mean', 'count', 'std']
+    }).reset_index()
+    avg_reviews.columns = ['years_hosting', 'reviews_mean', 'count', 'std']
+    return avg_ratings, avg_reviews
+
+def build_charts(df, baths, bedrooms, beds, theme, ranges=None, indexes=None, rollups=None):
+    """Construye las ocho figuras del dashboard para los filtros dados"""
+    # Import diferido: plotly.express solo se carga con el primer gráfico
+    from src.charts.scatter import ScatterChart
+    from src.charts.distribution import DistributionChart
+
+    # Filtrar datos
+    with PROFILER.span("filter", callback="update_charts"):
+        filtered_df = DataProcessor.filter_data(df, ranges=ranges, indexes=indexes,
+                                                baths=baths, bedrooms=bedrooms, beds=beds)
+
+    scatter = ScatterChart(theme)
+
+    with PROFILER.span("chart", chart="reviews-price-chart"):
         reviews_price_fig = scatter.create(
             filtered_df,
             x="reviews",
@@ -44,7 +250,8 @@ def register_callbacks(app, df):
                 "price_original": "Precio por noche"
             }
         )
-        
+
+    with PROFILER.span("chart", chart="guests-total-chart"):
         guests_total_fig = scatter.create(
             filtered_df,
             x="guests",
@@ -58,7 +265,8 @@ def register_callbacks(app, df):
                 "price_original": "Precio por noche"
             }
         )
-        
+
+    with PROFILER.span("chart", chart="rating-total-chart"):
         rating_total_fig = scatter.create(
             filtered_df,
             x="rating",
@@ -72,7 +280,8 @@ def register_callbacks(app, df):
                 "price_original": "Precio por noche"
             }
         )
-        
+
+    with PROFILER.span("chart", chart="beds-total-chart"):
         beds_total_fig = scatter.create(
             filtered_df,
             x="beds",
@@ -86,14 +295,14 @@ def register_callbacks(app, df):
                 "price_original": "Precio por noche"
             }
         )
-        
-        # Agrupar datos por años de anfitrión
-        avg_ratings = filtered_df.groupby('years_hosting')['rating'].agg([
-            'mean',
-            'count',
-            'std'
-        ]).reset_index()
-        
+
+    # Agrupar datos por años de anfitrión
+    with PROFILER.span("aggregate", callback="update_charts"):
+        avg_ratings, avg_reviews = years_hosting_aggregates(
+            filtered_df, baths, bedrooms, beds, ranges=ranges, indexes=indexes, rollups=rollups
+        )
+
+    with PROFILER.span("chart", chart="years-hosting-rating-chart"):
         years_hosting_rating_chart = scatter.create(
             avg_ratings,
             x="years_hosting",
@@ -108,9 +317,10 @@ def register_callbacks(app, df):
                 "count": "Cantidad de propiedades"
             }
         )
-        
-        distribution = DistributionChart(theme)
-        
+
+    distribution = DistributionChart(theme)
+
+    with PROFILER.span("chart", chart="reviews-per-year-chart"):
         reviews_per_year_chart = distribution.create_histogram(
             filtered_df,
             x="reviews_per_year",
@@ -120,13 +330,9 @@ def register_callbacks(app, df):
                 "reviews_per_year": "Reseñas por Año",
             }
         )
-        
-        # Para el gráfico de reseñas por experiencia
-        avg_reviews = filtered_df.groupby('years_hosting').agg({
-            'reviews_per_year': ['mean', 'count', 'std']
-        }).reset_index()
-        avg_reviews.columns = ['years_hosting', 'reviews_mean', 'count', 'std']
 
+    # Para el gráfico de reseñas por experiencia
+    with PROFILER.span("chart", chart="reviews-per-year-heatmap-years"):
         reviews_per_year_heatmap_years = scatter.create(
             avg_reviews,
             x="years_hosting",
@@ -147,9 +353,10 @@ def register_callbacks(app, df):
             # color_continuous_scale='Viridis',  # Escala predefinida que va de azul a amarillo
             # color_continuous_scale='RdBu',     # Rojo a azul
         )
-        
-        distribution = DistributionChart(theme)
-        
+
+    distribution = DistributionChart(theme)
+
+    with PROFILER.span("chart", chart="reviews-per-year-heatmap-price"):
         reviews_per_year_heatmap_price = distribution.create_boxplot(
             filtered_df,
             x="price_original",
@@ -161,74 +368,102 @@ def register_callbacks(app, df):
                 "reviews_per_year": "Reseñas por Año"
             }
         )
-        
-        return (
-            reviews_price_fig,
-            guests_total_fig,
-            rating_total_fig,
-            beds_total_fig,
-            years_hosting_rating_chart,
-            reviews_per_year_chart,
-            reviews_per_year_heatmap_years,
-            reviews_per_year_heatmap_price
-        )
 
-    @app.callback(
-        [Output("precio-promedio", "children"),
-         Output("precio-mediana", "children"),
-         Output("precio-moda", "children"),
-         Output("precio-minimo", "children"),
-         Output("precio-maximo", "children"),
-         Output("rating-promedio", "children"),
-         Output("reviews-por-año", "children"),
-         Output("total-listados", "children"),
-         Output("años-promedio", "children"),
-         Output("ocupacion-estimada", "children"),
-         Output("ingreso-mensual", "children")],
-        [Input("bathroom-filter", "value"),
-         Input("bedroom-filter", "value"),
-         Input("beds-filter", "value")]
+    return (
+        reviews_price_fig,
+        guests_total_fig,
+        rating_total_fig,
+        beds_total_fig,
+        years_hosting_rating_chart,
+        reviews_per_year_chart,
+        reviews_per_year_heatmap_years,
+        reviews_per_year_heatmap_price
     )
-    def update_stats(baths, bedrooms, beds):
-        filtered_df = df.copy()
-        if baths is not None:
-            filtered_df = filtered_df[filtered_df["baths"] == baths]
-        if bedrooms is not None:
-            filtered_df = filtered_df[filtered_df["bedrooms"] == bedrooms]
-        if beds is not None:
-            filtered_df = filtered_df[filtered_df["beds"] == beds]
-
-        # Calcular estadísticas
-        stats = {
-            "precio_promedio": f"${filtered_df['price_original'].mean():.0f}",
-            "precio_mediana": f"${filtered_df['price_original'].median():.0f}",
-            "precio_moda": f"${filtered_df['price_original'].mode().iloc[0]:.0f}",
-            "precio_minimo": f"${filtered_df['price_original'].min():.0f}",
-            "precio_maximo": f"${filtered_df['price_original'].max():.0f}",
-            "rating_promedio": f"{filtered_df['rating'].mean():.1f}",
-            "reviews_año": f"{filtered_df['reviews_per_year'].mean():.1f}",
-            "total_listados": f"{len(filtered_df)}",
-            "años_promedio": f"{filtered_df['years_hosting'].mean():.1f}",
-            "ocupacion_estimada": f"{estimate_occupancy(filtered_df['reviews_per_year'].mean()):.0f}%",
-            "ingreso_mensual": f"${filtered_df['price_original'].mean() * 30:.0f}"
-        }
-        
-        return [
-            stats["precio_promedio"],
-            stats["precio_mediana"],
-            stats["precio_moda"],
-            stats["precio_minimo"],
-            stats["precio_maximo"],
-            stats["rating_promedio"],
-            stats["reviews_año"],
-            stats["total_listados"],
-            stats["años_promedio"],
-            stats["ocupacion_estimada"],
-            stats["ingreso_mensual"]
-        ]
 
-    # Retornar None al final de register_callbacks
-    return None 
+def build_stats(df, baths, bedrooms, beds, ranges=None, indexes=None):
+    """Calcula los textos de las tarjetas de estadísticas para los filtros dados"""
+    with PROFILER.span("filter", callback="update_stats"):
+        filtered_df = DataProcessor.filter_data(df, ranges=ranges, indexes=indexes,
+                                                baths=baths, bedrooms=bedrooms, beds=beds)
+
+    # Calcular estadísticas (kernel vectorizado de DataProcessor)
+    with PROFILER.span("stats", callback="update_stats"):
+        metrics = DataProcessor.calculate_stats(filtered_df)
+    if not metrics["count"]:
+        # Sin resultados (p. ej. por un rango vacío) las métricas no están definidas
+        return ["-"] * 7 + ["0"] + ["-"] * 3
+    stats = {
+        "precio_promedio": f"${metrics['price_mean']:.0f}",
+        "precio_mediana": f"${metrics['price_median']:.0f}",
+        "precio_moda": f"${metrics['price_mode']:.0f}",
+        "precio_minimo": f"${metrics['price_min']:.0f}",
+        "precio_maximo": f"${metrics['price_max']:.0f}",
+        "rating_promedio": f"{metrics['rating_mean']:.1f}",
+        "reviews_año": f"{metrics['reviews_per_year_mean']:.1f}",
+        "total_listados": f"{metrics['count']}",
+        "años_promedio": f"{metrics['years_hosting_mean']:.1f}",
+        "ocupacion_estimada": f"{estimate_occupancy(metrics['reviews_per_year_mean']):.0f}%",
+        "ingreso_mensual": f"${metrics['price_mean'] * 30:.0f}"
+    }
+
+    return [
+        stats["precio_promedio"],
+        stats["precio_mediana"],
+        stats["precio_moda"],
+        stats["precio_minimo"],
+        stats["precio_maximo"],
+        stats["rating_promedio"],
+        stats["reviews_año"],
+        stats["total_listados"],
+        stats["años_promedio"],
+        stats["ocupacion_estimada"],
+        stats["ingreso_mensual"]
+    ]
+
+def viewport_from_relayout(relayout):
+    """Extrae (sur, oeste, norte, este) del relayoutData del mapa, o None"""
+    for key in ("map._derived", "mapbox._derived"):
+        derived = (relayout or {}).get(key)
+        if derived and derived.get("coordinates"):
+            lngs = [point[0] for point in derived["coordinates"]]
+            lats = [point[1] for point in derived["coordinates"]]
+            return min(lats), min(lngs), max(lats), max(lngs)
+    return None
+
+def build_map(df, spatial_index, baths, bedrooms, beds, theme, ranges=None, indexes=None, viewport=None):
+    """Construye el mapa de listados del viewport (puntos o clusters)"""
+    from src.charts.map import MapChart
+
+    chart = MapChart(theme)
+    title = "Mapa de listados"
+    if spatial_index is None or not spatial_index.size:
+        empty = pd.DataFrame({"latitude": [], "longitude": [], "price_original": []})
+        return chart.create(empty, title, subtitle="El dataset no tiene coordenadas de los listados")
+
+    bounds = viewport or spatial_index.bounds()
+    with PROFILER.span("filter", callback="update_map"):
+        filtered_df = DataProcessor.filter_data(df, ranges=ranges, indexes=indexes,
+                                                baths=baths, bedrooms=bedrooms, beds=beds)
+    if filtered_df is df:
+        # Sin filtros: el índice espacial resuelve el viewport
+        points = df.iloc[spatial_index.query(*bounds)]
+    else:
+        south, west, north, east = bounds
+        lat = filtered_df[LAT_COLUMN].to_numpy(dtype=np.float64, na_value=np.nan)
+        lng = filtered_df[LNG_COLUMN].to_numpy(dtype=np.float64, na_value=np.nan)
+        points = filtered_df[(lat >= south) & (lat <= north) & (lng >= west) & (lng <= east)]
+
+    center = {"lat": (bounds[0] + bounds[2]) / 2, "lon": (bounds[1] + bounds[3]) / 2}
+    if len(points) > MAX_MAP_POINTS:
+        clusters = cluster_points(
+            points[LAT_COLUMN].to_numpy(dtype=np.float64),
+            points[LNG_COLUMN].to_numpy(dtype=np.float64),
+            points["price_original"].to_numpy(dtype=np.float64),
+            bounds
+        )
+        return chart.create(clusters, title, clustered=True, center=center,
+                            subtitle=f"{len(points):,} listados agrupados en {len(clusters):,} zonas")
+    return chart.create(points, title, center=center, subtitle=f"{len(points):,} listados en la vista")
 
 def estimate_occupancy(reviews_per_year):
     """
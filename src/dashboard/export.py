@@ -0,0 +1,148 @@
+import io
+from urllib.parse import urlencode
+import pandas as pd
+from flask import Response, abort, request, stream_with_context
+from src.data.filter_index import FILTER_COLUMNS, RANGE_COLUMNS
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # Parquet es opcional
+    pa = pq = None
+
+# Filas por bloque: acota la memoria usada por cada descarga
+EXPORT_CHUNK_ROWS = 50_000
+
+
+def export_query(baths=None, bedrooms=None, beds=None, ranges=None):
+    """Arma el query string de /export con la selección de filtros actual"""
+    params = []
+    for column, value in zip(FILTER_COLUMNS, (baths, bedrooms, beds)):
+        if value is None:
+            continue
+        for item in value if isinstance(value, (list, tuple)) else [value]:
+            params.append((column, item))
+    for column, (low, high) in (ranges or {}).items():
+        params.append((f"{column}_min", low))
+        params.append((f"{column}_max", high))
+    return urlencode(params)
+
+
+def _parse_value(series, text):
+    """Convierte un parámetro de la URL al tipo de la columna"""
+    if pd.api.types.is_numeric_dtype(series.dtype) and not isinstance(series.dtype, pd.CategoricalDtype):
+        return float(text)
+    return text
+
+
+def _filter_column(key):
+    """Columna a la que se refiere un parámetro de la URL, o None si no es un filtro"""
+    if key in FILTER_COLUMNS:
+        return key
+    column, _, bound = key.rpartition("_")
+    return column if column in RANGE_COLUMNS and bound in ("min", "max") else None
+
+
+def parse_filters(df, args, columns=None):
+    """Lee de la URL los filtros de selección y de rango (aborta con 400 si son inválidos).
+
+    Solo se aceptan las columnas filtrables que están en `columns` (por
+    defecto, las del DataFrame); cualquier otro parámetro es un error.
+    """
+    columns = df.columns if columns is None else columns
+    for key in args:
+        column = _filter_column(key)
+        if column is None or column not in columns:
+            abort(400, f"Filtro no disponible: {key}")
+    values, ranges = {}, {}
+    try:
+        for column in FILTER_COLUMNS:
+            selected = args.getlist(column)
+            if selected:
+                values[column] = [_parse_value(df[column], item) for item in selected]
+        for column in RANGE_COLUMNS:
+            low, high = args.get(f"{column}_min"), args.get(f"{column}_max")
+            if low is not None or high is not None:
+                ranges[column] = (None if low is None else float(low),
+                                  None if high is None else float(high))
+    except ValueError:
+        abort(400, "Parámetros de filtro inválidos")
+    return values, ranges
+
+
+def filter_positions(snapshot, args):
+    """Posiciones de las filas que cumplen los filtros de la URL (None = todas)"""
+    indexes = snapshot.column_indexes
+    values, ranges = parse_filters(snapshot.df, args, indexes)
+    return indexes.positions(values, ranges)
+
+
+def _chunks(df, positions):
+    """Recorre el resultado en bloques de EXPORT_CHUNK_ROWS filas"""
+    total = len(df) if positions is None else len(positions)
+    for start in range(0, total, EXPORT_CHUNK_ROWS):
+        if positions is None:
+            yield df.iloc[start:start + EXPORT_CHUNK_ROWS]
+        else:
+            yield df.iloc[positions[start:start + EXPORT_CHUNK_ROWS]]
+
+
+def stream_csv(df, positions):
+    yield df.iloc[:0].to_csv(index=False)
+    for chunk in _chunks(df, positions):
+        yield chunk.to_csv(index=False, header=False)
+
+
+class _ChunkSink(io.RawIOBase):
+    """Archivo de solo escritura que acumula bytes hasta que se los retira"""
+    def __init__(self):
+        self._buffer = []
+        self._position = 0
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self._buffer.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self._position
+
+    def drain(self):
+        data = b"".join(self._buffer)
+        self._buffer = []
+        return data
+
+
+def stream_parquet(df, positions):
+    """Escribe un row group por bloque y envía los bytes a medida que se generan"""
+    sink = _ChunkSink()
+    schema = pa.Schema.from_pandas(df.iloc[:0], preserve_index=False)
+    with pq.ParquetWriter(sink, schema) as writer:
+        for chunk in _chunks(df, positions):
+            writer.write_table(pa.Table.from_pandas(chunk, schema=schema, preserve_index=False))
+            yield sink.drain()
+    yield sink.drain()
+
+
+def register_export_routes(server, store):
+    """Registra /export/csv y /export/parquet en el servidor Flask de Dash"""
+    @server.route("/export/<fmt>")
+    def export(fmt):
+        snapshot = store.snapshot
+        if fmt == "csv":
+            stream, mimetype = stream_csv, "text/csv"
+        elif fmt == "parquet":
+            if pa is None:
+                abort(501, "La exportación a Parquet requiere pyarrow")
+            stream, mimetype = stream_parquet, "application/vnd.apache.parquet"
+        else:
+            abort(404)
+        positions = filter_positions(snapshot, request.args)
+        return Response(
+            stream_with_context(stream(snapshot.df, positions)),
+            mimetype=mimetype,
+            headers={"Content-Disposition": f"attachment; filename=airbnb_data.{fmt}"}
+        )
@@ -1,9 +1,12 @@
 from dash import html, dcc
 from ..charts.theme import StayBATheme
 
-def create_layout(df):
+def create_layout(df, version=None):
     """Crea el layout principal del dashboard"""
     return html.Div([
+        # Versión del dataset; se consulta periódicamente para detectar recargas
+        dcc.Store(id="data-version", data=version),
+        dcc.Interval(id="data-version-interval", interval=60_000),
         create_header(),
         create_filters(df),
         create_stats_cards(),
@@ -34,13 +37,38 @@ def create_header():
         ])
     ], className="bg-gradient-to-r from-[#E85C3F] to-[#FF8B6A] p-4 rounded-xl shadow-lg flex justify-between items-center mb-6")
 
+# Filtros por rango: (etiqueta, id, columna, paso)
+RANGE_FILTERS = [
+    ("PRECIO POR NOCHE", "price-range-filter", "price_original", 1),
+    ("RATING", "rating-range-filter", "rating", 0.1),
+    ("RESEÑAS", "reviews-range-filter", "reviews", 1),
+    ("AÑOS COMO ANFITRIÓN", "years-range-filter", "years_hosting", 1),
+]
+
 def create_filters(df):
     """Crea la sección de filtros"""
     return html.Div([
-        create_filter("BAÑOS", "bathroom-filter", df["baths"]),
-        create_filter("HABITACIONES", "bedroom-filter", df["bedrooms"]),
-        create_filter("CAMAS", "beds-filter", df["beds"])
-    ], className="grid grid-cols-3 gap-4 mb-6 bg-gray-100 p-4 rounded-xl")
+        html.Div([
+            create_filter("BAÑOS", "bathroom-filter", df["baths"]),
+            create_filter("HABITACIONES", "bedroom-filter", df["bedrooms"]),
+            create_filter("CAMAS", "beds-filter", df["beds"])
+        ], className="grid grid-cols-3 gap-4 mb-4"),
+        html.Div([
+            create_range_filter(label, id_name, df[column], step)
+            for label, id_name, column, step in RANGE_FILTERS
+        ], className="grid grid-cols-4 gap-4"),
+        create_export_links()
+    ], className="mb-6 bg-gray-100 p-4 rounded-xl")
+
+def create_export_links():
+    """Links de descarga de los datos filtrados (el href se actualiza con los filtros)"""
+    return html.Div([
+        html.Span("Descargar datos filtrados:", className="text-xs font-bold text-gray-600 mr-2"),
+        html.A("CSV", id="export-csv", href="/export/csv",
+               className="text-sm font-bold text-[#E85C3F] mr-4"),
+        html.A("Parquet", id="export-parquet", href="/export/parquet",
+               className="text-sm font-bold text-[#E85C3F]")
+    ], className="flex items-center justify-end mt-4")
 
 def create_filter(label, id_name, data):
     """Crea un filtro individual"""
@@ -48,13 +76,41 @@ def create_filter(label, id_name, data):
         html.Label(label, className="text-xs font-bold text-gray-600 block mb-2"),
         dcc.Dropdown(
             id=id_name,
-            options=[{"label": f"{i}", "value": i} 
-                    for i in sorted(data.dropna().unique())],
+            options=filter_options(data),
+            multi=True,
             placeholder="Seleccionar",
             className="w-full"
         ),
     ], className="bg-white p-4 rounded-lg shadow-sm")
 
+def range_bounds(data):
+    """Extremos (mín, máx) de una columna para un RangeSlider"""
+    return float(data.min()), float(data.max())
+
+def create_range_filter(label, id_name, data, step):
+    """Crea un filtro por rango con los extremos de la columna"""
+    low, high = range_bounds(data)
+    return html.Div([
+        html.Label(label, className="text-xs font-bold text-gray-600 block mb-2"),
+        dcc.RangeSlider(
+            id=id_name,
+            min=low,
+            max=high,
+            step=step,
+            value=[low, high],
+            marks=None,
+            tooltip={"placement": "bottom", "always_visible": True}
+        ),
+    ], className="bg-white p-4 rounded-lg shadow-sm")
+
+def filter_options(data):
+    """Opciones de un dropdown a partir de los valores de la columna"""
+    return options_from_values(sorted(data.dropna().unique()))
+
+def options_from_values(values):
+    """Opciones de un dropdown a partir de una lista de valores ordenada"""
+    return [{"label": f"{i}", "value": i} for i in values]
+
 def create_stats_cards():
     """Crea la sección de estadísticas"""
     return html.Div([
@@ -154,7 +210,10 @@ def create_charts_grid():
         create_chart_container("years-hosting-rating-chart"),
         create_chart_container("reviews-per-year-chart"),
         create_chart_container("reviews-per-year-heatmap-years"),
-        create_chart_container("reviews-per-year-heatmap-price")
+        create_chart_container("reviews-per-year-heatmap-price"),
+        html.Div([
+            dcc.Graph(id="listings-map")
+        ], className="col-span-2 bg-white rounded-xl shadow-sm p-4 hover:shadow-md transition-shadow")
     ], className="grid grid-cols-2 gap-6")
 
 def create_chart_container(chart_id):
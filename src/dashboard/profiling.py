@@ -0,0 +1,114 @@
+import cProfile
+import functools
+import json
+import os
+import re
+import time
+from contextlib import nullcontext
+from pathlib import Path
+from flask import Response, g, request
+from src.utils.metrics import MetricsRegistry
+
+# Límites superiores (bytes) de los buckets de tamaño de respuesta
+PAYLOAD_BUCKETS = (1_000, 10_000, 100_000, 500_000, 1_000_000, 5_000_000, 20_000_000)
+
+
+def payload_size(value) -> int:
+    """Bytes del JSON que Dash enviaría para `value`"""
+    from plotly.io.json import to_json_plotly
+    return len(to_json_plotly(value).encode("utf-8"))
+
+
+class CallbackProfiler:
+    """Tiempos por callback, por gráfico y de filtrado, y tamaño de las respuestas.
+
+    Desactivado no agrega trabajo: `span` devuelve un contexto nulo y
+    `callback` deja la función sin envolver.
+    """
+    def __init__(self, enabled: bool = False, profile_dir=None, profile_match: str = None):
+        self.enabled = enabled
+        self.profile_dir = Path(profile_dir) if profile_dir else None
+        self.profile_match = profile_match
+        self.registry = MetricsRegistry(prefix="dash")
+
+    @classmethod
+    def from_env(cls) -> "CallbackProfiler":
+        """DASH_PROFILE=1 activa las métricas; DASH_PROFILE_DIR, los volcados de cProfile"""
+        return cls(
+            enabled=os.environ.get("DASH_PROFILE", "0") == "1",
+            profile_dir=os.environ.get("DASH_PROFILE_DIR"),
+            profile_match=os.environ.get("DASH_PROFILE_MATCH"),
+        )
+
+    def span(self, stage: str, **labels):
+        if not self.enabled:
+            return nullcontext()
+        return self.registry.span(stage, **labels)
+
+    def callback(self, name: str, outputs=None):
+        """Decorador: mide el callback y el tamaño de cada salida (nombradas por `outputs`)"""
+        def decorator(func):
+            if not self.enabled:
+                return func
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.registry.span("callback", callback=name):
+                    result = func(*args, **kwargs)
+                if outputs and isinstance(result, (list, tuple)):
+                    for output, value in zip(outputs, result):
+                        self.registry.observe("payload_bytes", payload_size(value),
+                                              buckets=PAYLOAD_BUCKETS, callback=name, output=output)
+                else:
+                    self.registry.observe("payload_bytes", payload_size(result),
+                                          buckets=PAYLOAD_BUCKETS, callback=name)
+                return result
+            return wrapper
+        return decorator
+
+    def wants_dump(self) -> bool:
+        """Indica si la request actual debe perfilarse con cProfile"""
+        if self.profile_dir is None:
+            return False
+        if request.headers.get("X-Profile"):
+            return True
+        if self.profile_match and request.path.endswith("_dash-update-component"):
+            body = request.get_json(silent=True) or {}
+            return self.profile_match in str(body.get("output", ""))
+        return False
+
+
+def register_profiling_routes(server, profiler: CallbackProfiler):
+    """Registra /debug/profile y los volcados de cProfile (solo si el profiler está activo)"""
+    if not profiler.enabled:
+        return None
+
+    @server.before_request
+    def start_profile():
+        if profiler.wants_dump():
+            g.profile = cProfile.Profile()
+            g.profile.enable()
+
+    @server.after_request
+    def dump_profile(response):
+        profile = g.pop("profile", None)
+        if profile is not None:
+            profile.disable()
+            body = request.get_json(silent=True) or {}
+            label = re.sub(r"[^A-Za-z0-9]+", "_", str(body.get("output", request.path)))[:80]
+            profiler.profile_dir.mkdir(parents=True, exist_ok=True)
+            # Formato pstats: se abre con snakeviz o flameprof (flamegraph)
+            profile.dump_stats(profiler.profile_dir / f"{time.strftime('%Y%m%d-%H%M%S')}-{label}.prof")
+        return response
+
+    @server.route("/debug/profile")
+    def debug_profile():
+        if request.args.get("format") == "prometheus":
+            return Response(profiler.registry.to_prometheus(), mimetype="text/plain")
+        return Response(json.dumps(profiler.registry.rows()), mimetype="application/json")
+
+    return None
+
+
+# Profiler del proceso, configurado por variables de entorno
+PROFILER = CallbackProfiler.from_env()
@@ -0,0 +1,39 @@
+import os
+import plotly.io as pio
+
+
+def configure_json_engine(engine: str = None) -> str:
+    """Elige el motor JSON de plotly (el que usa Dash para las respuestas).
+
+    DASH_JSON_ENGINE=json|orjson|auto; con "auto" se usa orjson si está
+    instalado. Devuelve el motor activo.
+    """
+    engine = engine or os.environ.get("DASH_JSON_ENGINE", "auto")
+    if engine == "auto":
+        try:
+            import orjson  # noqa: F401
+            engine = "orjson"
+        except ImportError:
+            engine = "json"
+    pio.json.config.default_engine = engine
+    return engine
+
+
+def compression_enabled() -> bool:
+    """Compresión gzip/br de las respuestas: DASH_COMPRESS=0 la desactiva (requiere flask-compress)"""
+    if os.environ.get("DASH_COMPRESS", "1") != "1":
+        return False
+    try:
+        import flask_compress  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def figure_dicts(figures) -> tuple:
+    """Convierte las figuras a diccionarios una sola vez.
+
+    Dash serializa un `go.Figure` copiándolo entero en cada respuesta; los
+    resultados cacheados se guardan ya convertidos.
+    """
+    return tuple(figure.to_plotly_json() for figure in figures)
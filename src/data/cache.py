@@ -0,0 +1,89 @@
+import hashlib
+import json
+import os
+from pathlib import Path
+import pandas as pd
+
+# Incrementar si cambian las transformaciones de DataProcessor.prepare
+CACHE_FORMAT = 1
+
+
+class PreparedCache:
+    """Snapshot binario del dataset ya preparado.
+
+    Se invalida cuando cambia el CSV de origen: primero se compara mtime y
+    tamaño (barato) y, si no coinciden, el hash del contenido, de modo que
+    copiar o tocar el archivo sin modificarlo no obliga a reprocesarlo.
+    """
+    def __init__(self, cache_dir: Path):
+        self.cache_dir = Path(cache_dir)
+
+    def _paths(self, source: Path):
+        return (self.cache_dir / f"{source.name}.pkl",
+                self.cache_dir / f"{source.name}.meta.json")
+
+    @staticmethod
+    def _file_hash(source: Path) -> str:
+        digest = hashlib.sha256()
+        with open(source, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                digest.update(block)
+        return digest.hexdigest()
+
+    def fingerprint(self, source: Path) -> dict:
+        """Metadatos del CSV (mtime, tamaño y hash); se toman antes de leerlo"""
+        stat = source.stat()
+        return {
+            "format": CACHE_FORMAT,
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "sha256": self._file_hash(source),
+        }
+
+    def _write_meta(self, meta_path: Path, meta: dict):
+        tmp_path = meta_path.with_name(f"{meta_path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(meta))
+        os.replace(tmp_path, meta_path)
+
+    def load(self, source: Path) -> pd.DataFrame:
+        """Devuelve el dataset cacheado si sigue vigente, o None"""
+        data_path, meta_path = self._paths(source)
+        if not data_path.exists() or not meta_path.exists():
+            return None
+        try:
+            meta = json.loads(meta_path.read_text())
+            if meta.get("format") != CACHE_FORMAT:
+                return None
+            stat = source.stat()
+            if (meta["mtime_ns"], meta["size"]) != (stat.st_mtime_ns, stat.st_size):
+                if meta["sha256"] != self._file_hash(source):
+                    return None
+                # Mismo contenido: se actualiza mtime/tamaño para no volver a hashear
+                self._write_meta(meta_path, {**meta, "mtime_ns": stat.st_mtime_ns, "size": stat.st_size})
+            return pd.read_pickle(data_path)
+        except Exception as e:
+            print(f"Cache de datos inválida, se regenera: {e}")
+            return None
+
+    def save(self, source: Path, df: pd.DataFrame, fingerprint: dict) -> bool:
+        """Guarda el dataset de forma atómica (archivo temporal + rename).
+
+        `fingerprint` son los metadatos tomados antes de leer el CSV; si el
+        archivo cambió desde entonces no se guarda nada, porque `df` podría
+        no corresponder a esos metadatos.
+        """
+        data_path, meta_path = self._paths(source)
+        try:
+            stat = source.stat()
+            if (fingerprint["mtime_ns"], fingerprint["size"]) != (stat.st_mtime_ns, stat.st_size):
+                print("El CSV cambió durante la carga; no se guarda la cache de datos")
+                return False
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = data_path.with_name(f"{data_path.name}.{os.getpid()}.tmp")
+            df.to_pickle(tmp_path)
+            os.replace(tmp_path, data_path)
+            self._write_meta(meta_path, fingerprint)
+            return True
+        except Exception as e:
+            print(f"No se pudo guardar la cache de datos: {e}")
+            return False
@@ -0,0 +1,163 @@
+from itertools import product
+import numpy as np
+import pandas as pd
+
+# Columnas de los dropdowns del dashboard
+FILTER_COLUMNS = ("baths", "bedrooms", "beds")
+
+
+def _is_missing(value) -> bool:
+    return value is None or (isinstance(value, float) and value != value)
+
+
+class FilterIndex:
+    """Índice de co-ocurrencia sobre las columnas de los filtros.
+
+    Para cada columna y cada combinación posible de selecciones en las demás
+    (un valor o ninguno) guarda las opciones que siguen teniendo resultados,
+    así que actualizar los dropdowns es una búsqueda en un diccionario.
+    """
+    def __init__(self, df: pd.DataFrame, columns=FILTER_COLUMNS):
+        self.columns = tuple(columns)
+        counts = df.groupby(list(self.columns), observed=True, dropna=False).size()
+        options = {}
+        totals = {}
+        for combo, count in counts.items():
+            combo = combo if isinstance(combo, tuple) else (combo,)
+            # Totales por cada selección parcial (para saber cuántas filas quedan)
+            for mask in product([False, True], repeat=len(combo)):
+                if any(selected and _is_missing(value) for value, selected in zip(combo, mask)):
+                    continue
+                key = tuple(value if selected else None for value, selected in zip(combo, mask))
+                totals[key] = totals.get(key, 0) + count
+            # Opciones de cada columna según la selección de las otras
+            for position, value in enumerate(combo):
+                if _is_missing(value):
+                    continue
+                others = combo[:position] + combo[position + 1:]
+                for mask in product([False, True], repeat=len(others)):
+                    if any(selected and _is_missing(other) for other, selected in zip(others, mask)):
+                        continue
+                    key = (position, tuple(other if selected else None
+                                           for other, selected in zip(others, mask)))
+                    options.setdefault(key, set()).add(value)
+        self._options = {key: sorted(values) for key, values in options.items()}
+        self._totals = totals
+
+    @staticmethod
+    def _choices(selection) -> list:
+        """Normaliza una selección (valor, lista o vacía) a la lista de claves a consultar"""
+        if selection is None or (isinstance(selection, (list, tuple, set)) and not selection):
+            return [None]
+        return list(selection) if isinstance(selection, (list, tuple, set)) else [selection]
+
+    def options(self, column: str, **selections) -> list:
+        """Valores de `column` que tienen filas dadas las selecciones de las demás.
+
+        Las selecciones pueden ser un valor o una lista (selección múltiple);
+        con listas se unen las opciones de cada combinación.
+        """
+        position = self.columns.index(column)
+        choices = [self._choices(selections.get(other)) for other in self.columns if other != column]
+        keys = list(product(*choices))
+        if len(keys) == 1:
+            return self._options.get((position, keys[0]), [])
+        values = set()
+        for key in keys:
+            values.update(self._options.get((position, key), []))
+        return sorted(values)
+
+    def count(self, **selections) -> int:
+        """Cantidad de filas que cumplen las selecciones"""
+        choices = [self._choices(selections.get(column)) for column in self.columns]
+        return sum(self._totals.get(key, 0) for key in product(*choices))
+
+
+# Columnas con filtro por rango en el dashboard
+RANGE_COLUMNS = ("price_original", "rating", "reviews", "years_hosting")
+
+
+class SortedIndex:
+    """Índice ordenado de una columna para filtrar con búsqueda binaria.
+
+    Las columnas no numéricas se indexan por su código (pd.factorize), de
+    modo que los filtros por valores también son búsquedas en el array.
+    """
+    def __init__(self, series: pd.Series):
+        self.size = len(series)
+        if pd.api.types.is_numeric_dtype(series.dtype) and not isinstance(series.dtype, pd.CategoricalDtype):
+            values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+            self.codes = None
+        else:
+            codes, uniques = pd.factorize(series, sort=True)
+            values = codes.astype(np.float64)
+            values[codes < 0] = np.nan
+            self.codes = {value: code for code, value in enumerate(uniques)}
+        # argsort deja los NaN al final: solo se busca en el tramo válido
+        self.order = np.argsort(values, kind="stable")
+        self.sorted = values[self.order]
+        self.valid = int(np.count_nonzero(~np.isnan(values)))
+        self.sorted = self.sorted[:self.valid]
+
+    def covers(self, low=None, high=None) -> bool:
+        """Indica si el rango incluye todas las filas (el filtro no recorta nada)"""
+        if self.valid < self.size:
+            return False
+        return ((low is None or self.valid == 0 or low <= self.sorted[0])
+                and (high is None or self.valid == 0 or high >= self.sorted[-1]))
+
+    def range(self, low=None, high=None) -> np.ndarray:
+        """Posiciones de las filas con low <= valor <= high"""
+        start = 0 if low is None else np.searchsorted(self.sorted, low, side="left")
+        end = self.valid if high is None else np.searchsorted(self.sorted, high, side="right")
+        return self.order[start:end]
+
+    def isin(self, values) -> np.ndarray:
+        """Posiciones de las filas cuyo valor está en `values`"""
+        parts = []
+        for value in values:
+            key = value if self.codes is None else self.codes.get(value)
+            if key is None:
+                continue
+            parts.append(self.range(key, key))
+        return np.concatenate(parts) if parts else np.empty(0, dtype=np.intp)
+
+
+class ColumnIndexes:
+    """Índices ordenados de las columnas filtrables, construidos al cargar los datos"""
+    def __init__(self, df: pd.DataFrame, columns=FILTER_COLUMNS + RANGE_COLUMNS):
+        self.indexes = {column: SortedIndex(df[column]) for column in columns if column in df.columns}
+
+    def __contains__(self, column):
+        return column in self.indexes
+
+    def covers(self, ranges) -> bool:
+        """Indica si ninguno de los rangos recorta filas"""
+        return all(
+            bounds is None or (column in self.indexes and self.indexes[column].covers(*bounds))
+            for column, bounds in ranges.items()
+        )
+
+    def positions(self, values=None, ranges=None) -> np.ndarray:
+        """Posiciones (ordenadas) que cumplen todos los filtros, o None si no hay filtros.
+
+        `values` mapea columna -> lista de valores aceptados y `ranges`
+        columna -> (mínimo, máximo), con None como extremo abierto.
+        """
+        matches = []
+        for column, accepted in (values or {}).items():
+            matches.append(self.indexes[column].isin(accepted))
+        for column, (low, high) in (ranges or {}).items():
+            index = self.indexes[column]
+            if not index.covers(low, high):
+                matches.append(index.range(low, high))
+        if not matches:
+            return None
+        # Intersectar empezando por el conjunto más chico
+        matches.sort(key=len)
+        result = np.sort(matches[0])
+        for match in matches[1:]:
+            if not result.size:
+                break
+            result = np.intersect1d(result, match, assume_unique=True)
+        return result
@@ -1,6 +1,20 @@
 import pandas as pd
 from pathlib import Path
 
+# Tipos de las columnas del CSV del scraper para la lectura por bloques.
+# bedrooms y beds mezclan números con "No disponible", por eso son categorías.
+CSV_DTYPES = {
+    "rating": "float32",
+    "reviews": "float32",
+    "guests": "float32",
+    "baths": "float32",
+    "years_hosting": "float32",
+    "price_original": "float64",
+    "bedrooms": "category",
+    "beds": "category",
+    "crawled_at": "category",
+}
+
 class DataLoader:
     """Maneja la carga de datos"""
     def __init__(self, data_dir: Path = None):
@@ -24,4 +38,21 @@ class DataLoader:
             print("  airbnb_scrapper/")
             print("  └── data/")
             print("      └── airbnb_data.csv")
-            return pd.DataFrame() 
\ No newline at end of file
+            return pd.DataFrame() 
+
+    def iter_csv_chunks(self, filename: str, columns=None, dtypes: dict = None,
+                        chunksize: int = 100_000):
+        """Lee el CSV en bloques de `chunksize` filas, solo con las `columns` pedidas.
+
+        Las columnas pedidas que no están en el archivo se omiten. `dtypes`
+        reemplaza a CSV_DTYPES para las columnas que indique.
+        """
+        filepath = self.data_dir / filename
+        if not filepath.exists():
+            raise FileNotFoundError(f"No se encuentra el archivo: {filepath}")
+        header = pd.read_csv(filepath, nrows=0).columns
+        usecols = [column for column in columns if column in header] if columns is not None else list(header)
+        hints = {**CSV_DTYPES, **(dtypes or {})}
+        dtype = {column: hints[column] for column in usecols if column in hints}
+        with pd.read_csv(filepath, usecols=usecols, dtype=dtype, chunksize=chunksize) as reader:
+            yield from reader
@@ -1,5 +1,134 @@
+import numpy as np
 import pandas as pd
 
+# Rango máximo de precios enteros que se resuelve con histograma (bincount)
+MAX_HISTOGRAM_RANGE = 1_000_000
+
+
+def column_values(df: pd.DataFrame, column: str) -> np.ndarray:
+    """Devuelve la columna como array contiguo, sin valores faltantes.
+
+    Las columnas enteras se devuelven sin conversión (no pueden tener NaN);
+    el resto se convierte a float64 y solo se filtra si hay faltantes.
+    """
+    values = df[column].to_numpy()
+    if values.dtype.kind in "iu":
+        return np.ascontiguousarray(values)
+    values = np.ascontiguousarray(df[column].to_numpy(dtype=np.float64, na_value=np.nan))
+    missing = np.isnan(values)
+    return values[~missing] if missing.any() else values
+
+
+class PriceHistogram:
+    """Histograma acumulable de precios enteros.
+
+    Permite calcular moda, mediana, media, mínimo y máximo a partir de los
+    conteos, y puede actualizarse por partes (mediana incremental).
+    """
+    def __init__(self):
+        self.offset = 0
+        self.counts = np.zeros(0, dtype=np.int64)
+        self.total = 0
+        self.sum = 0.0
+
+    @staticmethod
+    def supports(values: np.ndarray) -> bool:
+        """Indica si los valores son enteros y con rango acotado"""
+        if values.size == 0:
+            return True
+        if values.max() - values.min() > MAX_HISTOGRAM_RANGE:
+            return False
+        return values.dtype.kind in "iu" or bool(np.all(values == np.floor(values)))
+
+    def update(self, values: np.ndarray) -> "PriceHistogram":
+        if values.size == 0:
+            return self
+        ints = values.astype(np.int64, copy=False)
+        low, high = int(ints.min()), int(ints.max())
+        if self.total == 0:
+            self.offset = low
+            self.counts = np.zeros(high - low + 1, dtype=np.int64)
+        else:
+            new_offset = min(self.offset, low)
+            new_size = max(self.offset + self.counts.size - 1, high) - new_offset + 1
+            if new_offset != self.offset or new_size != self.counts.size:
+                counts = np.zeros(new_size, dtype=np.int64)
+                start = self.offset - new_offset
+                counts[start:start + self.counts.size] = self.counts
+                self.counts, self.offset = counts, new_offset
+        chunk = np.bincount(ints - low, minlength=high - low + 1)
+        start = low - self.offset
+        self.counts[start:start + chunk.size] += chunk
+        self.total += ints.size
+        self.sum += float(ints.sum())
+        return self
+
+    def _value_at(self, rank: int) -> int:
+        """Valor en la posición `rank` (0-based) de los datos ordenados"""
+        cumulative = np.cumsum(self.counts)
+        return self.offset + int(np.searchsorted(cumulative, rank + 1))
+
+    def mean(self) -> float:
+        return self.sum / self.total if self.total else np.nan
+
+    def median(self) -> float:
+        if not self.total:
+            return np.nan
+        middle = self.total // 2
+        if self.total % 2:
+            return float(self._value_at(middle))
+        return (self._value_at(middle - 1) + self._value_at(middle)) / 2
+
+    def mode(self) -> float:
+        if not self.total:
+            return np.nan
+        return float(self.offset + int(np.argmax(self.counts)))
+
+    def min(self) -> float:
+        if not self.total:
+            return np.nan
+        return float(self.offset + int(np.flatnonzero(self.counts)[0]))
+
+    def max(self) -> float:
+        if not self.total:
+            return np.nan
+        return float(self.offset + int(np.flatnonzero(self.counts)[-1]))
+
+
+def _price_stats(prices: np.ndarray) -> dict:
+    """Estadísticas de precio; usa histograma si los precios son enteros"""
+    if PriceHistogram.supports(prices):
+        histogram = PriceHistogram().update(prices)
+        return {
+            "price_mean": histogram.mean(),
+            "price_median": histogram.median(),
+            "price_mode": histogram.mode(),
+            "price_min": histogram.min(),
+            "price_max": histogram.max(),
+        }
+    if prices.size == 0:
+        return dict.fromkeys(
+            ["price_mean", "price_median", "price_mode", "price_min", "price_max"], np.nan
+        )
+    # Precios no enteros: np.unique ya ordena, así que la mediana sale del mismo paso
+    uniques, counts = np.unique(prices, return_counts=True)
+    cumulative = np.cumsum(counts)
+    middle = prices.size // 2
+    upper = uniques[np.searchsorted(cumulative, middle + 1)]
+    lower = upper if prices.size % 2 else uniques[np.searchsorted(cumulative, middle)]
+    return {
+        "price_mean": float(prices.mean()),
+        "price_median": float((lower + upper) / 2),
+        "price_mode": float(uniques[np.argmax(counts)]),
+        "price_min": float(uniques[0]),
+        "price_max": float(uniques[-1]),
+    }
+
+
+def _mean(values: np.ndarray) -> float:
+    return float(values.mean()) if values.size else np.nan
+
+
 class DataProcessor:
     """Procesa y transforma los datos"""
     @staticmethod
@@ -9,9 +138,101 @@ class DataProcessor:
         return df
 
     @staticmethod
-    def filter_data(df: pd.DataFrame, **filters) -> pd.DataFrame:
-        filtered_df = df.copy()
+    def price_bins(prices: pd.Series, q: int = 5) -> pd.Series:
+        """Agrupa precios en cuantiles como categoría ordenada (etiquetas "$min - $max").
+
+        Los bordes que se redondean al mismo entero que el anterior (o que el
+        último) se descartan: esos tramos se fusionan y las etiquetas no se repiten.
+        """
+        bins, edges = pd.qcut(prices, q=q, duplicates="drop", retbins=True)
+        if len(edges) < 2:
+            return bins
+        texts = [f"{edge:.0f}" for edge in edges]
+        keep = [0]
+        for position in range(1, len(edges) - 1):
+            if texts[position] not in (texts[keep[-1]], texts[-1]):
+                keep.append(position)
+        keep.append(len(edges) - 1)
+        labels = [f"${texts[left]} - ${texts[right]}" for left, right in zip(keep, keep[1:])]
+        return pd.cut(prices, edges[keep], labels=labels, include_lowest=True)
+
+    @staticmethod
+    def add_price_bins(df: pd.DataFrame, q: int = 5) -> pd.DataFrame:
+        """Agrega la columna categórica `price_range` calculada sobre todo el dataset"""
+        df = df.copy()
+        df["price_range"] = DataProcessor.price_bins(df["price_original"], q=q)
+        return df
+
+    @staticmethod
+    def compact(df: pd.DataFrame, max_unique_ratio: float = 0.5) -> pd.DataFrame:
+        """Convierte columnas de texto repetitivas a categorías.
+
+        Reduce memoria y la cantidad de objetos Python del dataset, lo que
+        permite que los workers de gunicorn compartan sus páginas tras el fork.
+        """
+        df = df.copy()
+        for column in df.columns:
+            series = df[column]
+            if series.dtype == object or pd.api.types.is_string_dtype(series.dtype):
+                if series.nunique() <= max_unique_ratio * len(series):
+                    df[column] = series.astype("category")
+        return df
+
+    @staticmethod
+    def filter_data(df: pd.DataFrame, ranges: dict = None, indexes=None, **filters) -> pd.DataFrame:
+        """Filtra por igualdad, por varios valores y por rangos.
+
+        Cada filtro puede ser un valor (igualdad) o una lista de valores
+        aceptados; `ranges` mapea columna -> (mínimo, máximo), con None como
+        extremo abierto. Si se pasan `indexes` (ColumnIndexes del dataset) los
+        filtros se resuelven con búsqueda binaria en lugar de máscaras.
+
+        Sin filtros activos devuelve el mismo DataFrame (sin copiar), por lo
+        que el resultado debe tratarse como de solo lectura.
+        """
+        values = {}
         for column, value in filters.items():
-            if value is not None:
-                filtered_df = filtered_df[filtered_df[column] == value]
-        return filtered_df 
\ No newline at end of file
+            if value is None:
+                continue
+            if pd.api.types.is_list_like(value):
+                if len(value):
+                    values[column] = list(value)
+            else:
+                values[column] = [value]
+        ranges = {column: bounds for column, bounds in (ranges or {}).items() if bounds is not None}
+        if not values and not ranges:
+            return df
+
+        if indexes is not None and all(column in indexes for column in [*values, *ranges]):
+            positions = indexes.positions(values, ranges)
+            return df if positions is None else df.iloc[positions]
+
+        mask = np.ones(len(df), dtype=bool)
+        for column, accepted in values.items():
+            mask &= df[column].isin(accepted).to_numpy()
+        for column, (low, high) in ranges.items():
+            column_values = df[column].to_numpy(dtype=np.float64, na_value=np.nan)
+            if low is not None:
+                mask &= column_values >= low
+            if high is not None:
+                mask &= column_values <= high
+        return df[mask]
+
+    @staticmethod
+    def prepare(df: pd.DataFrame) -> pd.DataFrame:
+        """Aplica todas las transformaciones que necesita el dashboard"""
+        df = DataProcessor.calculate_reviews_per_year(df)
+        df = DataProcessor.add_price_bins(df)
+        return DataProcessor.compact(df)
+
+    @staticmethod
+    def calculate_stats(df: pd.DataFrame) -> dict:
+        """Calcula todas las métricas de las tarjetas en una sola pasada por columna"""
+        stats = _price_stats(column_values(df, "price_original"))
+        stats.update({
+            "rating_mean": _mean(column_values(df, "rating")),
+            "reviews_per_year_mean": _mean(column_values(df, "reviews_per_year")),
+            "years_hosting_mean": _mean(column_values(df, "years_hosting")),
+            "count": len(df),
+        })
+        return stats
@@ -0,0 +1,79 @@
+import numpy as np
+import pandas as pd
+from .filter_index import FILTER_COLUMNS
+
+# Rollups materializados: nombre -> columna por la que se agrupa
+ROLLUP_DIMENSIONS = {
+    "years_hosting": "years_hosting",
+    "capacity": "guests",
+    "price_range": "price_range",
+    "crawl_date": "crawled_at",
+}
+# Métricas con momentos precalculados (cantidad, suma y suma de cuadrados)
+ROLLUP_METRICS = ("rating", "reviews_per_year", "price_original")
+
+
+class Rollups:
+    """Agregados materializados al ingerir los datos.
+
+    Cada tabla guarda, por valor de la dimensión y combinación de los filtros
+    del dashboard, los momentos de cada métrica. Como los momentos se suman,
+    cualquier selección de filtros se responde re-agregando la tabla (que
+    tiene pocas filas) sin volver a recorrer los listados.
+    """
+    def __init__(self, df: pd.DataFrame):
+        self.keys = [column for column in FILTER_COLUMNS if column in df.columns]
+        self.metrics = [metric for metric in ROLLUP_METRICS if metric in df.columns]
+        moments = {}
+        for metric in self.metrics:
+            values = df[metric].to_numpy(dtype=np.float64, na_value=np.nan)
+            present = ~np.isnan(values)
+            values = np.where(present, values, 0.0)
+            moments[f"{metric}__n"] = present.astype(np.int64)
+            moments[f"{metric}__sum"] = values
+            moments[f"{metric}__sumsq"] = values * values
+        self.tables = {}
+        for name, column in ROLLUP_DIMENSIONS.items():
+            if column not in df.columns:
+                continue
+            frame = pd.DataFrame(moments, index=df.index)
+            for key in dict.fromkeys([column, *self.keys]):
+                frame[key] = df[key]
+            self.tables[name] = (
+                frame.groupby(list(dict.fromkeys([column, *self.keys])), observed=True, dropna=False)
+                .sum()
+                .reset_index()
+            )
+
+    def names(self) -> list:
+        return list(self.tables)
+
+    def query(self, name: str, **filters) -> pd.DataFrame:
+        """Agregados de la dimensión `name` para la selección de filtros.
+
+        Devuelve una fila por valor de la dimensión con `<métrica>_mean`,
+        `<métrica>_count` y `<métrica>_std` (desvío muestral, como pandas).
+        """
+        table = self.tables[name]
+        dimension = ROLLUP_DIMENSIONS[name]
+        mask = np.ones(len(table), dtype=bool)
+        for column, value in filters.items():
+            if value is None or column not in self.keys:
+                continue
+            accepted = list(value) if isinstance(value, (list, tuple, set)) else [value]
+            if accepted:
+                mask &= table[column].isin(accepted).to_numpy()
+        sums = table[mask].groupby(dimension, observed=True).sum(numeric_only=True)
+
+        result = pd.DataFrame(index=sums.index)
+        for metric in self.metrics:
+            n = sums[f"{metric}__n"].to_numpy(dtype=np.float64)
+            total = sums[f"{metric}__sum"].to_numpy()
+            with np.errstate(divide="ignore", invalid="ignore"):
+                mean = np.where(n > 0, total / n, np.nan)
+                variance = (sums[f"{metric}__sumsq"].to_numpy() - total * mean) / (n - 1)
+                std = np.where(n > 1, np.sqrt(np.maximum(variance, 0)), np.nan)
+            result[f"{metric}_mean"] = mean
+            result[f"{metric}_count"] = n.astype(np.int64)
+            result[f"{metric}_std"] = std
+        return result.reset_index()
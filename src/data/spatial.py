@@ -0,0 +1,92 @@
+import numpy as np
+import pandas as pd
+
+# Columnas con las coordenadas de cada listado
+LAT_COLUMN, LNG_COLUMN = "latitude", "longitude"
+
+
+class GridIndex:
+    """Índice espacial en grilla regular (celdas de `cell_size` grados).
+
+    Las filas se ordenan por celda (fila * columnas + columna), así que las
+    celdas de una misma fila de la grilla que caen en el viewport forman un
+    tramo contiguo y se resuelven con dos búsquedas binarias.
+    """
+    def __init__(self, lat: np.ndarray, lng: np.ndarray, cell_size: float = 0.005):
+        self.lat, self.lng = lat, lng
+        self.cell_size = cell_size
+        valid = ~(np.isnan(lat) | np.isnan(lng))
+        self.size = int(valid.sum())
+        if not self.size:
+            self.order = np.empty(0, dtype=np.intp)
+            self.cells = np.empty(0, dtype=np.int64)
+            return
+        self.lat0, self.lng0 = lat[valid].min(), lng[valid].min()
+        rows = self._row(lat[valid])
+        columns = self._column(lng[valid])
+        self.n_rows, self.n_columns = int(rows.max()) + 1, int(columns.max()) + 1
+        cells = rows * self.n_columns + columns
+        order = np.argsort(cells, kind="stable")
+        self.order = np.flatnonzero(valid)[order]
+        self.cells = cells[order]
+
+    @classmethod
+    def from_df(cls, df: pd.DataFrame, cell_size: float = 0.005):
+        """Construye el índice si el dataset tiene coordenadas, o devuelve None"""
+        if LAT_COLUMN not in df.columns or LNG_COLUMN not in df.columns:
+            return None
+        return cls(df[LAT_COLUMN].to_numpy(dtype=np.float64, na_value=np.nan),
+                   df[LNG_COLUMN].to_numpy(dtype=np.float64, na_value=np.nan), cell_size)
+
+    def _row(self, lat):
+        return np.floor((lat - self.lat0) / self.cell_size).astype(np.int64)
+
+    def _column(self, lng):
+        return np.floor((lng - self.lng0) / self.cell_size).astype(np.int64)
+
+    def bounds(self):
+        """Extensión (sur, oeste, norte, este) de los puntos indexados"""
+        lat, lng = self.lat[self.order], self.lng[self.order]
+        return lat.min(), lng.min(), lat.max(), lng.max()
+
+    def query(self, south, west, north, east) -> np.ndarray:
+        """Posiciones (ordenadas) de los puntos dentro del viewport"""
+        if not self.size:
+            return np.empty(0, dtype=np.intp)
+        first_row = max(int(self._row(np.float64(south))), 0)
+        last_row = min(int(self._row(np.float64(north))), self.n_rows - 1)
+        first_column = max(int(self._column(np.float64(west))), 0)
+        last_column = min(int(self._column(np.float64(east))), self.n_columns - 1)
+        if first_row > last_row or first_column > last_column:
+            return np.empty(0, dtype=np.intp)
+        parts = []
+        for row in range(first_row, last_row + 1):
+            start = np.searchsorted(self.cells, row * self.n_columns + first_column, side="left")
+            end = np.searchsorted(self.cells, row * self.n_columns + last_column, side="right")
+            parts.append(self.order[start:end])
+        candidates = np.concatenate(parts)
+        # Las celdas del borde pueden tener puntos fuera del viewport
+        lat, lng = self.lat[candidates], self.lng[candidates]
+        inside = (lat >= south) & (lat <= north) & (lng >= west) & (lng <= east)
+        return np.sort(candidates[inside])
+
+
+def cluster_points(lat, lng, price, bounds, grid: int = 48) -> pd.DataFrame:
+    """Agrupa puntos en una grilla de `grid` x `grid` sobre el viewport.
+
+    Devuelve una fila por celda ocupada con el centroide, la cantidad de
+    listados y el precio promedio.
+    """
+    south, west, north, east = bounds
+    rows = np.clip(((lat - south) / ((north - south) or 1) * grid).astype(np.int64), 0, grid - 1)
+    columns = np.clip(((lng - west) / ((east - west) or 1) * grid).astype(np.int64), 0, grid - 1)
+    cells = rows * grid + columns
+    counts = np.bincount(cells, minlength=grid * grid)
+    occupied = counts > 0
+    count = counts[occupied]
+    return pd.DataFrame({
+        LAT_COLUMN: np.bincount(cells, weights=lat, minlength=grid * grid)[occupied] / count,
+        LNG_COLUMN: np.bincount(cells, weights=lng, minlength=grid * grid)[occupied] / count,
+        "count": count,
+        "price_mean": np.bincount(cells, weights=price, minlength=grid * grid)[occupied] / count,
+    })
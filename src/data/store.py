@@ -0,0 +1,112 @@
+import threading
+import time
+import pandas as pd
+from .cache import PreparedCache
+from .filter_index import ColumnIndexes, FilterIndex
+from .loader import DataLoader
+from .processor import DataProcessor
+from .rollups import Rollups
+from .spatial import GridIndex
+
+
+class DataSnapshot:
+    """Dataset preparado junto con la versión del archivo del que salió y sus índices"""
+    def __init__(self, df: pd.DataFrame, version: str):
+        self.df = df
+        self.version = version
+        self.filter_index = FilterIndex(df)
+        self.column_indexes = ColumnIndexes(df)
+        self.spatial_index = GridIndex.from_df(df)
+        self.rollups = Rollups(df)
+
+
+class DataStore:
+    """Mantiene el dataset vigente y lo reemplaza cuando cambia el CSV.
+
+    La recarga prepara el dataset nuevo completo antes de publicarlo, así que
+    los lectores siempre ven una versión consistente (el reemplazo es una
+    asignación atómica de `snapshot`).
+    """
+    def __init__(self, filename: str, loader: DataLoader = None, poll_interval: float = 30,
+                 cache: PreparedCache = None):
+        self.filename = filename
+        self.loader = loader or DataLoader()
+        self.poll_interval = poll_interval
+        self.cache = cache
+        self.snapshot = None
+        self._listeners = []
+        self._lock = threading.Lock()
+        self._watcher = None
+
+    @property
+    def df(self) -> pd.DataFrame:
+        return self.snapshot.df
+
+    @property
+    def version(self) -> str:
+        return self.snapshot.version
+
+    def file_version(self) -> str:
+        """Versión del CSV en disco (mtime + tamaño), o None si no existe"""
+        filepath = self.loader.data_dir / self.filename
+        if not filepath.exists():
+            return None
+        stat = filepath.stat()
+        return f"{stat.st_mtime_ns}-{stat.st_size}"
+
+    def on_reload(self, listener):
+        """Registra una función que se llama con el snapshot nuevo tras cada recarga"""
+        self._listeners.append(listener)
+
+    def load(self) -> bool:
+        """Carga y prepara el CSV; si falla conserva el snapshot vigente"""
+        with self._lock:
+            version = self.file_version()
+            df = self._load_prepared()
+            if df is None:
+                return False
+            self.snapshot = DataSnapshot(df, version)
+        for listener in self._listeners:
+            listener(self.snapshot)
+        return True
+
+    def _load_prepared(self) -> pd.DataFrame:
+        """Lee el dataset preparado desde la cache o, si no está vigente, del CSV"""
+        filepath = self.loader.data_dir / self.filename
+        fingerprint = None
+        if self.cache and filepath.exists():
+            df = self.cache.load(filepath)
+            if df is not None:
+                print(f"Datos preparados leídos de la cache ({len(df)} filas)")
+                return df
+            # Antes de leer: si el CSV se reemplaza durante la carga, la cache no se guarda
+            fingerprint = self.cache.fingerprint(filepath)
+        df = self.loader.load_csv(self.filename)
+        if df.empty:
+            return None
+        df = DataProcessor.prepare(df)
+        if fingerprint is not None:
+            self.cache.save(filepath, df, fingerprint)
+        return df
+
+    def reload_if_changed(self) -> bool:
+        version = self.file_version()
+        if version is None or (self.snapshot and version == self.snapshot.version):
+            return False
+        print(f"Nueva versión de {self.filename} detectada, recargando datos")
+        return self.load()
+
+    def start_watcher(self):
+        """Inicia (una vez por proceso) el hilo que vigila cambios en el CSV"""
+        if self._watcher is not None and self._watcher.is_alive():
+            return
+        self._watcher = threading.Thread(target=self._watch, name="data-watcher", daemon=True)
+        self._watcher.start()
+
+    def _watch(self):
+        while True:
+            time.sleep(self.poll_interval)
+            try:
+                self.reload_if_changed()
+            except Exception as e:
+                print(f"Error al recargar datos: {e}")
@@ -0,0 +1,120 @@
+import numpy as np
+import pandas as pd
+from .processor import DataProcessor, PriceHistogram, column_values
+
+# Columnas que necesita StreamingAggregates (más las de los filtros que se usen)
+STREAMING_COLUMNS = ["price_original", "rating", "reviews", "years_hosting"]
+
+# Histogramas de bins fijos: columna -> (mínimo, máximo, bins)
+HISTOGRAM_BINS = {
+    "rating": (0.0, 5.0, 50),
+    "reviews_per_year": (0.0, 200.0, 50),
+}
+
+
+class FixedHistogram:
+    """Histograma acumulable con bins fijos; los valores fuera del rango van a los bins extremos"""
+    def __init__(self, low: float, high: float, bins: int):
+        self.edges = np.linspace(low, high, bins + 1)
+        self.counts = np.zeros(bins, dtype=np.int64)
+
+    def update(self, values: np.ndarray) -> "FixedHistogram":
+        index = np.searchsorted(self.edges, values, side="right") - 1
+        index = np.clip(index, 0, self.counts.size - 1)
+        self.counts += np.bincount(index, minlength=self.counts.size)
+        return self
+
+    def probability(self) -> np.ndarray:
+        total = self.counts.sum()
+        return self.counts / total if total else self.counts.astype(np.float64)
+
+
+class StreamingAggregates:
+    """Agregados del dashboard calculados bloque a bloque, sin tener todo el dataset en memoria.
+
+    Guarda solo estado de tamaño acotado: el histograma de precios enteros
+    (moda, mediana, mínimo y máximo exactos), sumas para los promedios,
+    momentos por años de anfitrión y los histogramas de HISTOGRAM_BINS.
+    """
+    def __init__(self, ranges: dict = None, **filters):
+        self.ranges = ranges
+        self.filters = filters
+        self.prices = PriceHistogram()
+        self.count = 0
+        self.sums = {column: [0.0, 0] for column in ("rating", "reviews_per_year", "years_hosting")}
+        self.by_years = {}
+        self.histograms = {column: FixedHistogram(*bins) for column, bins in HISTOGRAM_BINS.items()}
+
+    @staticmethod
+    def columns(**filters) -> list:
+        """Columnas a leer del CSV para calcular los agregados con esos filtros"""
+        return list(dict.fromkeys([*STREAMING_COLUMNS, *filters]))
+
+    def update(self, chunk: pd.DataFrame) -> "StreamingAggregates":
+        chunk = DataProcessor.filter_data(chunk, ranges=self.ranges, **self.filters)
+        if chunk.empty:
+            return self
+        chunk = DataProcessor.calculate_reviews_per_year(chunk)
+        self.count += len(chunk)
+        # El scraper guarda precios enteros; si hubiera centavos se redondean
+        self.prices.update(np.round(column_values(chunk, "price_original")))
+        for column, total in self.sums.items():
+            values = column_values(chunk, column).astype(np.float64, copy=False)
+            total[0] += float(values.sum())
+            total[1] += values.size
+        for column, histogram in self.histograms.items():
+            histogram.update(column_values(chunk, column))
+        self._update_years(chunk)
+        return self
+
+    def _update_years(self, chunk: pd.DataFrame):
+        """Acumula cantidad, suma y suma de cuadrados de rating y reseñas por año de anfitrión"""
+        moments = {}
+        for metric in ("rating", "reviews_per_year"):
+            values = chunk[metric].to_numpy(dtype=np.float64, na_value=np.nan)
+            present = ~np.isnan(values)
+            values = np.where(present, values, 0.0)
+            moments.update({f"{metric}__n": present.astype(np.int64), f"{metric}__sum": values,
+                            f"{metric}__sumsq": values * values})
+        grouped = pd.DataFrame(moments, index=chunk.index).groupby(chunk["years_hosting"]).sum()
+        for years, row in zip(grouped.index, grouped.to_numpy()):
+            state = self.by_years.get(years)
+            self.by_years[years] = row if state is None else state + row
+
+    def stats(self) -> dict:
+        """Mismas claves que DataProcessor.calculate_stats"""
+        def mean(column):
+            total, size = self.sums[column]
+            return total / size if size else np.nan
+        return {
+            "price_mean": self.prices.mean(),
+            "price_median": self.prices.median(),
+            "price_mode": self.prices.mode(),
+            "price_min": self.prices.min(),
+            "price_max": self.prices.max(),
+            "rating_mean": mean("rating"),
+            "reviews_per_year_mean": mean("reviews_per_year"),
+            "years_hosting_mean": mean("years_hosting"),
+            "count": self.count,
+        }
+
+    def years_hosting(self) -> pd.DataFrame:
+        """Media, cantidad y desvío (ddof=1) de rating y reseñas por año por años de anfitrión"""
+        rows = []
+        for years in sorted(self.by_years):
+            row = {"years_hosting": years}
+            for offset, metric in ((0, "rating"), (3, "reviews_per_year")):
+                n, total, squares = self.by_years[years][offset:offset + 3]
+                mean = total / n if n else np.nan
+                variance = (squares - n * mean * mean) / (n - 1) if n > 1 else np.nan
+                row.update({f"{metric}_mean": mean, f"{metric}_count": int(n),
+                            f"{metric}_std": np.sqrt(max(variance, 0.0)) if n > 1 else np.nan})
+            rows.append(row)
+        return pd.DataFrame(rows)
+
+    @classmethod
+    def from_chunks(cls, chunks, ranges: dict = None, **filters) -> "StreamingAggregates":
+        aggregates = cls(ranges=ranges, **filters)
+        for chunk in chunks:
+            aggregates.update(chunk)
+        return aggregates
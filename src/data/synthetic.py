@@ -0,0 +1,197 @@
+"""Generador de datasets sintéticos con el esquema que escribe el scraper.
+
+Uso:
+    python -m src.data.synthetic --rows 1000000 [--snapshots 12] [--format csv|parquet]
+                                 [--output data/synthetic/airbnb_data.csv] [--seed 0]
+"""
+import argparse
+from pathlib import Path
+import numpy as np
+import pandas as pd
+
+# Columnas en el orden de save_to_csv (main.py)
+SCHEMA = [
+    "id", "title", "link", "rating", "reviews",
+    "guests", "bedrooms", "beds", "baths",
+    "years_hosting", "price_original", "price_discount",
+    "nights", "total_nights", "special_offer",
+    "cleaning_fee", "service_fee", "total",
+    "latitude", "longitude", "crawled_at",
+]
+
+# Valor que guarda el scraper cuando no encuentra un dato de capacidad
+MISSING = "No disponible"
+
+# Proporción de faltantes por columna, similar a la del dataset real
+MISSING_RATES = {"bedrooms": 0.2, "beds": 0.05}
+
+# Zonas con más densidad de listados (lat, lng, desvío en grados)
+HOTSPOTS = [
+    (-34.6037, -58.3816, 0.004),  # Microcentro
+    (-34.5895, -58.3974, 0.006),  # Recoleta
+    (-34.5875, -58.4300, 0.008),  # Palermo
+    (-34.6212, -58.3731, 0.005),  # San Telmo
+]
+
+
+def _listing_attributes(rng, count, id_offset):
+    """Atributos fijos de cada listado (se repiten en todas las capturas)"""
+    guests = rng.choice(np.arange(1, 9), count, p=[0.06, 0.55, 0.14, 0.12, 0.05, 0.05, 0.02, 0.01])
+    bedrooms = np.maximum(1, np.ceil(guests / 2 - rng.random(count) * 0.6)).astype(np.int64)
+    beds = bedrooms + (rng.random(count) < 0.3)
+    baths = np.minimum(3.0, 1.0 + 0.5 * rng.binomial(bedrooms, 0.35))
+    years_hosting = np.minimum(12, rng.geometric(0.3, count) - 1)
+    # Precio: lognormal que crece con la capacidad
+    base_price = rng.lognormal(np.log(19), 0.3, count) * (1 + 0.3 * (guests - 2).clip(0))
+    # Rating alto y concentrado; mejor en promedio para anfitriones con más años
+    rating = np.clip(5 - rng.gamma(1.2, 0.12, count) + 0.01 * years_hosting, 3.0, 5.0)
+    # Ritmo de reseñas: más alto en listados baratos y bien calificados
+    review_rate = rng.gamma(2.0, 12.0, count) * (22 / base_price) ** 0.5 * (rating - 2.5) / 2.3
+
+    hotspot = rng.integers(0, len(HOTSPOTS), count)
+    centers = np.array(HOTSPOTS)[hotspot]
+    return {
+        "room_id": id_offset + np.arange(count, dtype=np.int64) + 10**17,
+        "guests": guests,
+        "bedrooms": bedrooms,
+        "beds": beds,
+        "baths": baths,
+        "years_hosting": years_hosting,
+        "base_price": base_price,
+        "rating": rating,
+        "review_rate": review_rate,
+        "latitude": centers[:, 0] + rng.normal(0, 1, count) * centers[:, 2],
+        "longitude": centers[:, 1] + rng.normal(0, 1, count) * centers[:, 2],
+    }
+
+
+def _snapshot_rows(rng, attributes, snapshot, snapshot_days, crawled_at, missing_rates):
+    """Filas de una captura: precio, reseñas y antigüedad evolucionan con el tiempo"""
+    count = attributes["guests"].size
+    elapsed_years = snapshot * snapshot_days / 365
+    years_hosting = attributes["years_hosting"] + int(elapsed_years)
+    reviews = rng.poisson(attributes["review_rate"] * (years_hosting + 0.5))
+    # Estacionalidad anual y ruido por captura
+    season = 1 + 0.15 * np.sin(2 * np.pi * elapsed_years)
+    price = np.maximum(8, np.round(attributes["base_price"] * season * rng.normal(1, 0.05, count)))
+    price = price.astype(np.int64)
+    rating = np.where(reviews > 0, np.round(attributes["rating"], 2), 0.0)
+
+    nights = rng.choice([2, 3, 4], count, p=[0.15, 0.7, 0.15])
+    total_nights = price * nights
+    special_offer = np.where(rng.random(count) < 0.05, np.round(total_nights * 0.1), 0).astype(np.int64)
+    cleaning_fee = np.round(total_nights * rng.uniform(0.1, 0.25, count)).astype(np.int64)
+    service_fee = np.round((total_nights + cleaning_fee) * 0.14).astype(np.int64)
+
+    frame = pd.DataFrame({
+        "title": "",
+        "link": [f"https://www.airbnb.com/rooms/{room_id}?adults=2" for room_id in attributes["room_id"]],
+        "rating": rating,
+        "reviews": reviews,
+        "guests": attributes["guests"],
+        "bedrooms": attributes["bedrooms"].astype(str),
+        "beds": attributes["beds"].astype(str),
+        "baths": attributes["baths"],
+        "years_hosting": years_hosting,
+        "price_original": price,
+        "price_discount": 0,
+        "nights": nights,
+        "total_nights": total_nights,
+        "special_offer": special_offer,
+        "cleaning_fee": cleaning_fee,
+        "service_fee": service_fee,
+        "total": total_nights - special_offer + cleaning_fee + service_fee,
+        "latitude": attributes["latitude"].round(6),
+        "longitude": attributes["longitude"].round(6),
+        "crawled_at": crawled_at,
+    })
+    for column, rate in missing_rates.items():
+        missing = rng.random(count) < rate
+        if missing.any():
+            frame[column] = frame[column].astype(object).where(~missing, MISSING)
+    return frame
+
+
+def generate_listings(rows: int, seed: int = 0, snapshots: int = 1, chunk_rows: int = 250_000,
+                      start_date: str = "2025-01-01", snapshot_days: int = 30,
+                      missing_rates: dict = None):
+    """Genera `rows` filas en bloques de hasta `chunk_rows` (DataFrames con SCHEMA).
+
+    Los listados se repiten en cada una de las `snapshots` capturas (con
+    `crawled_at` separado por `snapshot_days` días), con el mismo id de
+    habitación y precio/reseñas actualizados. El resultado es determinista
+    para una misma semilla y `chunk_rows`.
+    """
+    missing_rates = MISSING_RATES if missing_rates is None else missing_rates
+    listings = -(-rows // snapshots)
+    start = pd.Timestamp(start_date)
+    emitted = 0
+    for snapshot in range(snapshots):
+        crawled_at = (start + pd.Timedelta(days=snapshot * snapshot_days)).date().isoformat()
+        for block, offset in enumerate(range(0, listings, chunk_rows)):
+            count = min(chunk_rows, listings - offset, rows - emitted)
+            if count <= 0:
+                return
+            attributes = _listing_attributes(np.random.default_rng([seed, block]), count, offset)
+            frame = _snapshot_rows(np.random.default_rng([seed, block, snapshot + 1]), attributes,
+                                   snapshot, snapshot_days, crawled_at, missing_rates)
+            frame.insert(0, "id", np.arange(emitted + 1, emitted + count + 1))
+            emitted += count
+            yield frame[SCHEMA]
+
+
+def synthetic_listings(rows: int, **kwargs) -> pd.DataFrame:
+    """Dataset sintético completo en memoria (ver generate_listings)"""
+    return pd.concat(generate_listings(rows, **kwargs), ignore_index=True)
+
+
+def write_csv(chunks, path):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        for position, chunk in enumerate(chunks):
+            chunk.to_csv(f, index=False, header=position == 0)
+    return path
+
+
+def write_parquet(chunks, path):
+    """Escribe un row group por bloque (requiere pyarrow)"""
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as error:
+        raise RuntimeError("La salida Parquet requiere pyarrow") from error
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    writer = None
+    try:
+        for chunk in chunks:
+            # Columnas mixtas (números y "No disponible") se guardan como texto
+            chunk = chunk.astype({column: str for column in MISSING_RATES})
+            table = pa.Table.from_pandas(chunk, preserve_index=False)
+            if writer is None:
+                writer = pq.ParquetWriter(path, table.schema)
+            writer.write_table(table)
+    finally:
+        if writer is not None:
+            writer.close()
+    return path
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--snapshots", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--format", choices=["csv", "parquet"], default="csv")
+    parser.add_argument("--output", type=Path)
+    args = parser.parse_args()
+
+    output = args.output or Path("data/synthetic") / f"airbnb_data.{args.format}"
+    chunks = generate_listings(args.rows, seed=args.seed, snapshots=args.snapshots)
+    writer = write_csv if args.format == "csv" else write_parquet
+    print(f"Dataset sintético guardado en {writer(chunks, output)} ({args.rows:,} filas)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+import atexit
+import copy
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+
+LOG_FORMAT = "%(asctime)s %(levelname)s %(name)s: %(message)s"
+
+
+class StructuredFormatter(logging.Formatter):
+    """Agrega al mensaje los campos estructurados de `extra={"fields": {...}}`.
+
+    Con `as_json=True` cada registro se emite como una línea JSON.
+    """
+    def __init__(self, fmt=LOG_FORMAT, as_json=False):
+        super().__init__(fmt)
+        self.as_json = as_json
+
+    def format(self, record):
+        fields = getattr(record, "fields", None) or {}
+        if self.as_json:
+            entry = {
+                "time": self.formatTime(record),
+                "level": record.levelname,
+                "logger": record.name,
+                "message": record.getMessage(),
+                **fields,
+            }
+            if record.exc_info:
+                entry["exception"] = self.formatException(record.exc_info)
+            return json.dumps(entry, ensure_ascii=False, default=str)
+        message = super().format(record)
+        if fields:
+            message += " " + " ".join(f"{key}={value}" for key, value in fields.items())
+        return message
+
+
+class DeferredQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler que no formatea en el hilo que registra.
+
+    El formateo (y la escritura) quedan a cargo del hilo del QueueListener,
+    así el camino caliente solo encola el registro.
+    """
+    def prepare(self, record):
+        record = copy.copy(record)
+        if isinstance(getattr(record, "fields", None), dict):
+            record.fields = dict(record.fields)
+        return record
+
+
+class BufferedListener(logging.handlers.QueueListener):
+    """QueueListener que puede detenerse más de una vez (p. ej. a mano y en atexit)"""
+    def stop(self):
+        if self._thread is not None:
+            super().stop()
+
+
+def setup_logging(level=None, log_file=None, as_json=None):
+    """Configura el logging raíz con un handler en cola y devuelve el listener.
+
+    Los valores por defecto salen de LOG_LEVEL (INFO), LOG_FILE y
+    LOG_FORMAT=json. El listener se detiene (vaciando la cola) al salir.
+    """
+    level = level or os.environ.get("LOG_LEVEL", "INFO")
+    log_file = log_file or os.environ.get("LOG_FILE")
+    if as_json is None:
+        as_json = os.environ.get("LOG_FORMAT", "").lower() == "json"
+
+    formatter = StructuredFormatter(as_json=as_json)
+    handlers = [logging.StreamHandler(sys.stderr)]
+    if log_file:
+        handlers.append(logging.FileHandler(log_file, encoding="utf-8"))
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    log_queue = queue.SimpleQueue()
+    listener = BufferedListener(log_queue, *handlers, respect_handler_level=True)
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        if isinstance(handler, DeferredQueueHandler):
+            root.removeHandler(handler)
+    root.addHandler(DeferredQueueHandler(log_queue))
+    root.setLevel(level.upper() if isinstance(level, str) else level)
+    listener.start()
+    atexit.register(listener.stop)
+    return listener
+
+
+def setup_worker_logging(level):
+    """Logging para procesos de un pool: escribe directo a stderr.
+
+    El listener de la cola vive en el proceso padre, así que en los hijos la
+    cola heredada no tiene quién la vacíe.
+    """
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        if isinstance(handler, DeferredQueueHandler):
+            root.removeHandler(handler)
+    handler = logging.StreamHandler(sys.stderr)
+    handler.setFormatter(StructuredFormatter(as_json=os.environ.get("LOG_FORMAT", "").lower() == "json"))
+    root.addHandler(handler)
+    root.setLevel(level)
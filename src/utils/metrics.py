@@ -0,0 +1,185 @@
+import os
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Límites superiores (segundos) de los buckets de duración
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+
+class Histogram:
+    """Histograma de buckets fijos (acumulativo al exportar, como Prometheus)"""
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)  # el último es +Inf
+        self.count = 0
+        self.sum = 0.0
+        self.min = float("inf")
+        self.max = 0.0
+
+    def observe(self, value: float):
+        index = len(self.buckets)
+        for position, bound in enumerate(self.buckets):
+            if value <= bound:
+                index = position
+                break
+        self.counts[index] += 1
+        self.count += 1
+        self.sum += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def cumulative(self) -> list:
+        total, result = 0, []
+        for count in self.counts:
+            total += count
+            result.append(total)
+        return result
+
+    def quantile(self, q: float) -> float:
+        """Cuantil aproximado por interpolación lineal dentro del bucket"""
+        if not self.count:
+            return float("nan")
+        rank = q * self.count
+        lower, seen = self.min, 0
+        for bound, count in zip(self.buckets + (self.max,), self.counts):
+            if count and seen + count >= rank:
+                upper = min(bound, self.max)
+                return lower + (upper - lower) * (rank - seen) / count
+            seen += count
+            lower = max(bound, self.min)
+        return self.max
+
+
+def _label_text(labels) -> str:
+    return ",".join(f'{key}="{value}"' for key, value in labels)
+
+
+class MetricsRegistry:
+    """Contadores e histogramas con etiquetas, exportables en formato Prometheus"""
+    def __init__(self, prefix: str = "crawler", buckets=DEFAULT_BUCKETS):
+        self.prefix = prefix
+        self.buckets = buckets
+        self.histograms = {}
+        self.counters = {}
+        self._lock = threading.Lock()
+
+    def observe(self, name: str, value: float, buckets=None, **labels):
+        """Registra un valor; `buckets` solo se usa al crear el histograma"""
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = Histogram(buckets or self.buckets)
+            histogram.observe(value)
+
+    def inc(self, name: str, value: float = 1, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    @contextmanager
+    def span(self, stage: str, **labels):
+        """Mide la duración del bloque en el histograma `<prefix>_stage_seconds`"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe("stage_seconds", time.perf_counter() - start, stage=stage, **labels)
+
+    def to_prometheus(self) -> str:
+        """Texto en el formato de exposición de Prometheus"""
+        lines = []
+        with self._lock:
+            for name in sorted({name for name, _ in self.counters}):
+                metric = f"{self.prefix}_{name}"
+                lines.append(f"# TYPE {metric} counter")
+                for (counter, labels), value in sorted(self.counters.items()):
+                    if counter == name:
+                        suffix = f"{{{_label_text(labels)}}}" if labels else ""
+                        lines.append(f"{metric}{suffix} {value}")
+            for name in sorted({name for name, _ in self.histograms}):
+                metric = f"{self.prefix}_{name}"
+                lines.append(f"# TYPE {metric} histogram")
+                for (histogram_name, labels), histogram in sorted(self.histograms.items()):
+                    if histogram_name != name:
+                        continue
+                    base = _label_text(labels)
+                    separator = "," if base else ""
+                    bounds = [str(bound) for bound in histogram.buckets] + ["+Inf"]
+                    for bound, count in zip(bounds, histogram.cumulative()):
+                        lines.append(f'{metric}_bucket{{{base}{separator}le="{bound}"}} {count}')
+                    suffix = f"{{{base}}}" if base else ""
+                    lines.append(f"{metric}_sum{suffix} {histogram.sum}")
+                    lines.append(f"{metric}_count{suffix} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+    def write(self, path):
+        """Escribe el texto Prometheus de forma atómica (apto para node_exporter)"""
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(self.to_prometheus())
+        os.replace(tmp_path, path)
+
+    def rows(self) -> list:
+        """Resumen de cada histograma como lista de diccionarios (para JSON)"""
+        with self._lock:
+            items = list(self.histograms.items())
+        return [
+            {
+                "metric": f"{self.prefix}_{name}",
+                **dict(labels),
+                "count": histogram.count,
+                "sum": histogram.sum,
+                "mean": histogram.sum / histogram.count,
+                "p50": histogram.quantile(0.5),
+                "p95": histogram.quantile(0.95),
+                "max": histogram.max,
+            }
+            for (name, labels), histogram in sorted(items, key=lambda item: -item[1].sum)
+        ]
+
+    def summary(self) -> str:
+        """Tabla de tiempos por etapa ordenada por tiempo total"""
+        with self._lock:
+            rows = [(dict(labels), histogram) for (name, labels), histogram in self.histograms.items()
+                    if name == "stage_seconds"]
+        rows.sort(key=lambda row: row[1].sum, reverse=True)
+        lines = [f"{'etapa':<28} {'n':>6} {'total s':>9} {'media s':>8} {'p50 s':>7} {'p95 s':>7} {'máx s':>7}"]
+        for labels, histogram in rows:
+            stage = labels.pop("stage")
+            if labels:
+                stage = f"{stage} ({', '.join(str(value) for value in labels.values())})"
+            lines.append(
+                f"{stage:<28} {histogram.count:>6} {histogram.sum:>9.2f} "
+                f"{histogram.sum / histogram.count:>8.3f} {histogram.quantile(0.5):>7.3f} "
+                f"{histogram.quantile(0.95):>7.3f} {histogram.max:>7.3f}"
+            )
+        return "\n".join(lines)
+
+
+def start_http_server(registry: MetricsRegistry, port: int, host: str = "0.0.0.0"):
+    """Sirve /metrics en un hilo daemon mientras dura el proceso"""
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path != "/metrics":
+                self.send_error(404)
+                return
+            body = registry.to_prometheus().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), MetricsHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+# Registro por defecto del proceso
+REGISTRY = MetricsRegistry()
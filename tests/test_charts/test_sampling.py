@@ -0,0 +1,46 @@
+import numpy as np
+import pandas as pd
+from src.charts.sampling import compact_numeric, density_sample
+
+def test_density_sample_caps_points_and_keeps_outliers():
+    rng = np.random.default_rng(1)
+    # Nube densa más un punto extremo aislado
+    test_data = pd.DataFrame({
+        'reviews': np.append(rng.normal(50, 5, 200_000), 1_000),
+        'price_original': np.append(rng.normal(20, 2, 200_000), 500)
+    })
+
+    sample = density_sample(test_data, 'reviews', 'price_original', max_points=5_000)
+
+    assert len(sample) <= 5_000
+    assert sample['price_original'].max() == 500
+
+def test_density_sample_returns_small_data_unchanged():
+    test_data = pd.DataFrame({'reviews': [1, 2, 3], 'price_original': [10, 20, 30]})
+
+    assert density_sample(test_data, 'reviews', 'price_original', max_points=10) is test_data
+
+def test_density_sample_is_capped_when_cells_exceed_budget():
+    rng = np.random.default_rng(2)
+    # Datos dispersos: casi todas las 64x64 celdas ocupadas, más celdas que puntos pedidos
+    test_data = pd.DataFrame({'reviews': rng.uniform(0, 1, 50_000),
+                              'price_original': rng.uniform(0, 1, 50_000)})
+
+    for max_points in (1_000, 5_000, 20_000):
+        sample = density_sample(test_data, 'reviews', 'price_original', max_points=max_points)
+        assert len(sample) <= max_points
+        assert len(sample) > max_points * 0.9
+
+def test_compact_numeric_downcasts_only_whole_numbers():
+    test_data = pd.DataFrame({
+        'price_original': [10.0, 20.0, 300.0],
+        'rating': [4.5, 4.8, 5.0],
+        'reviews': [1.0, np.nan, 3.0],
+    })
+
+    compact = compact_numeric(test_data, test_data.columns)
+
+    assert compact['price_original'].dtype == np.int16
+    assert compact['rating'].dtype == np.float64
+    assert compact['reviews'].dtype == np.float64
+    assert (compact['price_original'] == test_data['price_original']).all()
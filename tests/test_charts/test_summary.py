@@ -0,0 +1,22 @@
+import numpy as np
+import pytest
+from src.charts.summary import box_summary, histogram_summary, kde_grid
+
+def test_box_summary_quartiles_and_whiskers():
+    values = np.array([1, 2, 3, 4, 5, 6, 7, 8, 9, 100], dtype=float)
+
+    summary = box_summary(values)
+
+    assert summary['median'] == 5.5
+    assert summary['upperfence'] == 9
+    assert list(summary['outliers']) == [100]
+
+def test_histogram_and_kde_are_normalized():
+    values = np.random.default_rng(0).normal(10, 2, 50_000)
+
+    histogram = histogram_summary(values, bins=30)
+    kde = kde_grid(values)
+
+    assert histogram['probability'].sum() == pytest.approx(1)
+    step = kde['x'][1] - kde['x'][0]
+    assert kde['density'].sum() * step == pytest.approx(1, abs=0.01)
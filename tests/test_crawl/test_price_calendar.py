@@ -0,0 +1,30 @@
+from datetime import date
+import numpy as np
+from src.crawl.price_calendar import PriceMatrix, stay_windows, with_stay_dates
+
+def test_stay_windows_and_listing_url_dates():
+    windows = stay_windows("2025-03-01", count=3, nights=2, step=7)
+
+    assert windows == [(date(2025, 3, 1), date(2025, 3, 3)), (date(2025, 3, 8), date(2025, 3, 10)),
+                       (date(2025, 3, 15), date(2025, 3, 17))]
+    url = with_stay_dates("https://www.airbnb.com/rooms/1?adults=2&check_in=2025-01-16&check_out=2025-01-19",
+                          *windows[1])
+    assert url == "https://www.airbnb.com/rooms/1?adults=2&check_in=2025-03-08&check_out=2025-03-10"
+
+def test_price_matrix_roundtrip(tmp_path):
+    windows = stay_windows("2025-03-01", count=2)
+    matrix = PriceMatrix(["111", "222"], windows)
+    matrix.set(0, 1, {"price_original": "25", "nights": "3", "total": "90", "cleaning_fee": "0",
+                      "service_fee": None})
+
+    path = matrix.save(tmp_path / "prices")
+    loaded = PriceMatrix.load(path)
+
+    assert path.name == "prices.npz"
+    assert loaded.room_ids == ["111", "222"]
+    assert loaded.windows == windows
+    assert loaded.field("total")[0, 1] == 90
+    # Un cargo de 0 es un dato; el campo no encontrado (None) queda en NaN
+    assert loaded.field("cleaning_fee")[0, 1] == 0
+    assert np.isnan(loaded.field("service_fee")[0, 1])
+    assert np.isnan(loaded.field("price_original")[1]).all()
@@ -0,0 +1,93 @@
+import json
+import threading
+import time
+import pytest
+from src.crawl.jobs import load_jobs
+from src.crawl.scheduler import FairScheduler
+
+def test_scheduler_shares_slots_by_priority():
+    scheduler = FairScheduler(workers=1)
+    order = []
+    for name, weight in [("centro", 2), ("palermo", 1)]:
+        scheduler.add_queue(name, weight)
+        for _ in range(6):
+            scheduler.submit(name, order.append, name)
+
+    assert scheduler.run() == 0
+    # Peso 2 contra 1: dos turnos de centro por cada uno de palermo mientras ambos tienen tareas
+    assert order[:6] == ["centro", "palermo", "centro", "centro", "palermo", "centro"]
+    assert order.count("palermo") == 6
+
+def test_scheduler_respects_worker_budget_and_reports_done():
+    scheduler = FairScheduler(workers=3)
+    lock = threading.Lock()
+    state = {"active": 0, "peak": 0}
+    done = []
+
+    def task():
+        with lock:
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+        time.sleep(0.01)
+        with lock:
+            state["active"] -= 1
+
+    def search(name):
+        # Como la búsqueda del crawler: encola los listados encontrados
+        for _ in range(5):
+            scheduler.submit(name, task)
+
+    for name in ["a", "b", "c", "d"]:
+        scheduler.add_queue(name, on_done=lambda name=name: done.append(name))
+        scheduler.submit(name, search, name)
+    scheduler.submit("a", lambda: 1 / 0)
+
+    assert scheduler.run() == 1
+    assert state["peak"] == 3
+    assert sorted(done) == ["a", "b", "c", "d"]
+
+def test_failing_on_done_is_counted_and_keeps_the_worker():
+    scheduler = FairScheduler(workers=1)
+    order = []
+
+    def fail_to_save():
+        raise OSError("disco lleno")
+
+    scheduler.add_queue("a", on_done=fail_to_save)
+    scheduler.add_queue("b")
+    scheduler.submit("a", order.append, "a")
+    for _ in range(3):
+        scheduler.submit("b", order.append, "b")
+
+    # Con un solo worker, si on_done lo matara las tareas de "b" quedarían sin hacer
+    assert scheduler.run() == 1
+    assert order == ["a", "b", "b", "b"]
+
+def test_load_jobs_expands_date_ranges(tmp_path):
+    spec = tmp_path / "jobs.json"
+    spec.write_text(json.dumps({
+        "workers": 4,
+        "defaults": {"adults": 3},
+        "jobs": [
+            {"name": "palermo", "query": "Palermo", "bbox": [-34.6, -58.44, -34.57, -58.41],
+             "dates": [["2025-03-01", "2025-03-04"], ["2025-04-01", "2025-04-04"]],
+             "output": "data/palermo.csv"},
+            {"name": "centro", "url": "https://www.airbnb.com.ar/s/Microcentro/homes", "priority": 2},
+        ],
+    }))
+
+    jobs, workers = load_jobs(spec)
+
+    assert workers == 4
+    assert [job.name for job in jobs] == ["palermo-2025-03-01", "palermo-2025-04-01", "centro"]
+    assert jobs[1].output.endswith("palermo-2025-04-01.csv")
+    url = jobs[0].search_url()
+    assert "checkin=2025-03-01" in url and "adults=3" in url and "ne_lat=-34.57" in url
+    assert jobs[2].search_url() == "https://www.airbnb.com.ar/s/Microcentro/homes"
+
+def test_load_jobs_rejects_duplicate_names(tmp_path):
+    spec = tmp_path / "jobs.json"
+    spec.write_text(json.dumps({"jobs": [{"name": "x", "query": "A"}, {"name": "x", "query": "B"}]}))
+
+    with pytest.raises(ValueError):
+        load_jobs(spec)
@@ -0,0 +1,61 @@
+import time
+from concurrent.futures import ProcessPoolExecutor
+from src.crawl.work_queue import WorkQueue
+
+def drain(path, owner):
+    """Worker de prueba: completa todas las tareas que consigue"""
+    queue = WorkQueue(path)
+    done = 0
+    while (task := queue.lease(owner)) is not None:
+        key, url = task
+        done += queue.complete(key, owner, {"link": url, "owner": owner})
+    queue.close()
+    return done
+
+def test_put_deduplicates_by_room_id(tmp_path):
+    queue = WorkQueue(tmp_path / "queue.db")
+
+    added = queue.put_many([("1", "https://www.airbnb.com/rooms/1?adults=2"),
+                            ("1", "https://www.airbnb.com/rooms/1?adults=3"),
+                            ("2", "https://www.airbnb.com/rooms/2")])
+
+    assert added == 2
+    assert not queue.put("2", "https://www.airbnb.com/rooms/2?check_in=x")
+    assert queue.counts() == {"pending": 2}
+
+def test_expired_lease_is_redelivered_and_first_result_wins(tmp_path):
+    queue = WorkQueue(tmp_path / "queue.db", lease_seconds=0.05)
+    queue.put("1", "https://www.airbnb.com/rooms/1")
+
+    assert queue.lease("lento") == ("1", "https://www.airbnb.com/rooms/1")
+    assert queue.lease("rápido") is None
+    time.sleep(0.1)
+    assert queue.lease("rápido") == ("1", "https://www.airbnb.com/rooms/1")
+
+    assert queue.complete("1", "rápido", {"rating": "4.9"})
+    assert not queue.complete("1", "lento", {"rating": "4.8"})
+    assert queue.results() == [{"rating": "4.9"}]
+    assert queue.unfinished() == 0
+
+def test_failed_task_is_retried_until_max_attempts(tmp_path):
+    queue = WorkQueue(tmp_path / "queue.db", max_attempts=2)
+    queue.put("1", "https://www.airbnb.com/rooms/1")
+
+    for _ in range(2):
+        assert queue.lease("worker") is not None
+        queue.fail("1", "worker", "timeout")
+
+    assert queue.lease("worker") is None
+    assert queue.counts() == {"failed": 1}
+
+def test_concurrent_workers_complete_each_task_once(tmp_path):
+    path = tmp_path / "queue.db"
+    queue = WorkQueue(path)
+    queue.put_many((str(i), f"https://www.airbnb.com/rooms/{i}") for i in range(200))
+
+    with ProcessPoolExecutor(3) as executor:
+        done = list(executor.map(drain, [path] * 3, ["a", "b", "c"]))
+
+    assert sum(done) == 200
+    results = queue.results()
+    assert [result["link"] for result in results] == [f"https://www.airbnb.com/rooms/{i}" for i in range(200)]
@@ -0,0 +1,12 @@
+import pytest
+
+@pytest.fixture(scope="session", autouse=True)
+def plotly_loaded():
+    """Carga plotly una vez por sesión, fuera de las mediciones de memoria.
+
+    build_charts importa plotly.express de forma diferida (arranque rápido)
+    y el primer gráfico del proceso carga los validadores de plotly; ese
+    costo único no es una asignación del callback.
+    """
+    import plotly.express as px
+    px.scatter(x=[0, 1], y=[0, 1])
@@ -0,0 +1,46 @@
+import tracemalloc
+import numpy as np
+import pandas as pd
+import pytest
+from src.data.processor import DataProcessor
+from src.dashboard.callbacks import build_charts, build_stats
+
+# Múltiplo máximo del tamaño del subconjunto filtrado que puede asignar un callback
+MAX_PEAK_MULTIPLE = 4
+
+@pytest.fixture(scope="module")
+def large_df():
+    rng = np.random.default_rng(0)
+    rows = 200_000
+    test_data = pd.DataFrame({
+        'rating': rng.uniform(4.0, 5.0, rows).round(2),
+        'reviews': rng.poisson(40, rows),
+        'guests': rng.integers(1, 7, rows),
+        'bedrooms': rng.choice(['1', '2', 'No disponible'], rows),
+        'beds': rng.choice(['1', '2', '3', 'No disponible'], rows),
+        'baths': rng.choice([1.0, 1.5, 2.0], rows),
+        'years_hosting': rng.integers(0, 13, rows),
+        'price_original': rng.gamma(9, 2.3, rows).round().astype(np.int64),
+    })
+    test_data = DataProcessor.calculate_reviews_per_year(test_data)
+    return DataProcessor.add_price_bins(test_data)
+
+def peak_allocation(func, *args):
+    tracemalloc.start()
+    try:
+        func(*args)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+@pytest.mark.parametrize("build, args", [
+    (build_charts, (1.0, None, None, "plotly_white")),
+    (build_stats, (1.0, None, None)),
+])
+def test_callback_peak_memory_is_bounded_by_filtered_subset(large_df, build, args):
+    subset = DataProcessor.filter_data(large_df, baths=1.0)
+    subset_bytes = subset.memory_usage(deep=True).sum()
+
+    peak = peak_allocation(build, large_df, *args)
+
+    assert peak < MAX_PEAK_MULTIPLE * subset_bytes
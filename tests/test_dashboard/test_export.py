@@ -0,0 +1,71 @@
+import io
+import numpy as np
+import pandas as pd
+import pytest
+from flask import Flask
+from src.data.processor import DataProcessor
+from src.data.store import DataSnapshot
+from src.dashboard import export
+
+class SnapshotStore:
+    def __init__(self, df):
+        self.snapshot = DataSnapshot(df, "v1")
+
+@pytest.fixture
+def client(monkeypatch):
+    rng = np.random.default_rng(0)
+    rows = 1_000
+    test_data = DataProcessor.prepare(pd.DataFrame({
+        'rating': rng.uniform(4, 5, rows).round(2),
+        'reviews': rng.integers(0, 100, rows),
+        'bedrooms': rng.choice(['1', '2'], rows),
+        'beds': rng.choice(['1', '2', 'No disponible'], rows),
+        'baths': rng.choice([1.0, 1.5], rows),
+        'years_hosting': rng.integers(0, 10, rows),
+        'price_original': rng.integers(10, 60, rows)
+    }))
+    # Bloques chicos para ejercitar el streaming en varias partes
+    monkeypatch.setattr(export, "EXPORT_CHUNK_ROWS", 64)
+    server = Flask(__name__)
+    export.register_export_routes(server, SnapshotStore(test_data))
+    return server.test_client(), test_data
+
+def test_csv_export_streams_filtered_rows(client):
+    test_client, test_data = client
+    query = export.export_query(beds=['1', '2'], ranges={'price_original': (20, 40)})
+
+    response = test_client.get(f"/export/csv?{query}")
+    exported = pd.read_csv(io.BytesIO(response.data), dtype={'beds': str})
+
+    expected = test_data[test_data['beds'].isin(['1', '2']) & test_data['price_original'].between(20, 40)]
+    assert response.status_code == 200
+    assert list(exported['price_original']) == list(expected['price_original'])
+
+def test_parquet_export_writes_one_row_group_per_chunk(client):
+    pq = pytest.importorskip("pyarrow.parquet")
+    test_client, test_data = client
+
+    response = test_client.get("/export/parquet?baths=1.5")
+    parquet_file = pq.ParquetFile(io.BytesIO(response.data))
+
+    expected_rows = int((test_data['baths'] == 1.5).sum())
+    assert parquet_file.metadata.num_rows == expected_rows
+    assert parquet_file.metadata.num_row_groups == -(-expected_rows // 64)
+
+@pytest.mark.parametrize("query", ["reviews=3", "beds_min=1", "price_original_min=x", "foo=1"])
+def test_export_rejects_unknown_or_unindexed_filters(client, query):
+    test_client, _ = client
+
+    assert test_client.get(f"/export/csv?{query}").status_code == 400
+
+def test_export_rejects_filter_on_a_column_without_index(client):
+    _, test_data = client
+    store = SnapshotStore(test_data)
+    # Columna filtrable presente en el DataFrame pero sin índice: antes era un KeyError (500)
+    store.snapshot.column_indexes.indexes.pop('price_original')
+    server = Flask(__name__)
+    export.register_export_routes(server, store)
+
+    response = server.test_client().get("/export/csv?price_original_min=15")
+
+    assert response.status_code == 400
@@ -0,0 +1,34 @@
+import json
+from flask import Flask
+from src.dashboard.profiling import CallbackProfiler, register_profiling_routes
+
+def test_disabled_profiler_leaves_callbacks_untouched():
+    profiler = CallbackProfiler(enabled=False)
+    def callback():
+        return 1
+    assert profiler.callback("update_stats")(callback) is callback
+    with profiler.span("filter"):
+        pass
+    assert not profiler.registry.histograms
+
+def test_profiler_records_timing_payload_and_dumps_cprofile(tmp_path):
+    profiler = CallbackProfiler(enabled=True, profile_dir=tmp_path)
+
+    @profiler.callback("update_stats", outputs=["precio", "rating"])
+    def update_stats():
+        with profiler.span("stats", callback="update_stats"):
+            return ["$100", "4.8"]
+
+    server = Flask(__name__)
+    server.route("/stats")(lambda: json.dumps(update_stats()))
+    register_profiling_routes(server, profiler)
+    client = server.test_client()
+
+    assert client.get("/stats", headers={"X-Profile": "1"}).status_code == 200
+    rows = json.loads(client.get("/debug/profile").data)
+
+    stages = {(row.get("stage"), row.get("output")) for row in rows}
+    assert {("callback", None), ("stats", None), (None, "precio"), (None, "rating")} <= stages
+    payload = next(row for row in rows if row.get("output") == "precio")
+    assert payload["max"] == len('"$100"')
+    assert len(list(tmp_path.glob("*.prof"))) == 1
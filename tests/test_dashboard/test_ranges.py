@@ -0,0 +1,21 @@
+import pandas as pd
+from src.dashboard.callbacks import ranges_key, slider_update
+
+# Extremos de los cuatro sliders (precio, rating, reseñas, años)
+BOUNDS = [10.0, 50.0, 0.0, 5.0, 0.0, 300.0, 0.0, 12.0]
+
+def test_slider_at_full_range_does_not_filter():
+    values = [[10.0, 50.0], [0.0, 5.0], [0.0, 100.0], None]
+
+    assert ranges_key(values, BOUNDS) == (("reviews", (0.0, 100.0)),)
+    # Sin extremos conocidos cada valor es un filtro
+    assert len(ranges_key(values)) == 3
+
+def test_slider_update_after_reload():
+    prices = pd.Series([5, 20, 80])
+
+    # En rango completo: pasa al rango completo del dataset nuevo
+    assert slider_update(prices, [10.0, 50.0], 10.0, 50.0) == (5.0, 80.0, [5.0, 80.0])
+    # Con una selección: se conserva, recortada a los extremos nuevos
+    assert slider_update(prices, [15.0, 30.0], 10.0, 50.0) == (5.0, 80.0, [15.0, 30.0])
+    assert slider_update(pd.Series([20, 25]), [15.0, 30.0], 10.0, 50.0) == (20.0, 25.0, [20.0, 25.0])
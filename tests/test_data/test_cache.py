@@ -0,0 +1,60 @@
+import json
+import os
+import pandas as pd
+from src.data.cache import PreparedCache
+from src.data.loader import DataLoader
+from src.data.store import DataStore
+
+def write_csv(path, prices):
+    pd.DataFrame({'price_original': prices}).to_csv(path, index=False)
+
+def test_cache_hit_and_invalidation_on_content_change(tmp_path):
+    source = tmp_path / 'data.csv'
+    write_csv(source, [10, 20, 30])
+    cache = PreparedCache(tmp_path / '.cache')
+    assert cache.load(source) is None
+
+    df = pd.read_csv(source)
+    assert cache.save(source, df, cache.fingerprint(source))
+    pd.testing.assert_frame_equal(cache.load(source), df)
+
+    write_csv(source, [10, 20, 40])
+    assert cache.load(source) is None
+
+def test_touched_file_is_rehashed_once(tmp_path, monkeypatch):
+    source = tmp_path / 'data.csv'
+    write_csv(source, [10, 20, 30])
+    cache = PreparedCache(tmp_path / '.cache')
+    cache.save(source, pd.read_csv(source), cache.fingerprint(source))
+    stat = source.stat()
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    hashes = []
+    original_hash = PreparedCache._file_hash
+    monkeypatch.setattr(PreparedCache, '_file_hash', staticmethod(
+        lambda path: hashes.append(path) or original_hash(path)))
+
+    assert cache.load(source) is not None
+    assert cache.load(source) is not None
+    assert len(hashes) == 1
+    meta = json.loads((tmp_path / '.cache' / 'data.csv.meta.json').read_text())
+    assert meta['mtime_ns'] == source.stat().st_mtime_ns
+
+def test_csv_replaced_during_load_is_not_cached(tmp_path, monkeypatch):
+    source = tmp_path / 'data.csv'
+    pd.DataFrame({'reviews': [1, 2], 'years_hosting': [1, 1], 'price_original': [10, 20],
+                  'baths': [1.0, 1.0], 'bedrooms': ['1', '1'], 'beds': ['1', '1']}).to_csv(source, index=False)
+    loader = DataLoader(tmp_path)
+    original_load = loader.load_csv
+
+    def load_then_replace(filename):
+        df = original_load(filename)
+        # Un scraping nuevo reemplaza el archivo mientras se prepara el anterior
+        with open(source, 'a') as f:
+            f.write('3,1,30,1.0,1,1\n')
+        return df
+    monkeypatch.setattr(loader, 'load_csv', load_then_replace)
+    cache = PreparedCache(tmp_path / '.cache')
+
+    assert DataStore('data.csv', loader=loader, cache=cache).load()
+    assert cache.load(source) is None
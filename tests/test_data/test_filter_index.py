@@ -0,0 +1,33 @@
+import pandas as pd
+from src.data.filter_index import FilterIndex
+
+def test_options_narrow_with_other_selections():
+    test_data = pd.DataFrame({
+        'baths': [1.0, 1.0, 1.5, 2.0],
+        'bedrooms': ['1', '1', '2', 'No disponible'],
+        'beds': ['1', '2', '2', None]
+    })
+
+    index = FilterIndex(test_data)
+
+    assert index.options('beds') == ['1', '2']
+    assert index.options('beds', baths=1.5) == ['2']
+    assert index.options('bedrooms', beds='2') == ['1', '2']
+    assert index.options('bedrooms', baths=2.0) == ['No disponible']
+    assert index.options('baths', bedrooms='1', beds='2') == [1.0]
+    assert index.options('baths', bedrooms='2', beds='1') == []
+    assert index.count() == 4
+    assert index.count(baths=1.0, beds='2') == 1
+
+def test_options_with_multiple_selections():
+    test_data = pd.DataFrame({
+        'baths': [1.0, 1.5, 2.0],
+        'bedrooms': ['1', '2', '3'],
+        'beds': ['1', '2', '3']
+    })
+
+    index = FilterIndex(test_data)
+
+    assert index.options('beds', baths=[1.0, 2.0]) == ['1', '3']
+    assert index.options('beds', baths=[]) == ['1', '2', '3']
+    assert index.count(baths=[1.0, 1.5]) == 2
@@ -1,6 +1,8 @@
 import pytest
+import numpy as np
 import pandas as pd
-from src.data.processor import DataProcessor
+from src.data.filter_index import ColumnIndexes
+from src.data.processor import DataProcessor, PriceHistogram
 
 def test_calculate_reviews_per_year():
     # Datos de prueba
@@ -14,4 +16,77 @@ def test_calculate_reviews_per_year():
     
     # Verificar resultados
     expected_reviews_per_year = [5, 5, 30]
-    assert all(processed_df['reviews_per_year'] == expected_reviews_per_year) 
\ No newline at end of file
+    assert all(processed_df['reviews_per_year'] == expected_reviews_per_year) 
+
+def test_calculate_stats_matches_pandas():
+    test_data = pd.DataFrame({
+        'price_original': [20, 22, 22, 19, 54, 0],
+        'rating': [4.8, 5.0, None, 4.5, 4.9, 4.7],
+        'reviews_per_year': [5.0, 2.5, 10.0, 1.0, 3.0, 4.0],
+        'years_hosting': [2, 4, 0, 3, 1, 5]
+    })
+
+    stats = DataProcessor.calculate_stats(test_data)
+
+    assert stats['price_mean'] == pytest.approx(test_data['price_original'].mean())
+    assert stats['price_median'] == test_data['price_original'].median()
+    assert stats['price_mode'] == test_data['price_original'].mode().iloc[0]
+    assert stats['price_min'] == 0
+    assert stats['price_max'] == 54
+    assert stats['rating_mean'] == pytest.approx(test_data['rating'].mean())
+    assert stats['count'] == 6
+
+
+def test_price_histogram_incremental_median():
+    histogram = PriceHistogram()
+    histogram.update(np.array([50, 60]))
+    histogram.update(np.array([10, 20, 30]))
+
+    assert histogram.median() == 30
+    assert histogram.min() == 10
+    assert histogram.max() == 60
+
+
+def test_add_price_bins_is_ordered_categorical():
+    test_data = pd.DataFrame({'price_original': [10, 20, 30, 40, 50, 60, 70, 80, 90, 100]})
+
+    processed_df = DataProcessor.add_price_bins(test_data)
+
+    price_range = processed_df['price_range']
+    assert price_range.cat.ordered
+    assert len(price_range.cat.categories) == 5
+    assert price_range.iloc[0] == price_range.cat.categories[0]
+    assert price_range.cat.categories[-1].endswith('$100')
+    assert 'price_range' not in test_data.columns
+
+
+def test_price_bins_merges_bins_with_the_same_rounded_label():
+    prices = pd.Series([10.0, 10.2, 10.4, 10.6, 10.8, 11.0] * 3)
+
+    price_range = DataProcessor.price_bins(prices)
+
+    # Los cuantiles 10.2, 10.4, ... se redondean a $10 o $11: quedaría "$10 - $10" repetido
+    assert list(price_range.cat.categories) == ["$10 - $11"]
+    assert price_range.notna().all()
+
+
+def test_filter_data_multi_value_and_ranges_match_with_indexes():
+    rng = np.random.default_rng(0)
+    test_data = pd.DataFrame({
+        'beds': rng.choice(['1', '2', '3', 'No disponible'], 1_000),
+        'baths': rng.choice([1.0, 1.5, 2.0], 1_000),
+        'price_original': rng.integers(0, 100, 1_000),
+        'rating': rng.uniform(4, 5, 1_000)
+    })
+    filters = dict(beds=['1', '3'], baths=1.5,
+                   ranges={'price_original': (20, 60), 'rating': (None, 4.8)})
+
+    masked = DataProcessor.filter_data(test_data, **filters)
+    indexed = DataProcessor.filter_data(test_data, indexes=ColumnIndexes(test_data), **filters)
+
+    expected = test_data[test_data['beds'].isin(['1', '3']) & (test_data['baths'] == 1.5)
+                         & test_data['price_original'].between(20, 60) & (test_data['rating'] <= 4.8)]
+    assert list(masked.index) == list(expected.index)
+    assert list(indexed.index) == list(expected.index)
+    assert DataProcessor.filter_data(test_data, indexes=ColumnIndexes(test_data), beds=[],
+                                     ranges={'price_original': (0, 99)}) is test_data
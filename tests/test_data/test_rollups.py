@@ -0,0 +1,42 @@
+import numpy as np
+import pandas as pd
+from src.data.processor import DataProcessor
+from src.data.rollups import Rollups
+
+def make_listings(rows=2_000):
+    rng = np.random.default_rng(3)
+    rating = rng.uniform(4, 5, rows).round(2)
+    rating[::17] = np.nan
+    return DataProcessor.prepare(pd.DataFrame({
+        'rating': rating,
+        'reviews': rng.integers(0, 200, rows),
+        'guests': rng.integers(1, 8, rows),
+        'bedrooms': rng.choice(['1', '2', '3'], rows),
+        'beds': rng.choice(['1', '2', 'No disponible'], rows),
+        'baths': rng.choice([1.0, 1.5, 2.0], rows),
+        'years_hosting': rng.integers(0, 12, rows),
+        'price_original': rng.integers(10, 300, rows),
+        'crawled_at': rng.choice(['2024-01-01', '2024-02-01'], rows)
+    }))
+
+def test_rollup_query_matches_raw_groupby():
+    test_data = make_listings()
+    rollups = Rollups(test_data)
+    assert set(rollups.names()) == {'years_hosting', 'capacity', 'price_range', 'crawl_date'}
+
+    result = rollups.query('years_hosting', baths=[1.0, 2.0], beds='1')
+    subset = test_data[test_data['baths'].isin([1.0, 2.0]) & (test_data['beds'] == '1')]
+    expected = subset.groupby('years_hosting')['rating'].agg(['mean', 'count', 'std']).reset_index()
+
+    np.testing.assert_array_equal(result['years_hosting'], expected['years_hosting'])
+    np.testing.assert_allclose(result['rating_mean'], expected['mean'])
+    np.testing.assert_array_equal(result['rating_count'], expected['count'])
+    np.testing.assert_allclose(result['rating_std'], expected['std'])
+
+def test_rollup_by_crawl_date_without_filters():
+    test_data = make_listings()
+    result = Rollups(test_data).query('crawl_date')
+    expected = test_data.groupby('crawled_at')['price_original'].mean()
+
+    np.testing.assert_allclose(result['price_original_mean'], expected.to_numpy())
+    assert result['price_original_count'].sum() == len(test_data)
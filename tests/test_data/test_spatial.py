@@ -0,0 +1,24 @@
+import numpy as np
+from src.data.spatial import GridIndex, cluster_points
+
+def test_grid_query_matches_bounding_box_scan():
+    rng = np.random.default_rng(0)
+    lat = rng.uniform(-34.65, -34.55, 20_000)
+    lng = rng.uniform(-58.45, -58.35, 20_000)
+    lat[:10] = np.nan
+
+    index = GridIndex(lat, lng, cell_size=0.003)
+    positions = index.query(-34.61, -58.41, -34.59, -58.38)
+
+    expected = np.flatnonzero((lat >= -34.61) & (lat <= -34.59) & (lng >= -58.41) & (lng <= -58.38))
+    assert np.array_equal(positions, expected)
+
+def test_cluster_points_aggregates_counts_and_prices():
+    lat = np.array([0.1, 0.1, 0.9])
+    lng = np.array([0.1, 0.1, 0.9])
+    price = np.array([10.0, 30.0, 50.0])
+
+    clusters = cluster_points(lat, lng, price, (0, 0, 1, 1), grid=2)
+
+    assert list(clusters['count']) == [2, 1]
+    assert list(clusters['price_mean']) == [20.0, 50.0]
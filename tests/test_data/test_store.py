@@ -0,0 +1,32 @@
+import pandas as pd
+from src.data.loader import DataLoader
+from src.data.store import DataStore
+
+def write_csv(path, prices):
+    pd.DataFrame({
+        'reviews': [10] * len(prices),
+        'years_hosting': [2] * len(prices),
+        'price_original': prices,
+        'baths': [1.0] * len(prices),
+        'bedrooms': ['1'] * len(prices),
+        'beds': ['1'] * len(prices)
+    }).to_csv(path, index=False)
+
+def test_reload_swaps_snapshot_when_csv_changes(tmp_path):
+    csv_path = tmp_path / 'data.csv'
+    write_csv(csv_path, [10, 20, 30, 40, 50])
+    store = DataStore('data.csv', loader=DataLoader(tmp_path))
+    reloads = []
+    store.on_reload(reloads.append)
+
+    assert store.load()
+    first = store.snapshot
+    assert not store.reload_if_changed()
+
+    write_csv(csv_path, [10, 20, 30, 40, 50, 60])
+
+    assert store.reload_if_changed()
+    assert store.snapshot is not first
+    assert len(store.df) == 6
+    assert 'price_range' in store.df.columns
+    assert reloads == [first, store.snapshot]
@@ -0,0 +1,54 @@
+import tracemalloc
+import numpy as np
+import pandas as pd
+import pytest
+from src.data.loader import DataLoader
+from src.data.processor import DataProcessor
+from src.data.streaming import StreamingAggregates
+from src.data.synthetic import generate_listings, write_csv
+
+@pytest.fixture(scope="module")
+def csv_dir(tmp_path_factory):
+    data_dir = tmp_path_factory.mktemp("data")
+    write_csv(generate_listings(60_000, snapshots=2, chunk_rows=20_000), data_dir / "airbnb_data.csv")
+    return data_dir
+
+def test_streaming_aggregates_match_in_memory(csv_dir):
+    loader = DataLoader(csv_dir)
+    filters = {"baths": [1.0, 1.5]}
+    chunks = loader.iter_csv_chunks("airbnb_data.csv", columns=StreamingAggregates.columns(**filters),
+                                    chunksize=7_000)
+    aggregates = StreamingAggregates.from_chunks(chunks, ranges={"price_original": (15, 40)}, **filters)
+
+    df = DataProcessor.calculate_reviews_per_year(pd.read_csv(csv_dir / "airbnb_data.csv"))
+    df = DataProcessor.filter_data(df, ranges={"price_original": (15, 40)}, **filters)
+    expected = DataProcessor.calculate_stats(df)
+    stats = aggregates.stats()
+    assert stats.pop("count") == expected.pop("count")
+    assert stats == pytest.approx(expected, rel=1e-6)
+
+    by_years = aggregates.years_hosting()
+    grouped = df.groupby("years_hosting")["reviews_per_year"].agg(["mean", "count", "std"])
+    assert by_years["reviews_per_year_count"].tolist() == grouped["count"].tolist()
+    assert np.allclose(by_years["reviews_per_year_mean"], grouped["mean"])
+    assert np.allclose(by_years["reviews_per_year_std"], grouped["std"], equal_nan=True)
+    assert aggregates.histograms["rating"].counts.sum() == len(df)
+
+def test_streaming_peak_memory_is_bounded_by_chunk_size(csv_dir):
+    loader = DataLoader(csv_dir)
+
+    tracemalloc.start()
+    try:
+        pd.read_csv(csv_dir / "airbnb_data.csv")
+        _, full_peak = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        chunks = loader.iter_csv_chunks("airbnb_data.csv", columns=StreamingAggregates.columns(),
+                                        chunksize=2_000)
+        StreamingAggregates.from_chunks(chunks)
+        _, streaming_peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    # La carga completa crece con el archivo; la lectura por bloques, con el bloque
+    assert streaming_peak < full_peak / 10
+    assert streaming_peak < 8 * 1024 * 1024
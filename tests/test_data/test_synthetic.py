@@ -0,0 +1,28 @@
+import pandas as pd
+from src.data.loader import DataLoader
+from src.data.processor import DataProcessor
+from src.data.synthetic import MISSING, SCHEMA, generate_listings, synthetic_listings, write_csv
+
+def test_generator_matches_scraper_schema_and_is_deterministic():
+    chunks = list(generate_listings(2_500, seed=1, snapshots=3, chunk_rows=400))
+    df = pd.concat(chunks, ignore_index=True)
+
+    assert list(df.columns) == SCHEMA
+    assert len(df) == 2_500
+    assert all(len(chunk) <= 400 for chunk in chunks)
+    assert df['id'].tolist() == list(range(1, 2_501))
+    assert df['crawled_at'].nunique() == 3
+    # Los mismos listados reaparecen en cada captura
+    assert df['link'].nunique() == -(-2_500 // 3)
+    assert (df['bedrooms'] == MISSING).any()
+    pd.testing.assert_frame_equal(df, synthetic_listings(2_500, seed=1, snapshots=3, chunk_rows=400))
+
+def test_generated_csv_loads_and_prepares(tmp_path):
+    write_csv(generate_listings(1_000), tmp_path / "airbnb_data.csv")
+    df = DataLoader(tmp_path).load_csv("airbnb_data.csv")
+    prepared = DataProcessor.prepare(df)
+
+    assert len(prepared) == 1_000
+    assert prepared['price_range'].notna().all()
+    assert (df['total'] == df['total_nights'] - df['special_offer']
+            + df['cleaning_fee'] + df['service_fee']).all()
@@ -0,0 +1,14 @@
+from pathlib import Path
+import pytest
+
+yaml = pytest.importorskip("yaml")
+
+RENDER_FILE = Path(__file__).resolve().parents[2] / "render.yaml"
+
+def test_render_yaml_is_valid():
+    config = yaml.safe_load(RENDER_FILE.read_text(encoding="utf-8"))
+
+    service = config["services"][0]
+    env_vars = {item["key"]: item["value"] for item in service["envVars"]}
+    assert set(env_vars) == {"PYTHON_VERSION", "WEB_CONCURRENCY"}
+    assert service["startCommand"].startswith("gunicorn -c gunicorn.conf.py")
@@ -0,0 +1,22 @@
+import pytest
+
+pytest.importorskip("bs4")
+pytest.importorskip("selenium")
+import main
+from src.crawl.jobs import SearchJob
+
+@pytest.mark.parametrize("workers, debug", [(1, True), (3, False)])
+def test_parallel_crawl_skips_shared_debug_dumps(tmp_path, monkeypatch, workers, debug):
+    calls = []
+    monkeypatch.setattr(main, "fetch_airbnb_data",
+                        lambda url: ([f"https://www.airbnb.com/rooms/{i}" for i in range(3)], None))
+    monkeypatch.setattr(main, "scrape_listing",
+                        lambda url, debug=True: calls.append(debug) or {"title": url})
+    monkeypatch.setattr(main.time, "sleep", lambda seconds: None)
+    jobs = [SearchJob(name, query=name, output=str(tmp_path / f"{name}.csv")) for name in ("a", "b")]
+
+    assert main.crawl_jobs(jobs, workers) == 0
+
+    # Con varios navegadores, debug_last_page.html y debug_sections/ se pisarían entre hilos
+    assert calls == [debug] * 6
+    assert (tmp_path / "a.csv").exists() and (tmp_path / "b.csv").exists()
@@ -0,0 +1,73 @@
+from datetime import date
+from urllib.parse import parse_qs, urlsplit
+import pytest
+
+pytest.importorskip("bs4")
+pytest.importorskip("selenium")
+import main
+from src.crawl.price_calendar import stay_windows
+
+SIDEBAR = """<div data-section-id="BOOK_IT_SIDEBAR"><span class="_11jcbg2">${price}</span>
+<div class="_14omvfj">${price} x 3 nights<span class="_1k4xcdh">${total}</span></div>
+<span>{check_in}</span></div>"""
+
+SKELETON = """<div data-section-id="BOOK_IT_SIDEBAR"><span class="_11jcbg2"></span></div>"""
+
+class FakeDriver:
+    """Navegador falso: la sección de precios depende del check-in de la URL actual.
+
+    Después de cada navegación devuelve `skeletons` veces la sección de carga, sin precio.
+    """
+    def __init__(self, in_page=True, skeletons=0):
+        self.in_page = in_page
+        self.skeletons = skeletons
+        self.pending_skeletons = 0
+        self.url = None
+        self.loads = 0
+
+    def get(self, url):
+        self.url = url
+        self.loads += 1
+        self.pending_skeletons = self.skeletons
+
+    def execute_script(self, script, *args):
+        if script == main.PUSH_STATE_JS:
+            if self.in_page:
+                self.url = args[0]
+                self.pending_skeletons = self.skeletons
+            return None
+        if self.pending_skeletons:
+            self.pending_skeletons -= 1
+            return SKELETON
+        check_in = parse_qs(urlsplit(self.url).query)["check_in"][0]
+        price = 20 + int(check_in[-2:])
+        return SIDEBAR.format(price=price, total=price * 3, check_in=check_in)
+
+# WebDriverWait consulta cada 0.5 s: con skeletons hace falta margen para dos consultas más
+@pytest.mark.parametrize("in_page, loads, skeletons, timeout",
+                         [(True, 1, 0, 0.3), (False, 3, 0, 0.3), (True, 1, 2, 1.5)])
+def test_scrape_price_windows_reuses_the_page(in_page, loads, skeletons, timeout):
+    driver = FakeDriver(in_page, skeletons)
+    windows = stay_windows("2025-03-01", count=3)
+
+    prices = main.scrape_price_windows(driver, "https://www.airbnb.com/rooms/1?adults=2", windows,
+                                       timeout=timeout)
+
+    assert [row["price_original"] for row in prices] == ["21", "28", "35"]
+    assert [row["total_nights"] for row in prices] == ["63", "84", "105"]
+    # Los cargos que no aparecen quedan en None, no en "0"
+    assert prices[0]["cleaning_fee"] is None
+    assert driver.loads == loads
+
+def test_price_section_ready_skips_skeleton_and_stale_prices():
+    checkin, checkout = date(2025, 3, 8), date(2025, 3, 11)
+    previous = SIDEBAR.format(price=21, total=63, check_in="2025-03-01")
+
+    assert not main.price_section_ready(SKELETON, previous, checkin, checkout)
+    assert not main.price_section_ready(previous, previous, checkin, checkout)
+    # Mismo precio, sin las fechas nuevas: todavía es la sección anterior
+    assert not main.price_section_ready(previous.replace("x 3", "x  3"), previous, checkin, checkout)
+    assert main.price_section_ready(SIDEBAR.format(price=28, total=84, check_in="2025-03-08"),
+                                    previous, checkin, checkout)
+    same_price = SIDEBAR.format(price=21, total=63, check_in="2025-03-08") + "3/11/2025"
+    assert main.price_section_ready(same_price, previous, checkin, checkout)
@@ -0,0 +1,35 @@
+import shutil
+from pathlib import Path
+import pandas as pd
+import pytest
+
+pytest.importorskip("bs4")
+pytest.importorskip("selenium")
+import main
+
+FIXTURE = Path(__file__).resolve().parents[2] / "debug_sections" / "full_page.html"
+
+def test_archive_page_uses_room_id_and_crawl_date(tmp_path):
+    path = main.archive_page("https://www.airbnb.com/rooms/123?adults=2", "<html></html>", tmp_path)
+    assert path.name == "123.html"
+    assert path.parent.parent == tmp_path
+    # La re-extracción conserva la URL del crawl, con su query
+    assert main.archived_url(path) == "https://www.airbnb.com/rooms/123?adults=2"
+    path.with_suffix(".url").unlink()
+    assert main.archived_url(path) == "https://www.airbnb.com/rooms/123"
+    assert main.archive_page("https://www.airbnb.com/s/homes", "<html></html>", tmp_path) is None
+
+def test_reextract_archive_isolates_broken_pages(tmp_path):
+    crawl_dir = tmp_path / "archive" / "2025-01-16"
+    crawl_dir.mkdir(parents=True)
+    for room_id in ("111", "222"):
+        shutil.copy(FIXTURE, crawl_dir / f"{room_id}.html")
+    (crawl_dir / "333.html").write_bytes(b"\xff\xfe no es utf-8")
+    output = tmp_path / "airbnb_data.csv"
+
+    assert main.reextract_archive(tmp_path / "archive", workers=2, filename=output)
+
+    df = pd.read_csv(output)
+    assert sorted(df['link'].str.extract(r'rooms/(\d+)')[0]) == ["111", "222"]
+    assert (df['crawled_at'] == "2025-01-16").all()
+    assert (df['price_original'] == 26).all()
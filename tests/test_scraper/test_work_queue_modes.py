@@ -0,0 +1,66 @@
+import threading
+import time
+import pytest
+
+pytest.importorskip("bs4")
+pytest.importorskip("selenium")
+import main
+from src.crawl.work_queue import WorkQueue
+
+def test_worker_waits_for_expired_leases_until_queue_is_sealed(tmp_path, monkeypatch):
+    monkeypatch.setattr(main, "scrape_listing", lambda url, debug=True: {"title": url})
+    path = tmp_path / "queue.db"
+    queue = WorkQueue(path, lease_seconds=0.2)
+    queue.put_many([("1", "https://www.airbnb.com/rooms/1"), ("2", "https://www.airbnb.com/rooms/2")])
+    # Un worker que tomó el listado 1 y murió
+    assert queue.lease("muerto") == ("1", "https://www.airbnb.com/rooms/1")
+
+    worker = threading.Thread(target=main.run_worker, args=(path, "vivo"),
+                              kwargs={"poll_interval": 0.01, "lease_seconds": 0.2, "pause": 0})
+    worker.start()
+    # Sin seal el worker no termina aunque no haya tareas disponibles
+    time.sleep(0.1)
+    assert worker.is_alive()
+    queue.seal()
+    worker.join(timeout=5)
+
+    assert not worker.is_alive()
+    assert [row["title"] for row in queue.results()] == ["https://www.airbnb.com/rooms/1",
+                                                          "https://www.airbnb.com/rooms/2"]
+    queue.close()
+
+def test_coordinator_gives_up_when_workers_stall(tmp_path, monkeypatch):
+    monkeypatch.setattr(main, "fetch_airbnb_data",
+                        lambda url: (["https://www.airbnb.com/rooms/1"], None))
+    path = tmp_path / "queue.db"
+    output = tmp_path / "airbnb_data.csv"
+
+    started = time.monotonic()
+    # Sin workers: no hay progreso y el coordinador tiene que terminar igual
+    assert main.coordinate(["https://www.airbnb.com/s/homes"], path, output,
+                           poll_interval=0.01, stall_timeout=0.1) is False
+    assert time.monotonic() - started < 5
+
+    queue = WorkQueue(path)
+    assert queue.sealed() and queue.unfinished() == 1
+    queue.close()
+
+def test_coordinator_starts_a_new_run_unless_resuming(tmp_path, monkeypatch):
+    monkeypatch.setattr(main, "fetch_airbnb_data",
+                        lambda url: (["https://www.airbnb.com/rooms/1"], None))
+    path = tmp_path / "queue.db"
+    output = tmp_path / "airbnb_data.csv"
+    queue = WorkQueue(path)
+    queue.put("1", "https://www.airbnb.com/rooms/1")
+    queue.complete("1", "viejo", {"title": "corrida anterior"})
+    queue.seal()
+
+    # Con resume se reusa el resultado guardado
+    assert main.coordinate(["https://www.airbnb.com/s/homes"], path, output, resume=True)
+    assert queue.results() == [{"title": "corrida anterior"}]
+
+    # Por defecto el listado se vuelve a encolar y el resultado viejo se descarta
+    main.coordinate(["https://www.airbnb.com/s/homes"], path, output,
+                    poll_interval=0.01, stall_timeout=0.1)
+    assert queue.results() == [] and queue.unfinished() == 1
+    queue.close()
@@ -0,0 +1,24 @@
+import json
+import logging
+from src.utils.log import DeferredQueueHandler, setup_logging
+
+def test_queued_logging_writes_structured_fields(tmp_path):
+    log_file = tmp_path / "scraper.log"
+    listener = setup_logging("INFO", log_file=str(log_file), as_json=True)
+    logger = logging.getLogger("scraper.test")
+    try:
+        logger.debug("Información de rating", extra={"fields": {"rating": "5.0"}})
+        logger.info("Página procesada", extra={"fields": {"nuevas_urls": 18}})
+    finally:
+        listener.stop()
+        for handler in list(logging.getLogger().handlers):
+            if isinstance(handler, DeferredQueueHandler):
+                logging.getLogger().removeHandler(handler)
+        for handler in listener.handlers:
+            handler.close()
+
+    entries = [json.loads(line) for line in log_file.read_text(encoding="utf-8").splitlines()]
+    # En nivel INFO el detalle por campo no llega a la salida
+    assert [entry["message"] for entry in entries] == ["Página procesada"]
+    assert entries[0]["nuevas_urls"] == 18
+    assert entries[0]["level"] == "INFO"
@@ -0,0 +1,26 @@
+from src.utils.metrics import Histogram, MetricsRegistry
+
+def test_histogram_buckets_and_quantiles():
+    histogram = Histogram(buckets=(1, 2, 4))
+    for value in (0.5, 1.5, 1.5, 3, 10):
+        histogram.observe(value)
+
+    assert histogram.cumulative() == [1, 3, 4, 5]
+    assert histogram.sum == 16.5
+    assert 1 <= histogram.quantile(0.5) <= 2
+    assert histogram.quantile(1.0) == 10
+
+def test_prometheus_export_includes_spans_and_counters(tmp_path):
+    registry = MetricsRegistry(prefix="crawler", buckets=(0.1, 1))
+    with registry.span("parse", phase="listing"):
+        pass
+    registry.inc("listings_total", status="ok")
+    path = tmp_path / "metrics.prom"
+    registry.write(path)
+
+    text = path.read_text()
+    assert '# TYPE crawler_stage_seconds histogram' in text
+    assert 'crawler_stage_seconds_bucket{phase="listing",stage="parse",le="+Inf"} 1' in text
+    assert 'crawler_stage_seconds_count{phase="listing",stage="parse"} 1' in text
+    assert 'crawler_listings_total{status="ok"} 1' in text
+    assert "parse (listing)" in registry.summary()